@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+Benchmark synth time of LambdaFunctions over large code directories, with and
+without the AssetFingerprintCache.
+
+Each run synthesizes a stack with N functions, each over its own generated
+directory, into a fresh cloud assembly in a separate process:
+
+- baseline: plain Code.from_asset (full hash and copy every synth)
+- cold:     asset cache enabled with an empty cache directory
+- warm:     asset cache enabled with the cache from the cold run
+
+Usage:
+    python benchmarks/asset_cache_benchmark.py --functions 10 --files 500 --file-size 65536
+"""
+import argparse
+import filecmp
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+LIBRARY_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def generate_code_dirs(root, functions, files, file_size):
+    """Create one handler directory per function, padded with vendored files"""
+    paths = []
+    for index in range(functions):
+        path = os.path.join(root, f"function{index}")
+        vendor = os.path.join(path, "vendor")
+        os.makedirs(vendor)
+        with open(os.path.join(path, "index.py"), "w") as fp:
+            fp.write("def handler(event, context):\n    return {'function': %d}\n" % index)
+        for number in range(files):
+            with open(os.path.join(vendor, f"module{number}.bin"), "wb") as fp:
+                fp.write(os.urandom(file_size))
+        paths.append(path)
+    return paths
+
+
+def synth(outdir, code_paths, cache_dir=None):
+    """
+    Synthesize the benchmark stack in this process.
+
+    Returns the time spent building the stack (where assets are hashed and
+    staged) and the total time including app.synth().
+    """
+    sys.path.insert(0, LIBRARY_ROOT)
+    from aws_cdk import App, Stack
+    from zacks_cdk_lib.compute import AssetFingerprintCache, LambdaFunction
+
+    start = time.perf_counter()
+    app = App(outdir=outdir)
+    stack = Stack(app, "AssetCacheBenchmark")
+    cache = AssetFingerprintCache(cache_dir) if cache_dir else None
+    for index, code_path in enumerate(code_paths):
+        LambdaFunction(stack, f"Function{index}", code_path=code_path, asset_cache=cache)
+    staged = time.perf_counter() - start
+    app.synth()
+    return staged, time.perf_counter() - start
+
+
+def run(mode, workdir, code_paths, cache_dir):
+    """Run one synth in a fresh process and fresh cloud assembly"""
+    outdir = os.path.join(workdir, f"cdk.out.{mode}")
+    shutil.rmtree(outdir, ignore_errors=True)
+    command = [sys.executable, __file__, "--child", outdir, "--cache-dir", cache_dir or ""]
+    start = time.perf_counter()
+    output = subprocess.run(
+        command + code_paths,
+        check=True,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        text=True,
+    ).stdout
+    wall = time.perf_counter() - start
+    staged, total = output.strip().splitlines()[-1].split()
+    return outdir, float(staged), float(total), wall
+
+
+def staged_trees(outdir):
+    return sorted(name for name in os.listdir(outdir) if name.startswith("asset."))
+
+
+def same_tree(left, right):
+    """Compare two directory trees file by file"""
+    comparison = filecmp.dircmp(left, right)
+    if comparison.left_only or comparison.right_only:
+        return False
+    _, mismatch, errors = filecmp.cmpfiles(left, right, comparison.common_files, shallow=False)
+    if mismatch or errors:
+        return False
+    return all(
+        same_tree(os.path.join(left, name), os.path.join(right, name))
+        for name in comparison.common_dirs
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--functions", type=int, default=10)
+    parser.add_argument("--files", type=int, default=500)
+    parser.add_argument("--file-size", type=int, default=64 * 1024)
+    parser.add_argument("--child", metavar="OUTDIR", help=argparse.SUPPRESS)
+    parser.add_argument("--cache-dir", help=argparse.SUPPRESS)
+    args, code_paths = parser.parse_known_args()
+
+    if args.child:
+        print(*synth(args.child, code_paths, args.cache_dir or None))
+        return
+
+    workdir = tempfile.mkdtemp(prefix="asset-cache-benchmark-")
+    try:
+        code_paths = generate_code_dirs(
+            os.path.join(workdir, "code"), args.functions, args.files, args.file_size
+        )
+        total_mb = args.functions * args.files * args.file_size / (1024 * 1024)
+        print(f"{args.functions} functions, {args.files} files each, {total_mb:.0f} MiB total")
+
+        cache_dir = os.path.join(workdir, "cache")
+        results = {}
+        for mode, mode_cache in (("baseline", None), ("cold", cache_dir), ("warm", cache_dir)):
+            results[mode] = run(mode, workdir, code_paths, mode_cache)
+            _, staged, total, wall = results[mode]
+            print(
+                f"{mode:>8}: assets {staged:7.2f}s  synth {total:7.2f}s  process {wall:7.2f}s"
+            )
+
+        # The cached assets must contain exactly the files a plain synth stages
+        baseline_assets = staged_trees(results["baseline"][0])
+        warm_assets = staged_trees(results["warm"][0])
+        identical = len(baseline_assets) == len(warm_assets) and all(
+            any(
+                same_tree(
+                    os.path.join(results["baseline"][0], baseline),
+                    os.path.join(results["warm"][0], warm),
+                )
+                for warm in warm_assets
+            )
+            for baseline in baseline_assets
+        )
+        print(f"staged output identical to baseline: {identical}")
+        if not identical:
+            sys.exit(1)
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
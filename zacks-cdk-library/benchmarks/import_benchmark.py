@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Benchmark import time of the zacks_cdk_lib entry points.
+
+Subpackages resolve their constructs lazily, so each entry point is imported
+three ways, each in a fresh process:
+
+- package:   import zacks_cdk_lib.<subpackage> (nothing loaded yet)
+- construct: from zacks_cdk_lib.<subpackage> import <Construct>
+- eager:     from zacks_cdk_lib.<subpackage> import * (every construct, which
+             is what importing the subpackage used to cost)
+
+The savings column is eager minus construct: what an app using a single
+construct no longer pays. The number of aws_cdk modules loaded shows where the
+time goes.
+
+Usage:
+    python benchmarks/import_benchmark.py --repeat 5
+"""
+import argparse
+import os
+import subprocess
+import sys
+
+LIBRARY_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Entry point -> construct imported on its own
+ENTRY_POINTS = {
+    "zacks_cdk_lib.storage": "SecureS3Bucket",
+    "zacks_cdk_lib.networking": "StandardVpc",
+    "zacks_cdk_lib.security": "CommonSecurityGroups",
+    "zacks_cdk_lib.database": "EnhancedDynamoTable",
+    "zacks_cdk_lib.compute": "LambdaFunction",
+    "zacks_cdk_lib.patterns": "QueueProcessor",
+}
+
+CHILD = """
+import sys, time
+start = time.perf_counter()
+{statement}
+elapsed = time.perf_counter() - start
+print(elapsed, sum(1 for name in sys.modules if name.startswith("aws_cdk")))
+"""
+
+
+def run(statement):
+    """Import time and loaded aws_cdk module count of a statement in a fresh process"""
+    output = subprocess.run(
+        [sys.executable, "-c", CHILD.format(statement=statement)],
+        check=True,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        text=True,
+        cwd=LIBRARY_ROOT,
+    ).stdout
+    seconds, modules = output.strip().splitlines()[-1].split()
+    return float(seconds), int(modules)
+
+
+def measure(statement, repeat):
+    """Best time over repeated runs"""
+    runs = [run(statement) for _ in range(repeat)]
+    return min(seconds for seconds, _ in runs), runs[0][1]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per import")
+    args = parser.parse_args()
+
+    # Everything imports aws_cdk itself; show it so the deltas can be read against it
+    base, base_modules = measure("import aws_cdk", args.repeat)
+    print(f"{'aws_cdk':<26} {base:6.2f}s  ({base_modules} aws_cdk modules)")
+    print(
+        f"{'entry point':<26} {'package':>8} {'construct':>10} {'eager':>8} {'savings':>8}  "
+        f"aws_cdk modules (construct/eager)"
+    )
+    for package, construct in ENTRY_POINTS.items():
+        package_time, _ = measure(f"import {package}", args.repeat)
+        construct_time, construct_modules = measure(
+            f"from {package} import {construct}", args.repeat
+        )
+        eager_time, eager_modules = measure(f"from {package} import *", args.repeat)
+        print(
+            f"{package:<26} {package_time:7.2f}s {construct_time:9.2f}s {eager_time:7.2f}s "
+            f"{eager_time - construct_time:7.2f}s  {construct_modules}/{eager_modules}"
+            f"  ({construct})"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,278 @@
+#!/usr/bin/env python3
+"""
+Benchmark synth time, peak memory and template size of the library constructs.
+
+Each case synthesizes one stack in a fresh process, so every run pays the same
+jsii startup and no case warms the kernel for the next:
+
+- vpc:     N x StandardVpc
+- lambda:  N x LambdaFunction
+- api:     N x ServerlessApi
+- example: the full example_usage.py stack
+
+Per case it records the time to build and synthesize the stack (imports
+excluded), peak RSS of the Python process plus the jsii node process, and the
+size and resource count of the template. Results are compared against a JSON
+baseline and the run fails when a metric regresses past its tolerance.
+
+Usage:
+    python benchmarks/synth_benchmark.py --count 5
+    python benchmarks/synth_benchmark.py --count 5 --save-baseline
+    python benchmarks/synth_benchmark.py --cases vpc api --time-tolerance 0.5
+"""
+import argparse
+import importlib
+import json
+import os
+import resource
+import runpy
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+LIBRARY_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_BASELINE = os.path.join(LIBRARY_ROOT, "benchmarks", "baselines", "synth.json")
+
+# Case -> (module, construct) for the N x construct cases
+CONSTRUCT_CASES = {
+    "vpc": ("zacks_cdk_lib.networking", "StandardVpc"),
+    "lambda": ("zacks_cdk_lib.compute", "LambdaFunction"),
+    "api": ("zacks_cdk_lib.patterns", "ServerlessApi"),
+}
+CASES = tuple(CONSTRUCT_CASES) + ("example",)
+
+# Metric name -> (unit, tolerance flag)
+METRICS = {
+    "synth_seconds": ("s", "time_tolerance"),
+    "peak_rss_mb": ("MiB", "rss_tolerance"),
+    "template_bytes": ("B", "template_tolerance"),
+}
+
+
+def write_code_dir(root):
+    """A minimal handler directory for LambdaFunction and ServerlessApi"""
+    path = os.path.join(root, "code")
+    os.makedirs(path, exist_ok=True)
+    with open(os.path.join(path, "index.py"), "w") as fp:
+        fp.write("def handler(event, context):\n    return {'statusCode': 200}\n")
+    return path
+
+
+def write_example_dirs(root):
+    """The ./lambda, ./api and ./website directories example_usage.py points at"""
+    for name, filename, body in (
+        ("lambda", "index.py", "def handler(event, context):\n    return {}\n"),
+        ("api", "app.py", "def handler(event, context):\n    return {'statusCode': 200}\n"),
+        ("website", "index.html", "<html><body>Benchmark</body></html>\n"),
+    ):
+        os.makedirs(os.path.join(root, name), exist_ok=True)
+        with open(os.path.join(root, name, filename), "w") as fp:
+            fp.write(body)
+
+
+def node_peak_rss_kb():
+    """Peak RSS of this process's children (the jsii node kernel), Linux only"""
+    total = 0
+    pid = str(os.getpid())
+    for entry in os.listdir("/proc") if os.path.isdir("/proc") else []:
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f"/proc/{entry}/stat") as fp:
+                parent = fp.read().rsplit(")", 1)[1].split()[1]
+            if parent != pid:
+                continue
+            with open(f"/proc/{entry}/status") as fp:
+                for line in fp:
+                    if line.startswith("VmHWM:"):
+                        total += int(line.split()[1])
+        except (OSError, IndexError, ValueError):
+            continue
+    return total
+
+
+def stack_builder(case, workdir):
+    """
+    Import the construct of a case and return a function building its app.
+
+    Imports happen here so the timed build measures constructs, not jsii loading.
+    """
+    from aws_cdk import App, Environment, Stack
+
+    module, name = CONSTRUCT_CASES[case]
+    construct = getattr(importlib.import_module(module), name)
+    code_path = write_code_dir(workdir)
+    props = {
+        "vpc": lambda index: {"cidr": f"10.{index % 256}.0.0/16", "max_azs": 2},
+        "lambda": lambda index: {"code_path": code_path},
+        "api": lambda index: {"lambda_code_path": code_path},
+    }[case]
+
+    def build(count):
+        app = App(outdir=os.path.join(workdir, "cdk.out"))
+        stack = Stack(
+            app,
+            "SynthBenchmark",
+            env=Environment(account="123456789012", region="us-east-1"),
+        )
+        for index in range(count):
+            construct(stack, f"{name}{index}", **props(index))
+        return app
+
+    return build
+
+
+def child(case, count, workdir):
+    """Run one case and print its metrics as JSON"""
+    sys.path.insert(0, LIBRARY_ROOT)
+    if case == "example":
+        # example_usage.py builds and synthesizes its own app with relative paths
+        write_example_dirs(workdir)
+        os.chdir(workdir)
+        os.environ["CDK_OUTDIR"] = os.path.join(workdir, "cdk.out")
+        for module in ("aws_cdk", "zacks_cdk_lib.compute", "zacks_cdk_lib.database",
+                       "zacks_cdk_lib.networking", "zacks_cdk_lib.patterns",
+                       "zacks_cdk_lib.security", "zacks_cdk_lib.storage"):
+            importlib.import_module(module)
+
+        start = time.perf_counter()
+        runpy.run_path(os.path.join(LIBRARY_ROOT, "example_usage.py"), run_name="__main__")
+    else:
+        build = stack_builder(case, workdir)
+
+        start = time.perf_counter()
+        build(count).synth()
+    synth_seconds = time.perf_counter() - start
+
+    outdir = os.path.join(workdir, "cdk.out")
+    template_bytes = 0
+    resources = 0
+    for name in os.listdir(outdir):
+        if name.endswith(".template.json"):
+            path = os.path.join(outdir, name)
+            template_bytes += os.path.getsize(path)
+            with open(path) as fp:
+                resources += len(json.load(fp).get("Resources", {}))
+
+    rss_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss + node_peak_rss_kb()
+    print(json.dumps({
+        "synth_seconds": synth_seconds,
+        "peak_rss_mb": rss_kb / 1024,
+        "template_bytes": template_bytes,
+        "resources": resources,
+    }))
+
+
+def run(case, count):
+    """Run one case in a fresh process and fresh cloud assembly"""
+    workdir = tempfile.mkdtemp(prefix=f"synth-benchmark-{case}-")
+    try:
+        output = subprocess.run(
+            [
+                sys.executable, __file__,
+                "--child", case,
+                "--count", str(count),
+                "--workdir", workdir,
+            ],
+            check=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            env={**os.environ, "PYTHONPATH": os.pathsep.join(
+                filter(None, [LIBRARY_ROOT, os.environ.get("PYTHONPATH")])
+            )},
+        ).stdout
+        return json.loads(output.strip().splitlines()[-1])
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+def measure(case, count, repeat):
+    """Best synth time and worst peak RSS over repeated runs"""
+    runs = [run(case, count) for _ in range(repeat)]
+    result = dict(runs[0])
+    result["count"] = 1 if case == "example" else count
+    result["synth_seconds"] = min(item["synth_seconds"] for item in runs)
+    result["peak_rss_mb"] = max(item["peak_rss_mb"] for item in runs)
+    result["per_construct_seconds"] = result["synth_seconds"] / result["count"]
+    return result
+
+
+def compare(results, baseline, tolerances):
+    """Regressions of results against the baseline, as printable lines"""
+    regressions = []
+    for case, result in results.items():
+        expected = baseline.get(case)
+        if expected is None:
+            continue
+        if expected.get("count") != result["count"]:
+            print(f"{case}: baseline was taken with count {expected.get('count')}, skipping")
+            continue
+        for metric, (unit, flag) in METRICS.items():
+            limit = expected[metric] * (1 + tolerances[flag])
+            if result[metric] > limit:
+                regressions.append(
+                    f"{case}: {metric} {result[metric]:.2f}{unit} exceeds baseline "
+                    f"{expected[metric]:.2f}{unit} by more than {tolerances[flag]:.0%}"
+                )
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--cases", nargs="+", choices=CASES, default=list(CASES))
+    parser.add_argument("--count", type=int, default=5, help="Constructs per stack")
+    parser.add_argument("--repeat", type=int, default=1, help="Runs per case")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE)
+    parser.add_argument("--save-baseline", action="store_true")
+    parser.add_argument("--time-tolerance", type=float, default=0.25)
+    parser.add_argument("--rss-tolerance", type=float, default=0.15)
+    parser.add_argument("--template-tolerance", type=float, default=0.05)
+    parser.add_argument("--child", choices=CASES, help=argparse.SUPPRESS)
+    parser.add_argument("--workdir", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        child(args.child, args.count, args.workdir)
+        return
+
+    results = {}
+    for case in args.cases:
+        results[case] = result = measure(case, args.count, args.repeat)
+        print(
+            f"{case:>8} x{result['count']:<4} synth {result['synth_seconds']:7.2f}s "
+            f"({result['per_construct_seconds']:.3f}s each)  "
+            f"peak RSS {result['peak_rss_mb']:7.1f} MiB  "
+            f"template {result['template_bytes']:>9,} B / {result['resources']} resources"
+        )
+
+    if args.save_baseline:
+        baseline = {}
+        if os.path.exists(args.baseline):
+            with open(args.baseline) as fp:
+                baseline = json.load(fp)
+        baseline.update(results)
+        os.makedirs(os.path.dirname(args.baseline), exist_ok=True)
+        with open(args.baseline, "w") as fp:
+            json.dump(baseline, fp, indent=2, sort_keys=True)
+            fp.write("\n")
+        print(f"baseline written to {args.baseline}")
+        return
+
+    if not os.path.exists(args.baseline):
+        print(f"no baseline at {args.baseline}; run with --save-baseline first")
+        return
+    with open(args.baseline) as fp:
+        baseline = json.load(fp)
+    regressions = compare(results, baseline, vars(args))
+    for line in regressions:
+        print(f"REGRESSION {line}")
+    if regressions:
+        sys.exit(1)
+    print("no regressions against baseline")
+
+
+if __name__ == "__main__":
+    main()
@@ -13,8 +13,8 @@
     package_dir={"": "zacks_cdk_lib"},
     packages=setuptools.find_packages(where="zacks_cdk_lib"),
     install_requires=[
-        "aws-cdk-lib>=2.0.0",
+        "aws-cdk-lib>=2.263.0",
         "constructs>=10.0.0",
     ],
-    python_requires=">=3.6",
+    python_requires=">=3.7",
 )
\ No newline at end of file
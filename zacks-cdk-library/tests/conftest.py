@@ -0,0 +1,52 @@
+import importlib.util
+import os
+import sys
+from unittest import mock
+
+import pytest
+from aws_cdk import App, Environment, Stack
+
+from zacks_cdk_lib.compute.lambda_function import HANDLERS_DIR
+
+
+@pytest.fixture
+def stack():
+    """An empty stack in a fixed account and region"""
+    app = App()
+    return Stack(app, "TestStack", env=Environment(account="123456789012", region="us-east-1"))
+
+
+@pytest.fixture
+def code_path(tmp_path):
+    """A directory with a minimal Lambda handler"""
+    (tmp_path / "index.py").write_text("def handler(event, context):\n    return {}\n")
+    return str(tmp_path)
+
+
+@pytest.fixture
+def load_handler(monkeypatch):
+    """
+    Import a bundled handler with boto3 replaced by a MagicMock.
+
+    Client exception classes are real exceptions so the handlers' except
+    clauses work.
+    """
+    def load(name, **environment):
+        for key, value in environment.items():
+            monkeypatch.setenv(key, value)
+        boto3 = mock.MagicMock()
+        for exception in ("ResourceNotFoundException", "NoSuchKey"):
+            setattr(
+                boto3.client.return_value.exceptions,
+                exception,
+                type(exception, (Exception,), {}),
+            )
+        monkeypatch.setitem(sys.modules, "boto3", boto3)
+        spec = importlib.util.spec_from_file_location(
+            f"{name}_handler", os.path.join(HANDLERS_DIR, name, "index.py")
+        )
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        return module
+
+    return load
@@ -0,0 +1,61 @@
+import os
+
+import pytest
+from aws_cdk.assertions import Template
+
+from zacks_cdk_lib.compute import AssetFingerprintCache, LambdaFunction
+from zacks_cdk_lib.compute import asset_cache
+
+
+@pytest.fixture
+def source(tmp_path):
+    path = tmp_path / "src"
+    path.mkdir()
+    (path / "index.py").write_text("def handler(event, context):\n    return {}\n")
+    (path / "run.sh").write_text("#!/bin/sh\necho hi\n")
+    os.chmod(path / "run.sh", 0o644)
+    return path
+
+
+@pytest.fixture
+def cache_dir(tmp_path):
+    return str(tmp_path / "cache")
+
+
+def fingerprint(cache_dir, source):
+    return AssetFingerprintCache(cache_dir)._fingerprint(str(source))
+
+
+def test_unchanged_directory_reuses_the_cached_digest(source, cache_dir, monkeypatch):
+    digest = fingerprint(cache_dir, source)
+
+    def fail(entries):
+        raise AssertionError("contents were hashed again")
+
+    monkeypatch.setattr(asset_cache, "_content_digest", fail)
+    assert fingerprint(cache_dir, source) == digest
+
+
+def test_content_change_produces_a_new_digest(source, cache_dir):
+    digest = fingerprint(cache_dir, source)
+    (source / "index.py").write_text("def handler(event, context):\n    return {'v': 2}\n")
+    assert fingerprint(cache_dir, source) != digest
+
+
+def test_chmod_produces_a_new_digest(source, cache_dir):
+    digest = fingerprint(cache_dir, source)
+    mtime = os.stat(source / "run.sh").st_mtime_ns
+    os.chmod(source / "run.sh", 0o755)
+    os.utime(source / "run.sh", ns=(mtime, mtime))
+    assert fingerprint(cache_dir, source) != digest
+
+
+def test_function_code_uses_the_cached_asset(stack, source, cache_dir):
+    cache = AssetFingerprintCache(cache_dir)
+    LambdaFunction(stack, "Function", code_path=str(source), asset_cache=cache)
+    template = Template.from_stack(stack)
+
+    digest = cache._fingerprint(str(source))
+    template.has_resource_properties("AWS::Lambda::Function", {
+        "Code": {"S3Key": f"{cache.asset_hash(digest)}.zip"},
+    })
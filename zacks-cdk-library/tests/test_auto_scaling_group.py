@@ -0,0 +1,120 @@
+import pytest
+from aws_cdk import (
+    aws_ec2 as ec2,
+    aws_elasticloadbalancingv2 as elbv2,
+)
+from aws_cdk.assertions import Match, Template
+
+from zacks_cdk_lib.compute import StandardAutoScalingGroup
+from zacks_cdk_lib.networking import StandardVpc
+
+
+def test_warm_pool_and_instance_refresh(stack):
+    vpc = StandardVpc(stack, "Vpc")
+    StandardAutoScalingGroup(
+        stack,
+        "Group",
+        vpc=vpc.vpc,
+        warm_pool_state="hibernated",
+        warm_pool_min_size=2,
+        root_volume={"size": 30},
+    )
+    template = Template.from_stack(stack)
+
+    template.has_resource_properties("AWS::AutoScaling::WarmPool", {
+        "PoolState": "Hibernated",
+        "MinSize": 2,
+        "InstanceReusePolicy": {"ReuseOnScaleIn": True},
+    })
+    template.has_resource_properties("AWS::EC2::LaunchTemplate", {
+        "LaunchTemplateData": Match.object_like({
+            "HibernationOptions": {"Configured": True},
+            "MetadataOptions": {"HttpTokens": "required"},
+        }),
+    })
+    template.has_resource("AWS::AutoScaling::AutoScalingGroup", {
+        "UpdatePolicy": Match.object_like({"AutoScalingInstanceRefresh": {
+            "Strategy": "Rolling",
+            "Preferences": {
+                "MinHealthyPercentage": 90,
+                "InstanceWarmup": 300,
+                "SkipMatching": True,
+            },
+        }}),
+    })
+
+
+@pytest.mark.parametrize("options, message", [
+    ({"warm_pool_state": "warm"}, "warm_pool_state must be one of"),
+    ({"warm_pool_state": "hibernated"}, "encrypted root_volume"),
+    ({"predictive_scaling": "forecast_only"}, "needs target_cpu_utilization"),
+    ({"predictive_scaling": "always", "target_cpu_utilization": 50}, "predictive_scaling must"),
+    ({"target_requests_per_minute": 1000}, "needs a target_group"),
+])
+def test_invalid_options_are_rejected(stack, options, message):
+    vpc = StandardVpc(stack, "Vpc")
+    with pytest.raises(ValueError, match=message):
+        StandardAutoScalingGroup(stack, "Group", vpc=vpc.vpc, **options)
+
+
+def test_predictive_scaling_on_cpu(stack):
+    vpc = StandardVpc(stack, "Vpc")
+    StandardAutoScalingGroup(
+        stack,
+        "Group",
+        vpc=vpc.vpc,
+        target_cpu_utilization=50,
+        predictive_scaling="forecast_and_scale",
+    )
+    template = Template.from_stack(stack)
+
+    template.has_resource_properties("AWS::AutoScaling::ScalingPolicy", {
+        "PolicyType": "TargetTrackingScaling",
+        "TargetTrackingConfiguration": Match.object_like({"TargetValue": 50}),
+    })
+    template.has_resource_properties("AWS::AutoScaling::ScalingPolicy", {
+        "PolicyType": "PredictiveScaling",
+        "PredictiveScalingConfiguration": {
+            "Mode": "ForecastAndScale",
+            "SchedulingBufferTime": 300,
+            "MetricSpecifications": [{
+                "TargetValue": 50,
+                "PredefinedMetricPairSpecification": {
+                    "PredefinedMetricType": "ASGCPUUtilization",
+                },
+            }],
+        },
+    })
+
+
+def test_predictive_scaling_on_request_count(stack):
+    vpc = StandardVpc(stack, "Vpc")
+    load_balancer = elbv2.ApplicationLoadBalancer(stack, "LoadBalancer", vpc=vpc.vpc)
+    listener = load_balancer.add_listener("Listener", port=80)
+    target_group = elbv2.ApplicationTargetGroup(
+        stack, "Targets", vpc=vpc.vpc, port=80, target_type=elbv2.TargetType.INSTANCE
+    )
+    listener.add_target_groups("Default", target_groups=[target_group])
+    StandardAutoScalingGroup(
+        stack,
+        "Group",
+        vpc=vpc.vpc,
+        instance_type=ec2.InstanceType("c6i.large"),
+        target_group=target_group,
+        target_requests_per_minute=1000,
+        predictive_scaling="forecast_only",
+    )
+    template = Template.from_stack(stack)
+
+    template.has_resource_properties("AWS::AutoScaling::ScalingPolicy", {
+        "PolicyType": "PredictiveScaling",
+        "PredictiveScalingConfiguration": Match.object_like({
+            "Mode": "ForecastOnly",
+            "MetricSpecifications": [Match.object_like({
+                "PredefinedMetricPairSpecification": {
+                    "PredefinedMetricType": "ALBRequestCount",
+                    "ResourceLabel": Match.any_value(),
+                },
+            })],
+        }),
+    })
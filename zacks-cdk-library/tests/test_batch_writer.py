@@ -0,0 +1,104 @@
+import json
+
+import pytest
+
+from zacks_cdk_lib.database import EnhancedDynamoTable
+
+SHARDED = {
+    "TABLE_NAME": "Items",
+    "PARTITION_KEY": "pk",
+    "SORT_KEY": "sk",
+    "SORT_KEY_TYPE": "N",
+    "SHARD_COUNT": "8",
+    "SHARD_SEPARATOR": "#",
+    "SHARD_ATTRIBUTE": "shard",
+}
+
+
+def record(message_id, body, method="POST", **path):
+    attributes = {"method": method, **path}
+    return {
+        "messageId": message_id,
+        "body": json.dumps(body),
+        "messageAttributes": {
+            name: {"stringValue": value, "dataType": "String"}
+            for name, value in attributes.items()
+        },
+    }
+
+
+@pytest.fixture
+def writer(load_handler):
+    module = load_handler("batch_writer", **SHARDED)
+    module.time.sleep = lambda seconds: None
+    module.table.meta.client.batch_write_item.return_value = {"UnprocessedItems": {}}
+    return module
+
+
+def written(writer):
+    call = writer.table.meta.client.batch_write_item.call_args_list[0]
+    return call.kwargs["RequestItems"]["Items"]
+
+
+def test_items_land_on_the_shard_readers_compute(writer):
+    writer.handler({"Records": [
+        record("1", {"pk": "tenant", "sk": 10, "name": "a"}),
+        record("2", {}, method="DELETE", pk="tenant", sk="10.0"),
+    ]}, None)
+
+    # The delete replaces the put of the same item and hits exactly its shard
+    number = EnhancedDynamoTable.write_shard(8, "tenant", 10)
+    assert written(writer) == [
+        {"DeleteRequest": {"Key": {"pk": f"tenant#{number}", "sk": 10}}},
+    ]
+
+
+def test_shards_are_deterministic_and_spread_a_hot_key(writer):
+    numbers = {writer.shard_number({"pk": "tenant", "sk": sk}) for sk in range(200)}
+    assert numbers == set(range(8))
+    assert writer.shard_number({"pk": "tenant", "sk": 7}) == EnhancedDynamoTable.write_shard(
+        8, "tenant", 7
+    )
+
+
+def test_only_unprocessed_records_are_reported(writer):
+    client = writer.table.meta.client
+    stuck = {"PutRequest": {"Item": {
+        "pk": f"b#{writer.shard_number({'pk': 'b', 'sk': 1})}",
+        "sk": 1,
+        "shard": 0,
+    }}}
+    client.batch_write_item.return_value = {"UnprocessedItems": {"Items": [stuck]}}
+
+    response = writer.handler({"Records": [
+        record("1", {"pk": "a", "sk": 1}),
+        record("2", {"pk": "b", "sk": 1}),
+        record("3", {"sk": 1}),
+    ]}, None)
+
+    assert response == {"batchItemFailures": [{"itemIdentifier": "3"}, {"itemIdentifier": "2"}]}
+    assert client.batch_write_item.call_count == writer.MAX_ATTEMPTS
+
+
+def test_a_rejected_batch_is_retried_item_by_item(writer):
+    writer.table.meta.client.batch_write_item.side_effect = Exception("ValidationException")
+    writer.table.put_item.side_effect = [None, Exception("Item size has exceeded the maximum")]
+
+    response = writer.handler({"Records": [
+        record("1", {"pk": "a", "sk": 1}),
+        record("2", {"pk": "b", "sk": 1, "blob": "x"}),
+    ]}, None)
+
+    assert response == {"batchItemFailures": [{"itemIdentifier": "2"}]}
+
+
+def test_batches_are_split_into_25_requests(writer):
+    writer.handler({"Records": [
+        record(str(number), {"pk": "a", "sk": number}) for number in range(60)
+    ]}, None)
+
+    sizes = [
+        len(call.kwargs["RequestItems"]["Items"])
+        for call in writer.table.meta.client.batch_write_item.call_args_list
+    ]
+    assert sizes == [25, 25, 10]
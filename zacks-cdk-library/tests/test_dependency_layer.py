@@ -0,0 +1,59 @@
+import pytest
+from aws_cdk import App, Stack, aws_lambda as _lambda
+from aws_cdk.assertions import Template
+
+from zacks_cdk_lib.compute import DependencyLayer, LambdaFunction
+
+
+@pytest.fixture
+def stack():
+    """A stack that skips bundling, so no pip install runs during the tests"""
+    app = App(context={"aws:cdk:bundling-stacks": []})
+    return Stack(app, "TestStack")
+
+
+@pytest.fixture
+def requirements(tmp_path):
+    path = tmp_path / "requirements.txt"
+    path.write_text("requests==2.31.0\n")
+    return str(path)
+
+
+def test_functions_with_the_same_requirements_share_one_layer(stack, code_path, requirements):
+    first = LambdaFunction(stack, "First", code_path=code_path, requirements_path=requirements)
+    second = LambdaFunction(stack, "Second", code_path=code_path, requirements_path=requirements)
+    template = Template.from_stack(stack)
+
+    assert first.dependency_layer is second.dependency_layer
+    template.resource_count_is("AWS::Lambda::LayerVersion", 1)
+    template.has_resource_properties("AWS::Lambda::LayerVersion", {
+        "CompatibleRuntimes": ["python3.9"],
+        "CompatibleArchitectures": ["x86_64"],
+    })
+
+
+def test_each_architecture_gets_its_own_layer(stack, code_path, requirements):
+    LambdaFunction(stack, "X86", code_path=code_path, requirements_path=requirements)
+    LambdaFunction(
+        stack,
+        "Arm",
+        code_path=code_path,
+        requirements_path=requirements,
+        architecture=_lambda.Architecture.ARM_64,
+    )
+    Template.from_stack(stack).resource_count_is("AWS::Lambda::LayerVersion", 2)
+
+
+def test_hash_ignores_comments_and_blank_lines(tmp_path, requirements):
+    commented = tmp_path / "commented.txt"
+    commented.write_text("# pinned for the API client\n\nrequests==2.31.0  # http\n")
+
+    def digest(path):
+        return DependencyLayer.requirements_hash(
+            str(path), _lambda.Runtime.PYTHON_3_12, _lambda.Architecture.X86_64
+        )
+
+    assert digest(commented) == digest(requirements)
+    changed = tmp_path / "changed.txt"
+    changed.write_text("requests==2.32.0\n")
+    assert digest(changed) != digest(requirements)
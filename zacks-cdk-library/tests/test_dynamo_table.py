@@ -0,0 +1,200 @@
+from decimal import Decimal
+
+import pytest
+from aws_cdk import (
+    aws_applicationautoscaling as appscaling,
+    aws_dynamodb as dynamodb,
+    aws_ec2 as ec2,
+    aws_iam as iam,
+)
+from aws_cdk.assertions import Match, Template
+
+from zacks_cdk_lib.compute import LambdaFunction
+from zacks_cdk_lib.database import EnhancedDynamoTable
+
+PARTITION_KEY = dynamodb.Attribute(name="pk", type=dynamodb.AttributeType.STRING)
+
+
+def test_dax_cluster_sits_in_front_of_the_table(stack):
+    vpc = ec2.Vpc(stack, "Vpc", max_azs=2)
+    table = EnhancedDynamoTable(stack, "Table", partition_key=PARTITION_KEY, dax_vpc=vpc)
+    role = iam.Role(stack, "Reader", assumed_by=iam.ServicePrincipal("lambda.amazonaws.com"))
+    table.grant_read_data(role)
+    template = Template.from_stack(stack)
+
+    template.has_resource_properties("AWS::DAX::Cluster", {
+        "NodeType": "dax.t3.small",
+        "ReplicationFactor": 3,
+        "ClusterEndpointEncryptionType": "TLS",
+        "SSESpecification": {"SSEEnabled": True},
+    })
+    template.has_resource_properties("AWS::DAX::ParameterGroup", {
+        "ParameterNameValues": {
+            "record-ttl-millis": "300000",
+            "query-ttl-millis": "300000",
+        },
+    })
+    template.has_resource_properties("AWS::IAM::Policy", {
+        "PolicyDocument": {"Statement": Match.array_with([
+            Match.object_like({"Action": Match.array_with(["dax:GetItem", "dax:Query"])}),
+        ])},
+    })
+
+
+def test_dax_access_is_opened_per_client(stack):
+    vpc = ec2.Vpc(stack, "Vpc", max_azs=2)
+    table = EnhancedDynamoTable(stack, "Table", partition_key=PARTITION_KEY, dax_vpc=vpc)
+    client = ec2.SecurityGroup(stack, "Client", vpc=vpc)
+    table.allow_dax_access_from(client)
+    template = Template.from_stack(stack)
+
+    template.has_resource_properties("AWS::EC2::SecurityGroupIngress", {
+        "FromPort": 9111,
+        "ToPort": 9111,
+    })
+
+
+def test_no_dax_without_a_vpc(stack):
+    table = EnhancedDynamoTable(stack, "Table", partition_key=PARTITION_KEY)
+    Template.from_stack(stack).resource_count_is("AWS::DAX::Cluster", 0)
+    assert table.dax_endpoint is None
+
+
+def test_provisioned_table_and_indexes_scale_on_utilization(stack):
+    table = EnhancedDynamoTable(
+        stack,
+        "Table",
+        partition_key=PARTITION_KEY,
+        billing_mode=dynamodb.BillingMode.PROVISIONED,
+        read_capacity=5,
+        write_capacity=5,
+        max_read_capacity=50,
+        max_write_capacity=20,
+        target_utilization=60,
+        scheduled_scaling=[{
+            "id": "BusinessHours",
+            "schedule": appscaling.Schedule.cron(hour="8", minute="0"),
+            "min_capacity": 10,
+            "dimension": "read",
+        }],
+    )
+    table.add_global_secondary_index(
+        index_name="ByStatus",
+        partition_key=dynamodb.Attribute(name="status", type=dynamodb.AttributeType.STRING),
+    )
+    template = Template.from_stack(stack)
+
+    # Read and write for the table and the index
+    template.resource_count_is("AWS::ApplicationAutoScaling::ScalableTarget", 4)
+    template.has_resource_properties("AWS::ApplicationAutoScaling::ScalableTarget", {
+        "ScalableDimension": "dynamodb:index:ReadCapacityUnits",
+        "MaxCapacity": 50,
+        "ScheduledActions": [Match.object_like({
+            "ScalableTargetAction": {"MinCapacity": 10},
+        })],
+    })
+    template.has_resource_properties("AWS::ApplicationAutoScaling::ScalableTarget", {
+        "ScalableDimension": "dynamodb:table:WriteCapacityUnits",
+        "MinCapacity": 5,
+        "MaxCapacity": 20,
+        "ScheduledActions": Match.absent(),
+    })
+    template.has_resource_properties("AWS::ApplicationAutoScaling::ScalingPolicy", {
+        "TargetTrackingScalingPolicyConfiguration": Match.object_like({"TargetValue": 60}),
+    })
+
+
+def test_on_demand_tables_do_not_scale(stack):
+    EnhancedDynamoTable(stack, "Table", partition_key=PARTITION_KEY, max_read_capacity=50)
+    template = Template.from_stack(stack)
+    template.resource_count_is("AWS::ApplicationAutoScaling::ScalableTarget", 0)
+
+
+def test_write_sharding_adds_a_scatter_gather_index(stack, code_path):
+    table = EnhancedDynamoTable(
+        stack,
+        "Table",
+        partition_key=PARTITION_KEY,
+        sort_key=dynamodb.Attribute(name="sk", type=dynamodb.AttributeType.STRING),
+        write_shards=8,
+    )
+    writer = LambdaFunction(stack, "Writer", code_path=code_path)
+    table.configure_sharding(writer)
+    template = Template.from_stack(stack)
+
+    template.has_resource_properties("AWS::DynamoDB::Table", {
+        "GlobalSecondaryIndexes": [Match.object_like({
+            "IndexName": table.scatter_gather_index_name,
+            "KeySchema": [
+                {"AttributeName": "shard", "KeyType": "HASH"},
+                {"AttributeName": "sk", "KeyType": "RANGE"},
+            ],
+        })],
+    })
+    template.has_resource_properties("AWS::Lambda::Function", {
+        "Environment": {"Variables": Match.object_like({
+            "SHARD_COUNT": "8",
+            "SHARD_PARTITION_KEY": "pk",
+            "SHARD_SEPARATOR": "#",
+            "SHARD_ATTRIBUTE": "shard",
+        })},
+    })
+
+
+@pytest.mark.parametrize("options, message", [
+    ({"write_shards": 1}, "at least 2"),
+    ({
+        "write_shards": 4,
+        "partition_key": dynamodb.Attribute(name="pk", type=dynamodb.AttributeType.NUMBER),
+    }, "string partition key"),
+])
+def test_invalid_write_sharding_is_rejected(stack, options, message):
+    options = {"partition_key": PARTITION_KEY, **options}
+    with pytest.raises(ValueError, match=message):
+        EnhancedDynamoTable(stack, "Table", **options)
+
+
+def test_configure_sharding_needs_write_shards(stack, code_path):
+    table = EnhancedDynamoTable(stack, "Table", partition_key=PARTITION_KEY)
+    writer = LambdaFunction(stack, "Writer", code_path=code_path)
+    with pytest.raises(ValueError, match="no write sharding"):
+        table.configure_sharding(writer)
+
+
+def test_write_shard_is_stable_per_item_and_spreads_a_partition_key():
+    shards = [EnhancedDynamoTable.write_shard(8, "tenant", sort_key) for sort_key in range(200)]
+    assert set(shards) == set(range(8))
+    assert shards == [
+        EnhancedDynamoTable.write_shard(8, "tenant", sort_key) for sort_key in range(200)
+    ]
+    assert 0 <= EnhancedDynamoTable.write_shard(8, "tenant") < 8
+
+
+def test_write_shard_normalizes_numbers():
+    shards = {
+        EnhancedDynamoTable.write_shard(16, "a", sort_key)
+        for sort_key in (10, 10.0, Decimal("10.00"), Decimal("1E+1"))
+    }
+    assert len(shards) == 1
+
+
+def test_contributor_insights_cover_the_table_and_its_indexes(stack):
+    table = EnhancedDynamoTable(
+        stack,
+        "Table",
+        partition_key=PARTITION_KEY,
+        contributor_insights=True,
+    )
+    table.add_global_secondary_index(
+        index_name="ByStatus",
+        partition_key=dynamodb.Attribute(name="status", type=dynamodb.AttributeType.STRING),
+    )
+    template = Template.from_stack(stack)
+
+    template.has_resource_properties("AWS::DynamoDB::Table", {
+        "ContributorInsightsSpecification": {"Enabled": True},
+        "GlobalSecondaryIndexes": [Match.object_like({
+            "IndexName": "ByStatus",
+            "ContributorInsightsSpecification": {"Enabled": True},
+        })],
+    })
@@ -0,0 +1,139 @@
+import json
+
+from aws_cdk import aws_ec2 as ec2
+from aws_cdk.assertions import Match, Template
+
+from zacks_cdk_lib.compute import StandardEC2Instance
+from zacks_cdk_lib.networking import StandardVpc
+
+
+def test_ipv6_egress_gives_the_instance_an_ipv6_address(stack):
+    vpc = StandardVpc(stack, "Vpc", dual_stack=True)
+    StandardEC2Instance(stack, "Instance", vpc=vpc.vpc, ipv6_egress=True)
+    template = Template.from_stack(stack)
+
+    template.has_resource_properties("AWS::EC2::Instance", {"Ipv6AddressCount": 1})
+    template.has_resource_properties("AWS::EC2::SecurityGroup", {
+        "SecurityGroupEgress": Match.array_with([
+            Match.object_like({"CidrIpv6": "::/0", "IpProtocol": "-1"}),
+        ]),
+    })
+
+
+def test_volumes_come_from_a_launch_template(stack):
+    vpc = StandardVpc(stack, "Vpc")
+    instance = StandardEC2Instance(
+        stack,
+        "Instance",
+        vpc=vpc.vpc,
+        root_volume={"size": 30, "iops": 4000, "throughput": 250},
+        data_volumes=[{"device_name": "/dev/sdf", "size": 100, "volume_type": "io2", "iops": 8000}],
+        ebs_optimized=True,
+    )
+    template = Template.from_stack(stack)
+
+    template.has_resource_properties("AWS::EC2::LaunchTemplate", {
+        "LaunchTemplateData": Match.object_like({"BlockDeviceMappings": [
+            {"DeviceName": "/dev/xvda", "Ebs": {
+                "VolumeSize": 30,
+                "VolumeType": "gp3",
+                "Iops": 4000,
+                "Throughput": 250,
+                "Encrypted": True,
+            }},
+            {"DeviceName": "/dev/sdf", "Ebs": {
+                "VolumeSize": 100,
+                "VolumeType": "io2",
+                "Iops": 8000,
+                "Encrypted": True,
+            }},
+        ]}),
+    })
+    template.has_resource_properties("AWS::EC2::Instance", {
+        "EbsOptimized": True,
+        "LaunchTemplate": {"LaunchTemplateId": Match.any_value(), "Version": Match.any_value()},
+    })
+    assert instance.launch_template is not None
+
+
+def test_imdsv2_is_required_on_the_volume_launch_template(stack):
+    vpc = StandardVpc(stack, "Vpc")
+    StandardEC2Instance(
+        stack,
+        "Instance",
+        vpc=vpc.vpc,
+        root_volume={"size": 30},
+        require_imdsv2=True,
+    )
+    template = Template.from_stack(stack)
+
+    template.has_resource_properties("AWS::EC2::LaunchTemplate", {
+        "LaunchTemplateData": Match.object_like({
+            "MetadataOptions": Match.object_like({"HttpTokens": "required"}),
+        }),
+    })
+
+
+def test_placement_strategy_creates_a_placement_group(stack):
+    vpc = StandardVpc(stack, "Vpc")
+    StandardEC2Instance(
+        stack,
+        "Instance",
+        vpc=vpc.vpc,
+        placement_strategy="partition",
+        placement_partitions=3,
+    )
+    template = Template.from_stack(stack)
+
+    template.has_resource_properties("AWS::EC2::PlacementGroup", {
+        "Strategy": "partition",
+        "PartitionCount": 3,
+    })
+    template.has_resource_properties("AWS::EC2::Instance", {
+        "PlacementGroupName": Match.any_value(),
+    })
+
+
+def test_ena_express_moves_the_subnet_onto_the_network_interface(stack):
+    vpc = StandardVpc(stack, "Vpc", dual_stack=True)
+    StandardEC2Instance(
+        stack,
+        "Instance",
+        vpc=vpc.vpc,
+        instance_type=ec2.InstanceType("c6i.8xlarge"),
+        ena_express=True,
+        ena_express_udp=True,
+        ipv6_egress=True,
+    )
+    template = Template.from_stack(stack)
+
+    template.has_resource_properties("AWS::EC2::Instance", {
+        "NetworkInterfaces": [Match.object_like({
+            "DeviceIndex": "0",
+            "Ipv6AddressCount": 1,
+            "EnaSrdSpecification": {
+                "EnaSrdEnabled": True,
+                "EnaSrdUdpSpecification": {"EnaSrdUdpEnabled": True},
+            },
+        })],
+        "SubnetId": Match.absent(),
+        "SecurityGroupIds": Match.absent(),
+        "Ipv6AddressCount": Match.absent(),
+    })
+
+
+def test_instance_store_is_mounted_from_user_data(stack):
+    vpc = StandardVpc(stack, "Vpc")
+    StandardEC2Instance(
+        stack,
+        "Instance",
+        vpc=vpc.vpc,
+        instance_type=ec2.InstanceType("m6id.large"),
+        instance_store_mount_point="/mnt/scratch",
+    )
+    template = Template.from_stack(stack)
+
+    instance = next(iter(template.find_resources("AWS::EC2::Instance").values()))
+    user_data = json.dumps(instance["Properties"]["UserData"])
+    assert "mount -o noatime" in user_data
+    assert "/mnt/scratch" in user_data
@@ -0,0 +1,78 @@
+import pytest
+from aws_cdk.assertions import Match, Template
+
+from zacks_cdk_lib.compute import GoldenAmiPipeline, StandardAutoScalingGroup, StandardEC2Instance
+from zacks_cdk_lib.networking import StandardVpc
+
+COMPONENTS = [
+    "amazon-cloudwatch-agent-linux",
+    {"name": "app", "commands": ["yum install -y nginx"]},
+]
+
+
+def test_pipeline_bakes_components_and_publishes_the_ami(stack):
+    pipeline = GoldenAmiPipeline(stack, "Ami", components=COMPONENTS, root_volume_size=20)
+    template = Template.from_stack(stack)
+
+    template.resource_count_is("AWS::ImageBuilder::Component", 1)
+    template.has_resource_properties("AWS::ImageBuilder::ImageRecipe", {
+        "BlockDeviceMappings": [Match.object_like({
+            "Ebs": Match.object_like({"VolumeSize": 20, "VolumeType": "gp3", "Encrypted": True}),
+        })],
+    })
+    template.has_resource_properties("AWS::ImageBuilder::InfrastructureConfiguration", {
+        "InstanceMetadataOptions": {"HttpTokens": "required"},
+        "TerminateInstanceOnFailure": True,
+    })
+    template.has_resource_properties("AWS::ImageBuilder::DistributionConfiguration", {
+        "Distributions": [Match.object_like({
+            "SsmParameterConfigurations": [{
+                "ParameterName": pipeline.parameter_name,
+                "DataType": "aws:ec2:image",
+            }],
+        })],
+    })
+    template.has_resource_properties("AWS::ImageBuilder::ImagePipeline", {
+        "Schedule": {
+            "ScheduleExpression": "cron(0 4 ? * sun *)",
+            "PipelineExecutionStartCondition": "EXPRESSION_MATCH_AND_DEPENDENCY_UPDATES_AVAILABLE",
+        },
+    })
+    template.resource_count_is("AWS::ImageBuilder::Image", 1)
+
+
+def test_changed_commands_produce_a_new_recipe(stack):
+    first = GoldenAmiPipeline(stack, "First", components=COMPONENTS)
+    second = GoldenAmiPipeline(
+        stack, "Second", components=[{"name": "app", "commands": ["yum install -y httpd"]}]
+    )
+    first_name = stack.resolve(first.recipe.name)
+    second_name = stack.resolve(second.recipe.name)
+    assert first_name.rsplit("-", 1)[1] != second_name.rsplit("-", 1)[1]
+
+
+def test_pipeline_needs_components(stack):
+    with pytest.raises(ValueError, match="at least one component"):
+        GoldenAmiPipeline(stack, "Ami", components=[])
+
+
+def test_instances_and_groups_launch_from_the_baked_ami(stack):
+    vpc = StandardVpc(stack, "Vpc")
+    pipeline = GoldenAmiPipeline(stack, "Ami", components=COMPONENTS)
+    StandardEC2Instance(stack, "Instance", vpc=vpc.vpc, machine_image=pipeline)
+    StandardAutoScalingGroup(stack, "Group", vpc=vpc.vpc, machine_image=pipeline)
+    template = Template.from_stack(stack)
+
+    # Single instances resolve the parameter when they are created, after the first bake
+    template.has_resource("AWS::EC2::Instance", {
+        "Properties": Match.object_like({
+            "ImageId": f"{{{{resolve:ssm:{pipeline.parameter_name}}}}}",
+        }),
+        "DependsOn": Match.array_with([Match.string_like_regexp("AmiImage")]),
+    })
+    # Launch templates resolve it at every launch
+    template.has_resource_properties("AWS::EC2::LaunchTemplate", {
+        "LaunchTemplateData": Match.object_like({
+            "ImageId": f"resolve:ssm:{pipeline.parameter_name}",
+        }),
+    })
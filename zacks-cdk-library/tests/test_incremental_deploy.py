@@ -0,0 +1,128 @@
+import io
+import json
+import zipfile
+
+import pytest
+
+PROPS = {
+    "ContentBucket": "assets",
+    "ContentKey": "content.zip",
+    "ManifestBucket": "assets",
+    "ManifestKey": "manifest.json",
+    "DestinationBucket": "website",
+    "StateBucket": "state",
+    "DeployedManifestKey": "deploy-manifest.json",
+    "DistributionId": "E123",
+    "IndexDocument": "index.html",
+}
+
+
+def entry(digest, cache_control="public, max-age=0"):
+    return {"hash": digest, "cache_control": cache_control}
+
+
+@pytest.fixture
+def deploy(load_handler):
+    return load_handler("incremental_deploy")
+
+
+def run(deploy, manifest, previous, request_type="Update"):
+    """Run the deploy handler against an S3 holding the given manifests"""
+    objects = {("assets", "manifest.json"): manifest}
+    if previous is not None:
+        objects[("state", "deploy-manifest.json")] = previous
+
+    def get_object(Bucket, Key):
+        if (Bucket, Key) not in objects:
+            raise deploy.s3.exceptions.NoSuchKey()
+        return {"Body": io.BytesIO(json.dumps(objects[(Bucket, Key)]).encode("utf-8"))}
+
+    def download_fileobj(bucket, key, fileobj):
+        with zipfile.ZipFile(fileobj, "w") as content:
+            for name in manifest:
+                content.writestr(name, name)
+
+    deploy.s3.get_object.side_effect = get_object
+    deploy.s3.download_fileobj.side_effect = download_fileobj
+    deploy.cloudfront.create_invalidation.return_value = {"Invalidation": {"Id": "I1"}}
+    return deploy.handler({
+        "RequestType": request_type,
+        "RequestId": "request-1",
+        "LogicalResourceId": "Deployment",
+        "ResourceProperties": PROPS,
+    }, None)
+
+
+def invalidated_paths(deploy):
+    batch = deploy.cloudfront.create_invalidation.call_args.kwargs["InvalidationBatch"]
+    return batch["Paths"]["Items"]
+
+
+def test_only_changed_objects_are_uploaded_and_invalidated(deploy):
+    previous = {"index.html": entry("a"), "app.js": entry("b"), "old.css": entry("c")}
+    manifest = {"index.html": entry("a2"), "app.js": entry("b"), "new.js": entry("d")}
+    response = run(deploy, manifest, previous)
+
+    uploaded = [call.args[2] for call in deploy.s3.upload_fileobj.call_args_list]
+    assert uploaded == ["new.js", "index.html"]
+    deploy.s3.delete_objects.assert_called_once_with(
+        Bucket="website",
+        Delete={"Objects": [{"Key": "old.css"}], "Quiet": True},
+    )
+    assert invalidated_paths(deploy) == ["/", "/index.html", "/old.css"]
+    assert response["Data"]["InvalidationId"] == "I1"
+
+
+def test_deployed_manifest_is_kept_in_the_state_bucket(deploy):
+    manifest = {"index.html": entry("a")}
+    run(deploy, manifest, {})
+
+    put = deploy.s3.put_object.call_args.kwargs
+    assert (put["Bucket"], put["Key"]) == ("state", "deploy-manifest.json")
+    assert json.loads(put["Body"]) == manifest
+
+
+def test_first_deploy_invalidates_everything(deploy):
+    run(deploy, {"index.html": entry("a")}, None)
+    assert invalidated_paths(deploy) == ["/*"]
+
+
+def test_too_many_paths_collapse_into_one_wildcard(deploy):
+    deploy.MAX_INVALIDATION_PATHS = 2
+    previous = {f"page{number}.css": entry("a") for number in range(3)}
+    run(deploy, {key: entry("b") for key in previous}, previous)
+
+    deploy.cloudfront.create_invalidation.assert_called_once()
+    assert invalidated_paths(deploy) == ["/*"]
+
+
+def test_unchanged_content_submits_no_invalidation(deploy):
+    manifest = {"index.html": entry("a")}
+    response = run(deploy, manifest, manifest)
+
+    deploy.cloudfront.create_invalidation.assert_not_called()
+    assert response["Data"]["InvalidationId"] == ""
+
+
+@pytest.mark.parametrize("status, complete", [("InProgress", False), ("Completed", True)])
+def test_is_complete_polls_the_submitted_invalidation(deploy, status, complete):
+    deploy.cloudfront.get_invalidation.return_value = {"Invalidation": {"Status": status}}
+    response = deploy.is_complete({
+        "RequestType": "Update",
+        "ResourceProperties": PROPS,
+        "Data": {"InvalidationId": "I1"},
+    }, None)
+
+    assert response == {"IsComplete": complete}
+    deploy.cloudfront.get_invalidation.assert_called_once_with(DistributionId="E123", Id="I1")
+
+
+@pytest.mark.parametrize("event", [
+    {"RequestType": "Delete", "Data": {}},
+    {"RequestType": "Update", "Data": {"InvalidationId": ""}},
+])
+def test_is_complete_without_an_invalidation(deploy, event):
+    assert deploy.is_complete({**event, "ResourceProperties": PROPS}, None) == {
+        "IsComplete": True,
+    }
+    deploy.cloudfront.get_invalidation.assert_not_called()
@@ -0,0 +1,163 @@
+import os
+import sys
+from unittest import mock
+
+import pytest
+from aws_cdk import (
+    aws_applicationautoscaling as appscaling,
+    aws_iam as iam,
+    aws_lambda as _lambda,
+    Size,
+)
+from aws_cdk.assertions import Match, Template
+
+from zacks_cdk_lib.compute import LambdaFunction
+from zacks_cdk_lib.compute.lambda_function import HANDLERS_DIR
+from zacks_cdk_lib.networking import StandardVpc
+
+
+def test_defaults_have_no_alias(stack, code_path):
+    function = LambdaFunction(stack, "Function", code_path=code_path)
+    template = Template.from_stack(stack)
+
+    assert function.alias is None
+    assert function.invoke_target is function.function
+    template.resource_count_is("AWS::Lambda::Alias", 0)
+    template.has_resource_properties("AWS::Lambda::Function", {
+        "MemorySize": 128,
+        "Timeout": 30,
+    })
+
+
+def test_provisioned_concurrency_scales_the_live_alias(stack, code_path):
+    function = LambdaFunction(
+        stack,
+        "Function",
+        code_path=code_path,
+        provisioned_concurrency=2,
+        utilization_target=0.6,
+        scheduled_scaling=[{
+            "id": "MorningPeak",
+            "schedule": appscaling.Schedule.cron(hour="8", minute="0"),
+            "min_capacity": 10,
+        }],
+    )
+    template = Template.from_stack(stack)
+
+    assert function.invoke_target is function.alias
+    template.has_resource_properties("AWS::Lambda::Alias", {
+        "Name": "live",
+        "ProvisionedConcurrencyConfig": {"ProvisionedConcurrentExecutions": 2},
+    })
+    template.has_resource_properties("AWS::ApplicationAutoScaling::ScalableTarget", {
+        "MinCapacity": 2,
+        "MaxCapacity": 4,
+        "ScalableDimension": "lambda:function:ProvisionedConcurrency",
+        "ScheduledActions": [Match.object_like({
+            "ScalableTargetAction": {"MinCapacity": 10},
+        })],
+    })
+    template.has_resource_properties("AWS::ApplicationAutoScaling::ScalingPolicy", {
+        "TargetTrackingScalingPolicyConfiguration": Match.object_like({
+            "TargetValue": 0.6,
+            "PredefinedMetricSpecification": {
+                "PredefinedMetricType": "LambdaProvisionedConcurrencyUtilization",
+            },
+        }),
+    })
+
+
+def test_snapstart_publishes_a_version_with_warmup_hooks(stack, code_path):
+    function = LambdaFunction(
+        stack,
+        "Function",
+        code_path=code_path,
+        runtime=_lambda.Runtime.PYTHON_3_12,
+        cold_start_mode="snapstart",
+        warmup_imports=["json"],
+        warmup_clients=["dynamodb", "s3"],
+    )
+    template = Template.from_stack(stack)
+
+    assert function.invoke_target is function.alias
+    template.has_resource_properties("AWS::Lambda::Function", {
+        "SnapStart": {"ApplyOn": "PublishedVersions"},
+        "Layers": [{"Ref": Match.string_like_regexp("ColdStartHooksLayer")}],
+        "Environment": {"Variables": {
+            "ZACKS_COLD_START_MODE": "snapstart",
+            "ZACKS_WARMUP_IMPORTS": "json",
+            "ZACKS_WARMUP_CLIENTS": "dynamodb,s3",
+        }},
+    })
+    template.resource_count_is("AWS::Lambda::Alias", 1)
+
+
+def test_functions_share_the_cold_start_layer(stack, code_path):
+    for id in ("First", "Second"):
+        LambdaFunction(stack, id, code_path=code_path, cold_start_mode="lazy")
+    template = Template.from_stack(stack)
+
+    template.resource_count_is("AWS::Lambda::LayerVersion", 1)
+    template.resource_count_is("AWS::Lambda::Alias", 0)
+
+
+@pytest.mark.parametrize("options, message", [
+    ({"cold_start_mode": "warm"}, "cold_start_mode must be one of"),
+    ({"cold_start_mode": "snapstart"}, "not supported for python3.9"),
+    (
+        {"cold_start_mode": "snapstart", "runtime": _lambda.Runtime.PYTHON_3_12,
+         "provisioned_concurrency": 1},
+        "provisioned concurrency",
+    ),
+    (
+        {"cold_start_mode": "snapstart", "runtime": _lambda.Runtime.PYTHON_3_12,
+         "ephemeral_storage_size": Size.gibibytes(1)},
+        "512 MB",
+    ),
+])
+def test_invalid_cold_start_modes_are_rejected(stack, code_path, options, message):
+    with pytest.raises(ValueError, match=message):
+        LambdaFunction(stack, "Function", code_path=code_path, **options)
+
+
+def test_permissions_on_latest_of_an_aliased_function_fail_synth(stack, code_path):
+    function = LambdaFunction(stack, "Function", code_path=code_path, provisioned_concurrency=1)
+    function.function.grant_invoke(iam.ServicePrincipal("sns.amazonaws.com"))
+    with pytest.raises(RuntimeError, match="invoke_target"):
+        Template.from_stack(stack)
+
+
+def test_cold_start_hooks_warm_up_imports_and_clients(monkeypatch):
+    boto3 = mock.MagicMock()
+    monkeypatch.setitem(sys.modules, "boto3", boto3)
+    monkeypatch.setenv("ZACKS_WARMUP_IMPORTS", "json, decimal")
+    monkeypatch.setenv("ZACKS_WARMUP_CLIENTS", "dynamodb")
+    monkeypatch.syspath_prepend(os.path.join(HANDLERS_DIR, "cold_start", "python"))
+    monkeypatch.delitem(sys.modules, "zacks_cold_start", raising=False)
+    import zacks_cold_start
+
+    zacks_cold_start.warm_up()
+
+    boto3.client.assert_called_once_with("dynamodb")
+    assert zacks_cold_start.client("dynamodb") is boto3.client.return_value
+    assert boto3.client.call_count == 1
+
+
+def test_ipv6_egress_allows_dual_stack_traffic(stack, code_path):
+    vpc = StandardVpc(stack, "Vpc", dual_stack=True)
+    LambdaFunction(stack, "Function", code_path=code_path, vpc=vpc.vpc, ipv6_egress=True)
+    template = Template.from_stack(stack)
+
+    template.has_resource_properties("AWS::Lambda::Function", {
+        "VpcConfig": Match.object_like({"Ipv6AllowedForDualStack": True}),
+    })
+    template.has_resource_properties("AWS::EC2::SecurityGroup", {
+        "SecurityGroupEgress": Match.array_with([
+            Match.object_like({"CidrIpv6": "::/0"}),
+        ]),
+    })
+
+
+def test_ipv6_egress_needs_a_vpc(stack, code_path):
+    with pytest.raises(ValueError, match="vpc"):
+        LambdaFunction(stack, "Function", code_path=code_path, ipv6_egress=True)
@@ -0,0 +1,46 @@
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+import zacks_cdk_lib
+
+LIBRARY_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(zacks_cdk_lib.__file__)))
+
+
+def loaded_modules(statement):
+    """Modules a fresh interpreter has loaded after running the statement"""
+    script = f"import json, sys\n{statement}\nprint(json.dumps(sorted(sys.modules)))"
+    output = subprocess.run(
+        [sys.executable, "-c", script],
+        check=True,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        text=True,
+        cwd=LIBRARY_ROOT,
+        env={**os.environ, "JSII_SILENCE_WARNING_DEPRECATED_NODE_VERSION": "1"},
+    ).stdout
+    return set(json.loads(output.splitlines()[-1]))
+
+
+def test_subpackages_import_no_constructs_until_accessed():
+    modules = loaded_modules("import zacks_cdk_lib.patterns, zacks_cdk_lib.compute")
+    assert "zacks_cdk_lib.patterns.static_website" not in modules
+    assert "zacks_cdk_lib.compute.lambda_function" not in modules
+
+
+@pytest.mark.parametrize("module", ["aws_cdk.aws_cloudfront", "aws_cdk.aws_wafv2"])
+def test_serverless_api_loads_edge_modules_only_for_an_edge_cache(module):
+    assert module not in loaded_modules("from zacks_cdk_lib.patterns import ServerlessApi")
+
+
+def test_lazy_exports_resolve_and_list_every_construct():
+    from zacks_cdk_lib import patterns
+    from zacks_cdk_lib.patterns.static_website import StaticWebsite
+
+    assert patterns.StaticWebsite is StaticWebsite
+    assert set(patterns.__all__) <= set(dir(patterns))
+    with pytest.raises(AttributeError, match="no attribute 'Missing'"):
+        patterns.Missing
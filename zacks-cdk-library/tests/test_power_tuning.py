@@ -0,0 +1,183 @@
+import base64
+import json
+import re
+
+import pytest
+from aws_cdk import aws_lambda as _lambda
+from aws_cdk.assertions import Template
+
+from zacks_cdk_lib.compute import LambdaFunction, LambdaPowerTuner
+
+
+def definition(template):
+    """The state machine definition with its CloudFormation joins flattened"""
+    state_machine = next(iter(template.find_resources("AWS::StepFunctions::StateMachine").values()))
+    parts = state_machine["Properties"]["DefinitionString"]["Fn::Join"][1]
+    return "".join(part if isinstance(part, str) else "<token>" for part in parts)
+
+
+def test_state_machine_measures_a_copy_and_always_cleans_up(stack, code_path):
+    function = LambdaFunction(stack, "Target", code_path=code_path)
+    LambdaPowerTuner(stack, "Tuner", function=function, memory_sizes=[128, 512])
+    template = Template.from_stack(stack)
+
+    states = json.loads(definition(template).replace("<token>", ""))["States"]
+    assert list(states) == [
+        "Plan", "MeasureConfigurations", "Cleanup", "WriteResults",
+        "CleanupAfterFailure", "TuningFailed",
+    ]
+    measure = states["MeasureConfigurations"]
+    assert measure["MaxConcurrency"] == 1
+    assert measure["Catch"][0]["Next"] == "CleanupAfterFailure"
+    assert measure["ItemSelector"] == {
+        "configuration.$": "$$.Map.Item.Value",
+        "execution.$": "$$.Execution.Name",
+    }
+    configurations = states["Plan"]["Parameters"]["configurations"]
+    assert [(item["architecture"], item["memory"]) for item in configurations] == [
+        ("x86_64", 128), ("x86_64", 512), ("arm64", 128), ("arm64", 512),
+    ]
+
+
+def test_executor_never_modifies_the_target(stack, code_path):
+    function = LambdaFunction(stack, "Target", code_path=code_path, provisioned_concurrency=1)
+    LambdaPowerTuner(stack, "Tuner", function=function)
+    template = Template.from_stack(stack)
+
+    statements = [
+        statement
+        for policy in template.find_resources("AWS::IAM::Policy").values()
+        for statement in policy["Properties"]["PolicyDocument"]["Statement"]
+    ]
+    actions = [
+        action
+        for statement in statements
+        for action in (statement["Action"] if isinstance(statement["Action"], list)
+                       else [statement["Action"]])
+    ]
+    assert "lambda:UpdateFunctionCode" not in actions
+    assert "lambda:PublishVersion" not in actions
+    assert "iam:PassRole" in actions
+
+    # Create, update and delete are limited to the tuner's copies
+    copies = next(s for s in statements if "lambda:CreateFunction" in s["Action"])
+    assert "lambda:UpdateFunctionConfiguration" in copies["Action"]
+    assert re.search(r':function:TestStack-Tuner-[0-9A-F]{8}-\*"', json.dumps(copies["Resource"]))
+
+
+def test_layers_of_other_architectures_must_be_given(stack, code_path):
+    layer = _lambda.LayerVersion(stack, "Layer", code=_lambda.Code.from_asset(code_path))
+    function = LambdaFunction(stack, "Target", code_path=code_path, layers=[layer])
+    with pytest.raises(ValueError, match="architecture_layers"):
+        LambdaPowerTuner(stack, "Tuner", function=function)
+
+    arm_layer = _lambda.LayerVersion(stack, "ArmLayer", code=_lambda.Code.from_asset(code_path))
+    LambdaPowerTuner(
+        stack,
+        "TunerWithLayers",
+        function=function,
+        architecture_layers={"arm64": [arm_layer]},
+    )
+
+
+@pytest.fixture
+def executor(load_handler):
+    module = load_handler(
+        "power_tuning",
+        TARGET_FUNCTION="target",
+        COPY_PREFIX="tuner",
+        CODE_BUCKET="code-bucket",
+        CODE_KEY="code.zip",
+    )
+    client = module.lambda_client
+    log = b"REPORT RequestId: 1\tDuration: 12.5 ms\tBilled Duration: 13 ms"
+    client.invoke.return_value = {"LogResult": base64.b64encode(log).decode()}
+    return module
+
+
+def configuration(architecture="x86_64", memory=256):
+    return {
+        "memory": memory,
+        "architecture": architecture,
+        "layers": [],
+        "invocations": 3,
+        "payload": {},
+    }
+
+
+def test_measure_creates_a_copy_of_the_target(executor):
+    client = executor.lambda_client
+    target = {
+        "Role": "arn:aws:iam::123456789012:role/target",
+        "Handler": "index.handler",
+        "Runtime": "python3.12",
+        "Timeout": 30,
+        "Environment": {"Variables": {"TABLE": "t"}},
+        "VpcConfig": {"SubnetIds": [], "SecurityGroupIds": []},
+    }
+
+    def get_function_configuration(FunctionName):
+        if FunctionName != "target":
+            raise client.exceptions.ResourceNotFoundException()
+        return target
+
+    client.get_function_configuration.side_effect = get_function_configuration
+
+    result = executor.handler(
+        {"execution": "run-1", "configuration": configuration("arm64", 512)}, None
+    )
+
+    name = executor.copy_name("run-1")
+    assert name.startswith("tuner-")
+    options = client.create_function.call_args.kwargs
+    assert options["FunctionName"] == name
+    assert options["Architectures"] == ["arm64"]
+    assert options["MemorySize"] == 512
+    assert options["Role"] == target["Role"]
+    assert options["Environment"] == {"Variables": {"TABLE": "t"}}
+    assert "VpcConfig" not in options
+    assert {call.kwargs["FunctionName"] for call in client.invoke.call_args_list} == {name}
+    assert result["invocations"] == 3
+    assert result["duration_ms"]["p50"] == 12.5
+    client.update_function_code.assert_not_called()
+    client.publish_version.assert_not_called()
+
+
+def test_memory_change_updates_the_copy_only(executor):
+    client = executor.lambda_client
+    client.get_function_configuration.return_value = {
+        "MemorySize": 256, "Architectures": ["x86_64"], "Layers": [],
+    }
+
+    executor.handler({"execution": "run-1", "configuration": configuration(memory=1024)}, None)
+
+    client.create_function.assert_not_called()
+    client.update_function_configuration.assert_called_once_with(
+        FunctionName=executor.copy_name("run-1"), MemorySize=1024, Layers=[],
+    )
+
+
+def test_architecture_change_replaces_the_copy(executor):
+    client = executor.lambda_client
+    client.get_function_configuration.return_value = {
+        "MemorySize": 256, "Architectures": ["x86_64"], "Layers": [], "Role": "r",
+        "Handler": "h", "Runtime": "python3.12", "Timeout": 3,
+    }
+
+    executor.handler({"execution": "run-1", "configuration": configuration("arm64")}, None)
+
+    name = executor.copy_name("run-1")
+    client.delete_function.assert_called_once_with(FunctionName=name)
+    assert client.create_function.call_args.kwargs["Architectures"] == ["arm64"]
+
+
+def test_cleanup_deletes_only_the_copy(executor):
+    client = executor.lambda_client
+
+    executor.handler({"action": "cleanup", "execution": "run-1"}, None)
+
+    name = executor.copy_name("run-1")
+    client.delete_function.assert_called_once_with(FunctionName=name)
+    executor.logs_client.delete_log_group.assert_called_once_with(
+        logGroupName=f"/aws/lambda/{name}"
+    )
@@ -0,0 +1,73 @@
+import json
+
+from aws_cdk import Duration, aws_sqs as sqs
+from aws_cdk.assertions import Match, Template
+
+from zacks_cdk_lib.patterns import QueueProcessor
+
+
+def test_queue_feeds_a_batched_consumer_with_a_dead_letter_queue(stack, code_path):
+    processor = QueueProcessor(
+        stack,
+        "Processor",
+        lambda_code_path=code_path,
+        lambda_props={"timeout": Duration.seconds(60)},
+        batch_size=50,
+        max_concurrency=5,
+        max_receive_count=4,
+    )
+    template = Template.from_stack(stack)
+
+    template.resource_count_is("AWS::SQS::Queue", 2)
+    template.has_resource_properties("AWS::SQS::Queue", {
+        "VisibilityTimeout": 361,
+        "RedrivePolicy": {
+            "maxReceiveCount": 4,
+            "deadLetterTargetArn": Match.any_value(),
+        },
+        "SqsManagedSseEnabled": True,
+    })
+    template.has_resource_properties("AWS::Lambda::EventSourceMapping", {
+        "BatchSize": 50,
+        "MaximumBatchingWindowInSeconds": 1,
+        "ScalingConfig": {"MaximumConcurrency": 5},
+        "FunctionResponseTypes": ["ReportBatchItemFailures"],
+    })
+    assert processor.dead_letter_queue is not None
+
+
+def test_aliased_consumer_is_subscribed_through_its_alias(stack, code_path):
+    QueueProcessor(
+        stack,
+        "Processor",
+        lambda_code_path=code_path,
+        lambda_props={"provisioned_concurrency": 1},
+    )
+    template = Template.from_stack(stack)
+
+    mapping = next(iter(template.find_resources("AWS::Lambda::EventSourceMapping").values()))
+    assert ":live" in json.dumps(mapping["Properties"]["FunctionName"])
+
+
+def test_queue_props_override_the_queue_defaults(stack, code_path):
+    QueueProcessor(
+        stack,
+        "Processor",
+        lambda_code_path=code_path,
+        queue_props={
+            "encryption": sqs.QueueEncryption.KMS_MANAGED,
+            "visibility_timeout": Duration.minutes(30),
+        },
+    )
+    template = Template.from_stack(stack)
+
+    template.has_resource_properties("AWS::SQS::Queue", {
+        "KmsMasterKeyId": "alias/aws/sqs",
+        "VisibilityTimeout": 1800,
+        "RedrivePolicy": Match.object_like({"maxReceiveCount": 3}),
+    })
+
+
+def test_visibility_timeout_is_capped_at_twelve_hours():
+    timeout = QueueProcessor.visibility_timeout_for(Duration.hours(3))
+    assert timeout.to_seconds() == 12 * 60 * 60
@@ -0,0 +1,79 @@
+from aws_cdk import (
+    aws_kms as kms,
+    Duration,
+)
+from aws_cdk.assertions import Match, Template
+
+from zacks_cdk_lib.storage import SecureS3Bucket
+
+
+def test_kms_buckets_use_a_bucket_key(stack):
+    key = kms.Key(stack, "Key")
+    SecureS3Bucket(stack, "Bucket", encryption_key=key)
+    template = Template.from_stack(stack)
+
+    template.has_resource_properties("AWS::S3::Bucket", {
+        "BucketEncryption": {"ServerSideEncryptionConfiguration": [
+            Match.object_like({"BucketKeyEnabled": True}),
+        ]},
+    })
+
+
+def test_s3_managed_buckets_have_no_bucket_key(stack):
+    SecureS3Bucket(stack, "Bucket")
+    template = Template.from_stack(stack)
+
+    template.has_resource_properties("AWS::S3::Bucket", {
+        "BucketEncryption": {"ServerSideEncryptionConfiguration": [
+            Match.object_like({"BucketKeyEnabled": Match.absent()}),
+        ]},
+        "AccelerateConfiguration": Match.absent(),
+        "MetricsConfigurations": Match.absent(),
+    })
+
+
+def test_transfer_options(stack):
+    bucket = SecureS3Bucket(
+        stack,
+        "Bucket",
+        transfer_acceleration=True,
+        abort_incomplete_multipart_upload_after=Duration.days(7),
+        intelligent_tiering_configurations=[{
+            "name": "Archive",
+            "archive_access_tier_time": Duration.days(90),
+        }],
+    )
+    template = Template.from_stack(stack)
+
+    assert bucket.transfer_acceleration_url is not None
+    template.has_resource_properties("AWS::S3::Bucket", {
+        "AccelerateConfiguration": {"AccelerationStatus": "Enabled"},
+        "LifecycleConfiguration": {"Rules": Match.array_with([
+            Match.object_like({
+                "Id": "AbortIncompleteMultipartUploads",
+                "AbortIncompleteMultipartUpload": {"DaysAfterInitiation": 7},
+            }),
+        ])},
+        "IntelligentTieringConfigurations": [Match.object_like({"Id": "Archive"})],
+    })
+
+
+def test_request_metrics_filters_get_distinct_ids(stack):
+    # Both prefixes slug to "logs-a"
+    SecureS3Bucket(stack, "Bucket", request_metrics_prefixes=["", "logs/a", "logs a"])
+    template = Template.from_stack(stack)
+
+    bucket = next(iter(template.find_resources("AWS::S3::Bucket").values()))
+    filters = bucket["Properties"]["MetricsConfigurations"]
+    ids = [metrics_filter["Id"] for metrics_filter in filters]
+    assert ids[0] == "EntireBucket"
+    assert "Prefix" not in filters[0]
+    assert len(set(ids)) == 3
+    assert all(len(filter_id) <= 64 for filter_id in ids)
+
+
+def test_metrics_filter_ids_are_stable_and_bounded():
+    prefix = "tenants/" + "x" * 200
+    assert SecureS3Bucket.metrics_filter_id(prefix) == SecureS3Bucket.metrics_filter_id(prefix)
+    assert len(SecureS3Bucket.metrics_filter_id(prefix)) <= 64
+    assert SecureS3Bucket.metrics_filter_id("logs/a").startswith("logs-a-")
@@ -0,0 +1,178 @@
+import json
+
+import pytest
+from aws_cdk import Duration
+from aws_cdk.assertions import Match, Template
+
+from zacks_cdk_lib.patterns import S3EventPipeline
+from zacks_cdk_lib.storage import SecureS3Bucket
+
+FILTERS = [
+    {"prefix": "uploads/", "suffix": ".csv"},
+    {"prefix": "uploads/", "suffix": ".json"},
+]
+
+
+def notification_configuration(template):
+    notifications = template.find_resources("Custom::S3BucketNotifications")
+    return next(iter(notifications.values()))["Properties"]["NotificationConfiguration"]
+
+
+def test_events_reach_the_queue_with_one_key_filter_per_entry(stack, code_path):
+    bucket = SecureS3Bucket(stack, "Bucket")
+    S3EventPipeline(stack, "Pipeline", bucket=bucket, lambda_code_path=code_path, filters=FILTERS)
+    template = Template.from_stack(stack)
+
+    configurations = notification_configuration(template)["QueueConfigurations"]
+    assert [
+        configuration["Filter"]["Key"]["FilterRules"] for configuration in configurations
+    ] == [
+        [{"Name": "suffix", "Value": ".csv"}, {"Name": "prefix", "Value": "uploads/"}],
+        [{"Name": "suffix", "Value": ".json"}, {"Name": "prefix", "Value": "uploads/"}],
+    ]
+    template.has_resource_properties("AWS::Lambda::Function", {
+        "Environment": {"Variables": {"BUCKET_NAME": Match.any_value()}},
+    })
+
+
+@pytest.mark.parametrize("filters", [
+    [{"prefix": "logs/"}, {"prefix": "logs/2024/"}],
+    [{"suffix": ".gz"}, {"prefix": "logs/", "suffix": "data.gz"}],
+    [{}, {"suffix": ".csv"}],
+])
+def test_overlapping_filters_are_rejected(stack, code_path, filters):
+    bucket = SecureS3Bucket(stack, "Bucket")
+    with pytest.raises(ValueError, match="overlap"):
+        S3EventPipeline(
+            stack, "Pipeline", bucket=bucket, lambda_code_path=code_path, filters=filters
+        )
+
+
+def test_queue_props_reach_the_event_queue(stack, code_path):
+    bucket = SecureS3Bucket(stack, "Bucket")
+    S3EventPipeline(
+        stack,
+        "Pipeline",
+        bucket=bucket,
+        lambda_code_path=code_path,
+        queue_props={"visibility_timeout": Duration.minutes(30)},
+    )
+    template = Template.from_stack(stack)
+
+    template.has_resource_properties("AWS::SQS::Queue", {"VisibilityTimeout": 1800})
+
+
+def test_sns_fan_out_uses_raw_delivery(stack, code_path):
+    bucket = SecureS3Bucket(stack, "Bucket")
+    pipeline = S3EventPipeline(
+        stack, "Pipeline", bucket=bucket, lambda_code_path=code_path, fan_out="sns"
+    )
+    template = Template.from_stack(stack)
+
+    assert pipeline.topic is not None
+    template.has_resource_properties("AWS::SNS::Subscription", {
+        "Protocol": "sqs",
+        "RawMessageDelivery": True,
+    })
+    assert "TopicConfigurations" in notification_configuration(template)
+
+
+def test_eventbridge_fan_out_matches_the_filters(stack, code_path):
+    bucket = SecureS3Bucket(stack, "Bucket")
+    S3EventPipeline(
+        stack,
+        "Pipeline",
+        bucket=bucket,
+        lambda_code_path=code_path,
+        fan_out="eventbridge",
+        filters=[{"prefix": "uploads/", "suffix": ".csv"}, {"suffix": ".json"}],
+    )
+    template = Template.from_stack(stack)
+
+    assert notification_configuration(template)["EventBridgeConfiguration"] == {}
+    template.has_resource_properties("AWS::Events::Rule", {
+        "EventPattern": {
+            "source": ["aws.s3"],
+            "detail-type": ["Object Created"],
+            "detail": Match.object_like({
+                "object": {"key": [{"wildcard": "uploads/*.csv"}, {"suffix": ".json"}]},
+            }),
+        },
+    })
+
+
+def test_eventbridge_catch_all_filter_matches_every_key(stack, code_path):
+    bucket = SecureS3Bucket(stack, "Bucket")
+    S3EventPipeline(
+        stack,
+        "Pipeline",
+        bucket=bucket,
+        lambda_code_path=code_path,
+        fan_out="eventbridge",
+        filters=[{"prefix": "a/"}, {}],
+    )
+    template = Template.from_stack(stack)
+
+    template.has_resource_properties("AWS::Events::Rule", {
+        "EventPattern": Match.object_like({
+            "detail": {"bucket": {"name": Match.any_value()}},
+        }),
+    })
+
+
+def test_eventbridge_wildcards_escape_literal_asterisks(stack, code_path):
+    bucket = SecureS3Bucket(stack, "Bucket")
+    S3EventPipeline(
+        stack,
+        "Pipeline",
+        bucket=bucket,
+        lambda_code_path=code_path,
+        fan_out="eventbridge",
+        filters=[{"prefix": "raw*/", "suffix": ".csv"}],
+    )
+    template = Template.from_stack(stack)
+
+    template.has_resource_properties("AWS::Events::Rule", {
+        "EventPattern": Match.object_like({
+            "detail": Match.object_like({"object": {"key": [{"wildcard": "raw\\*/*.csv"}]}}),
+        }),
+    })
+
+
+def test_unknown_fan_out_is_rejected(stack, code_path):
+    bucket = SecureS3Bucket(stack, "Bucket")
+    with pytest.raises(ValueError, match="fan_out"):
+        S3EventPipeline(
+            stack, "Pipeline", bucket=bucket, lambda_code_path=code_path, fan_out="kinesis"
+        )
+
+
+def test_backfill_runs_an_express_distributed_map(stack, code_path):
+    bucket = SecureS3Bucket(stack, "Bucket")
+    pipeline = S3EventPipeline(
+        stack,
+        "Pipeline",
+        bucket=bucket,
+        lambda_code_path=code_path,
+        backfill=True,
+        backfill_batch_size=250,
+    )
+    template = Template.from_stack(stack)
+
+    state_machine = next(iter(template.find_resources("AWS::StepFunctions::StateMachine").values()))
+    definition = json.dumps(state_machine["Properties"]["DefinitionString"])
+    assert '\\"ExecutionType\\":\\"EXPRESS\\"' in definition
+    assert '\\"MaxItemsPerBatch\\":250' in definition
+    template.has_resource_properties("AWS::Lambda::Function", {
+        "Environment": {"Variables": Match.object_like({
+            "BACKFILL_STATE_MACHINE_ARN": Match.any_value(),
+        })},
+    })
+    assert pipeline.backfill_state_machine is not None
+
+
+def test_grant_start_backfill_needs_a_backfill(stack, code_path):
+    bucket = SecureS3Bucket(stack, "Bucket")
+    pipeline = S3EventPipeline(stack, "Pipeline", bucket=bucket, lambda_code_path=code_path)
+    with pytest.raises(ValueError, match="no backfill"):
+        pipeline.grant_start_backfill(bucket.bucket)
@@ -0,0 +1,299 @@
+import json
+
+import pytest
+from aws_cdk import Duration
+from aws_cdk.assertions import Match, Template
+
+from zacks_cdk_lib.patterns import ServerlessApi
+
+
+def test_api_key_usage_plan_keeps_the_default_throttle(stack, code_path):
+    ServerlessApi(stack, "Api", lambda_code_path=code_path, require_api_key=True)
+    template = Template.from_stack(stack)
+
+    template.has_resource_properties("AWS::ApiGateway::UsagePlan", {
+        "Throttle": {"RateLimit": 10, "BurstLimit": 20},
+    })
+
+
+def test_rest_api_throttling_caching_and_compression(stack, code_path):
+    ServerlessApi(
+        stack,
+        "Api",
+        lambda_code_path=code_path,
+        require_api_key=True,
+        throttle={"rate_limit": 500, "burst_limit": 1000},
+        route_throttles={"POST /orders": {"rate_limit": 50, "burst_limit": 100}},
+        cached_routes={
+            "GET /items/{id}": {
+                "ttl": Duration.minutes(1),
+                "cache_key_parameters": ["querystring.view"],
+            },
+        },
+        minimum_compression_size=1024,
+    )
+    template = Template.from_stack(stack)
+
+    template.has_resource_properties("AWS::ApiGateway::RestApi", {
+        "MinimumCompressionSize": 1024,
+    })
+    template.has_resource_properties("AWS::ApiGateway::Stage", {
+        "CacheClusterEnabled": True,
+        "CacheClusterSize": "0.5",
+        "MethodSettings": Match.array_with([
+            Match.object_like({
+                "HttpMethod": "*",
+                "ResourcePath": "/*",
+                "ThrottlingRateLimit": 500,
+                "ThrottlingBurstLimit": 1000,
+            }),
+            Match.object_like({
+                "HttpMethod": "POST",
+                "ResourcePath": "/~1orders",
+                "ThrottlingRateLimit": 50,
+                "ThrottlingBurstLimit": 100,
+            }),
+            Match.object_like({
+                "HttpMethod": "GET",
+                "ResourcePath": "/~1items~1{id}",
+                "CachingEnabled": True,
+                "CacheTtlInSeconds": 60,
+            }),
+        ]),
+    })
+    template.has_resource_properties("AWS::ApiGateway::Method", {
+        "HttpMethod": "GET",
+        "RequestParameters": {
+            "method.request.path.id": True,
+            "method.request.querystring.view": False,
+        },
+        "Integration": Match.object_like({
+            "CacheKeyParameters": ["method.request.path.id", "method.request.querystring.view"],
+        }),
+    })
+    template.has_resource_properties("AWS::ApiGateway::UsagePlan", {
+        "Throttle": {"RateLimit": 500, "BurstLimit": 1000},
+        "ApiStages": [Match.object_like({
+            "Throttle": {"/orders/POST": {"RateLimit": 50, "BurstLimit": 100}},
+        })],
+    })
+
+
+def test_http_api_throttles_the_stage_and_routes(stack, code_path):
+    ServerlessApi(
+        stack,
+        "Api",
+        lambda_code_path=code_path,
+        api_type="http",
+        throttle={"rate_limit": 500, "burst_limit": 1000},
+        route_throttles={"POST /orders": {"rate_limit": 50, "burst_limit": 100}},
+    )
+    template = Template.from_stack(stack)
+
+    template.has_resource_properties("AWS::ApiGatewayV2::Route", {"RouteKey": "POST /orders"})
+    template.has_resource_properties("AWS::ApiGatewayV2::Stage", {
+        "DefaultRouteSettings": {"ThrottlingRateLimit": 500, "ThrottlingBurstLimit": 1000},
+        "RouteSettings": {
+            "POST /orders": {"ThrottlingRateLimit": 50, "ThrottlingBurstLimit": 100},
+        },
+    })
+    template.has_resource_properties("AWS::ApiGatewayV2::Integration", {
+        "PayloadFormatVersion": "1.0",
+    })
+
+
+@pytest.mark.parametrize("options, message", [
+    ({"api_type": "websocket"}, "api_type must be one of"),
+    ({"api_type": "http", "require_api_key": True}, "HTTP APIs do not support"),
+    ({"api_type": "http", "cached_routes": {"GET /items": {}}}, "HTTP APIs do not support"),
+])
+def test_invalid_api_options_are_rejected(stack, code_path, options, message):
+    with pytest.raises(ValueError, match=message):
+        ServerlessApi(stack, "Api", lambda_code_path=code_path, **options)
+
+
+def test_split_route():
+    assert ServerlessApi.split_route("post /orders/") == ("POST", "/orders")
+    assert ServerlessApi.split_route("/items/{id}") == ("GET", "/items/{id}")
+
+
+def test_edge_cache_behaviors(stack, code_path):
+    api = ServerlessApi(
+        stack,
+        "Api",
+        lambda_code_path=code_path,
+        require_api_key=True,
+        edge_cache=True,
+        edge_forward_headers=["Accept-Language"],
+        edge_cache_behaviors={
+            "/items/*": {"ttl": Duration.minutes(10), "query_strings": ["page"]},
+        },
+    )
+    template = Template.from_stack(stack)
+
+    assert api.edge_cache is not None
+    assert api.distribution is api.edge_cache.distribution
+    template.has_resource_properties("AWS::CloudFront::Distribution", {
+        "DistributionConfig": Match.object_like({
+            "HttpVersion": "http2and3",
+            "CacheBehaviors": [Match.object_like({
+                "PathPattern": "/items/*",
+                "Compress": True,
+                "CachedMethods": ["GET", "HEAD", "OPTIONS"],
+            })],
+        }),
+    })
+    template.has_resource_properties("AWS::CloudFront::CachePolicy", {
+        "CachePolicyConfig": Match.object_like({
+            "DefaultTTL": 600,
+            "ParametersInCacheKeyAndForwardedToOrigin": Match.object_like({
+                "EnableAcceptEncodingBrotli": True,
+                "HeadersConfig": {
+                    "HeaderBehavior": "whitelist",
+                    "Headers": ["Authorization", "x-api-key"],
+                },
+                "QueryStringsConfig": {
+                    "QueryStringBehavior": "whitelist",
+                    "QueryStrings": ["page"],
+                },
+            }),
+        }),
+    })
+    template.has_resource_properties("AWS::CloudFront::OriginRequestPolicy", {
+        "OriginRequestPolicyConfig": Match.object_like({
+            "HeadersConfig": {
+                "HeaderBehavior": "whitelist",
+                "Headers": ["Accept-Language"],
+            },
+        }),
+    })
+    template.resource_count_is("AWS::WAFv2::WebACL", 0)
+
+
+def distribution_origin(template):
+    distribution = next(iter(template.find_resources("AWS::CloudFront::Distribution").values()))
+    return distribution["Properties"]["DistributionConfig"]["Origins"][0]
+
+
+def test_origin_shield_is_opt_in(stack, code_path):
+    ServerlessApi(stack, "Api", lambda_code_path=code_path, api_type="http", edge_cache=True)
+    ServerlessApi(
+        stack,
+        "Shielded",
+        lambda_code_path=code_path,
+        edge_cache=True,
+        origin_shield_region="us-west-2",
+    )
+    template = Template.from_stack(stack)
+
+    origins = [
+        distribution["Properties"]["DistributionConfig"]["Origins"][0]
+        for distribution in template.find_resources("AWS::CloudFront::Distribution").values()
+    ]
+    assert [origin["OriginShield"] for origin in origins] == [
+        {"Enabled": False},
+        {"Enabled": True, "OriginShieldRegion": "us-west-2"},
+    ]
+
+
+def test_origin_verify_blocks_requests_that_skip_cloudfront(stack, code_path):
+    api = ServerlessApi(
+        stack, "Api", lambda_code_path=code_path, edge_cache=True, origin_verify=True
+    )
+    template = Template.from_stack(stack)
+
+    assert api.origin_verify_secret is not None
+    template.has_resource_properties("AWS::WAFv2::WebACL", {
+        "Scope": "REGIONAL",
+        "DefaultAction": {"Block": {}},
+        "Rules": [Match.object_like({
+            "Action": {"Allow": {}},
+            "Statement": {"ByteMatchStatement": Match.object_like({
+                "FieldToMatch": {"SingleHeader": {"Name": "x-origin-verify"}},
+                "PositionalConstraint": "EXACTLY",
+            })},
+        })],
+    })
+    template.resource_count_is("AWS::WAFv2::WebACLAssociation", 1)
+    origin = distribution_origin(template)
+    assert [header["HeaderName"] for header in origin["OriginCustomHeaders"]] == [
+        "X-Origin-Verify"
+    ]
+
+
+@pytest.mark.parametrize("options", [
+    {"origin_verify": True},
+    {"origin_verify": True, "edge_cache": True, "api_type": "http"},
+])
+def test_origin_verify_needs_a_rest_edge_cache(stack, code_path, options):
+    with pytest.raises(ValueError, match="origin_verify needs edge_cache"):
+        ServerlessApi(stack, "Api", lambda_code_path=code_path, **options)
+
+
+def test_async_writes_go_through_sqs_to_the_batch_writer(stack, code_path):
+    api = ServerlessApi(
+        stack,
+        "Api",
+        lambda_code_path=code_path,
+        table_props={"write_shards": 4},
+        async_write_routes=["POST /items", "DELETE /items/{id}"],
+        async_batch_size=50,
+    )
+    template = Template.from_stack(stack)
+
+    assert api.async_writer is api.async_writes.processor
+    template.has_resource_properties("AWS::ApiGateway::Method", {
+        "HttpMethod": "POST",
+        "Integration": Match.object_like({
+            "Type": "AWS",
+            "PassthroughBehavior": "NEVER",
+            "IntegrationResponses": Match.array_with([
+                Match.object_like({"StatusCode": "202"}),
+            ]),
+        }),
+    })
+    template.has_resource_properties("AWS::Lambda::EventSourceMapping", {
+        "BatchSize": 50,
+        "FunctionResponseTypes": ["ReportBatchItemFailures"],
+    })
+    template.has_resource_properties("AWS::Lambda::Function", {
+        "Environment": {"Variables": Match.object_like({
+            "PARTITION_KEY": "id",
+            "SHARD_COUNT": "4",
+        })},
+    })
+
+
+def test_async_writes_straight_to_dynamodb(stack, code_path):
+    api = ServerlessApi(
+        stack,
+        "Api",
+        lambda_code_path=code_path,
+        async_write_routes=["PUT /items/{id}"],
+        async_write_target="dynamodb",
+        async_item_attributes={"name": "S", "count": "N"},
+    )
+    template = Template.from_stack(stack)
+
+    assert api.async_writer is None
+    template.resource_count_is("AWS::SQS::Queue", 0)
+    method = next(
+        resource for resource in template.find_resources("AWS::ApiGateway::Method").values()
+        if resource["Properties"]["HttpMethod"] == "PUT"
+    )
+    integration = json.dumps(method["Properties"]["Integration"])
+    assert "dynamodb:action/PutItem" in integration
+    assert "$input.params().path.get('id')" in integration
+    assert '\\"count\\": {\\"N\\": \\"$input.path(' in integration
+
+
+@pytest.mark.parametrize("options, message", [
+    ({"async_write_target": "kinesis"}, "async_write_target must be one of"),
+    ({"async_write_target": "dynamodb", "table_props": {"write_shards": 4}}, "write sharding"),
+    ({"api_type": "http"}, "need api_type='rest'"),
+])
+def test_invalid_async_write_options_are_rejected(stack, code_path, options, message):
+    with pytest.raises(ValueError, match=message):
+        ServerlessApi(
+            stack, "Api", lambda_code_path=code_path, async_write_routes=["POST /items"], **options
+        )
@@ -0,0 +1,121 @@
+import json
+import os
+
+from aws_cdk import Duration, Stage
+from aws_cdk.assertions import Match, Template
+
+from zacks_cdk_lib.patterns import StaticWebsite
+from zacks_cdk_lib.patterns.static_website import IMMUTABLE_CACHE_CONTROL
+
+
+def test_distribution_serves_http3_with_compression(stack):
+    StaticWebsite(stack, "Site", html_ttl=Duration.minutes(2))
+    template = Template.from_stack(stack)
+
+    template.has_resource_properties("AWS::CloudFront::Distribution", {
+        "DistributionConfig": Match.object_like({
+            "HttpVersion": "http2and3",
+            "DefaultRootObject": "index.html",
+            "DefaultCacheBehavior": Match.object_like({
+                "Compress": True,
+                "ViewerProtocolPolicy": "redirect-to-https",
+            }),
+        }),
+    })
+    template.has_resource_properties("AWS::CloudFront::CachePolicy", {
+        "CachePolicyConfig": Match.object_like({
+            "DefaultTTL": 120,
+            "MinTTL": 0,
+            "ParametersInCacheKeyAndForwardedToOrigin": Match.object_like({
+                "EnableAcceptEncodingBrotli": True,
+                "EnableAcceptEncodingGzip": True,
+            }),
+        }),
+    })
+
+
+def test_origin_shield_is_off_by_default(stack):
+    StaticWebsite(stack, "Site")
+    template = Template.from_stack(stack)
+
+    template.has_resource_properties("AWS::CloudFront::Distribution", {
+        "DistributionConfig": Match.object_like({
+            "Origins": [Match.object_like({"OriginShield": {"Enabled": False}})],
+        }),
+    })
+
+
+def test_origin_shield_in_the_given_region(stack):
+    StaticWebsite(stack, "Site", origin_shield_region="us-west-2")
+    template = Template.from_stack(stack)
+
+    template.has_resource_properties("AWS::CloudFront::Distribution", {
+        "DistributionConfig": Match.object_like({
+            "Origins": [Match.object_like({
+                "OriginShield": {"Enabled": True, "OriginShieldRegion": "us-west-2"},
+            })],
+        }),
+    })
+
+
+def test_path_patterns_get_their_own_cache_behaviors(stack):
+    site = StaticWebsite(
+        stack,
+        "Site",
+        immutable_asset_patterns=["/assets/*"],
+        cache_behaviors={"/images/*": {"ttl": Duration.hours(1)}},
+    )
+    template = Template.from_stack(stack)
+
+    template.has_resource_properties("AWS::CloudFront::Distribution", {
+        "DistributionConfig": Match.object_like({
+            "CacheBehaviors": [
+                Match.object_like({"PathPattern": "/assets/*", "Compress": True}),
+                Match.object_like({"PathPattern": "/images/*", "Compress": True}),
+            ],
+        }),
+    })
+    template.has_resource_properties("AWS::CloudFront::CachePolicy", {
+        "CachePolicyConfig": Match.object_like({"DefaultTTL": 365 * 24 * 3600}),
+    })
+    template.has_resource_properties("AWS::CloudFront::CachePolicy", {
+        "CachePolicyConfig": Match.object_like({"DefaultTTL": 3600, "MaxTTL": 365 * 24 * 3600}),
+    })
+
+    assert site.cache_control_for("assets/app.3f2a.js") == IMMUTABLE_CACHE_CONTROL
+    assert site.cache_control_for("images/logo.png") == "public, max-age=3600"
+    assert site.cache_control_for("index.html") == site.html_cache_control
+    assert site.html_cache_control == "public, max-age=0, s-maxage=300, must-revalidate"
+
+
+def test_incremental_deploy_keeps_state_private_and_polls_invalidations(stack, tmp_path):
+    (tmp_path / "index.html").write_text("<h1>Hello</h1>")
+    site = StaticWebsite(
+        stack, "Site", website_content_path=str(tmp_path), incremental_deploy=True
+    )
+    template = Template.from_stack(stack)
+
+    # The deployed manifest lives outside the bucket CloudFront serves
+    resources = template.find_resources("AWS::CloudFormation::CustomResource")
+    (deployment,) = resources.values()
+    properties = deployment["Properties"]
+    assert properties["DeployedManifestKey"] == "deploy-manifest.json"
+    assert properties["StateBucket"] != properties["DestinationBucket"]
+    assert properties["StateBucket"]["Ref"].startswith("SiteDeployStateBucket")
+
+    # The deploy submits invalidations; a second handler polls them to completion
+    template.has_resource_properties("AWS::Lambda::Function", {
+        "Handler": "index.is_complete",
+    })
+    template.has_resource_properties("AWS::IAM::Policy", {
+        "PolicyDocument": {"Statement": Match.array_with([
+            Match.object_like({"Action": "cloudfront:GetInvalidation"}),
+        ])},
+    })
+
+    # The manifest is written into the cloud assembly, not a stray temporary directory
+    asset_outdir = Stage.of(stack).asset_outdir
+    manifest_path = os.path.join(asset_outdir, f"manifest.{site.node.addr}.json")
+    with open(manifest_path) as fp:
+        assert json.load(fp) == site.content_manifest
+    assert list(site.content_manifest) == ["index.html"]
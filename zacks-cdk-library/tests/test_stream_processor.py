@@ -0,0 +1,90 @@
+import json
+
+import pytest
+from aws_cdk import Duration, aws_dynamodb as dynamodb
+from aws_cdk.assertions import Match, Template
+
+from zacks_cdk_lib.database import EnhancedDynamoTable
+from zacks_cdk_lib.patterns import DynamoStreamProcessor
+
+PARTITION_KEY = dynamodb.Attribute(name="pk", type=dynamodb.AttributeType.STRING)
+
+
+@pytest.fixture
+def table(stack):
+    return EnhancedDynamoTable(
+        stack,
+        "Table",
+        partition_key=PARTITION_KEY,
+        stream=dynamodb.StreamViewType.NEW_AND_OLD_IMAGES,
+    )
+
+
+def test_stream_consumer_settings(stack, table, code_path):
+    DynamoStreamProcessor(
+        stack,
+        "Processor",
+        table=table,
+        lambda_code_path=code_path,
+        parallelization_factor=4,
+        tumbling_window=Duration.seconds(30),
+    )
+    template = Template.from_stack(stack)
+
+    template.has_resource_properties("AWS::Lambda::EventSourceMapping", {
+        "BatchSize": 100,
+        "ParallelizationFactor": 4,
+        "BisectBatchOnFunctionError": True,
+        "MaximumRetryAttempts": 3,
+        "MaximumRecordAgeInSeconds": 3600,
+        "TumblingWindowInSeconds": 30,
+        "FunctionResponseTypes": ["ReportBatchItemFailures"],
+        "DestinationConfig": {"OnFailure": {"Destination": Match.any_value()}},
+    })
+    template.has_resource_properties("AWS::CloudWatch::Alarm", {
+        "MetricName": "IteratorAge",
+        "Threshold": 60000,
+    })
+
+
+def test_partial_batch_responses_can_be_turned_off(stack, table, code_path):
+    DynamoStreamProcessor(
+        stack,
+        "Processor",
+        table=table,
+        lambda_code_path=code_path,
+        report_batch_item_failures=False,
+    )
+    template = Template.from_stack(stack)
+
+    template.has_resource_properties("AWS::Lambda::EventSourceMapping", {
+        "FunctionResponseTypes": Match.absent(),
+    })
+
+
+def test_event_names_narrow_every_filter(stack, table, code_path):
+    DynamoStreamProcessor(
+        stack,
+        "Processor",
+        table=table,
+        lambda_code_path=code_path,
+        event_names=["INSERT", "MODIFY"],
+        filters=[{"dynamodb": {"NewImage": {"type": {"S": ["order"]}}}}],
+    )
+    template = Template.from_stack(stack)
+
+    mapping = next(iter(template.find_resources("AWS::Lambda::EventSourceMapping").values()))
+    patterns = [
+        json.loads(item["Pattern"])
+        for item in mapping["Properties"]["FilterCriteria"]["Filters"]
+    ]
+    assert patterns == [{
+        "dynamodb": {"NewImage": {"type": {"S": ["order"]}}},
+        "eventName": ["INSERT", "MODIFY"],
+    }]
+
+
+def test_tables_without_a_stream_are_rejected(stack, code_path):
+    table = EnhancedDynamoTable(stack, "Table", partition_key=PARTITION_KEY)
+    with pytest.raises(ValueError, match="has no stream"):
+        DynamoStreamProcessor(stack, "Processor", table=table, lambda_code_path=code_path)
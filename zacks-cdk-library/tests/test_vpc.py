@@ -0,0 +1,139 @@
+from aws_cdk import aws_kms as kms
+from aws_cdk.assertions import Match, Template
+
+from zacks_cdk_lib.networking import StandardVpc
+from zacks_cdk_lib.networking.vpc import (
+    DEFAULT_INTERFACE_ENDPOINTS,
+    FLOW_LOG_KEY_ACTIONS,
+    PARQUET_SERDE,
+)
+from zacks_cdk_lib.storage import SecureS3Bucket
+
+
+def test_endpoint_profile_keeps_service_traffic_off_nat(stack):
+    StandardVpc(stack, "Vpc", endpoint_profile=True)
+    template = Template.from_stack(stack)
+
+    template.resource_properties_count_is("AWS::EC2::VPCEndpoint", {
+        "VpcEndpointType": "Gateway",
+    }, 2)
+    template.resource_properties_count_is("AWS::EC2::VPCEndpoint", {
+        "VpcEndpointType": "Interface",
+        "PrivateDnsEnabled": True,
+    }, len(DEFAULT_INTERFACE_ENDPOINTS))
+
+    # Every interface endpoint shares one security group that only allows HTTPS
+    template.resource_count_is("AWS::EC2::SecurityGroup", 1)
+    template.has_resource_properties("AWS::EC2::SecurityGroup", {
+        "SecurityGroupIngress": [Match.object_like({"FromPort": 443, "ToPort": 443})],
+    })
+
+
+def test_interface_endpoints_without_the_profile(stack):
+    StandardVpc(stack, "Vpc", interface_endpoints=["sqs"])
+    template = Template.from_stack(stack)
+
+    template.resource_count_is("AWS::EC2::VPCEndpoint", 1)
+    template.has_resource_properties("AWS::EC2::VPCEndpoint", {
+        "ServiceName": "com.amazonaws.us-east-1.sqs",
+    })
+
+
+def test_nat_gateway_per_az(stack):
+    StandardVpc(stack, "Vpc", max_azs=3, nat_gateway_per_az=True)
+    Template.from_stack(stack).resource_count_is("AWS::EC2::NatGateway", 3)
+
+
+def test_single_nat_gateway_by_default(stack):
+    StandardVpc(stack, "Vpc", max_azs=3)
+    template = Template.from_stack(stack)
+
+    template.resource_count_is("AWS::EC2::NatGateway", 1)
+    template.resource_count_is("AWS::EC2::VPCEndpoint", 0)
+
+
+def test_dual_stack_routes_private_ipv6_through_an_egress_only_gateway(stack):
+    StandardVpc(stack, "Vpc", dual_stack=True, endpoint_profile=True, interface_endpoints=["sts"])
+    template = Template.from_stack(stack)
+
+    template.resource_count_is("AWS::EC2::VPCCidrBlock", 1)
+    template.resource_count_is("AWS::EC2::EgressOnlyInternetGateway", 1)
+    template.has_resource_properties("AWS::EC2::Route", {
+        "DestinationIpv6CidrBlock": "::/0",
+        "EgressOnlyInternetGatewayId": Match.any_value(),
+    })
+    template.has_resource_properties("AWS::EC2::SecurityGroup", {
+        "SecurityGroupIngress": Match.array_with([
+            Match.object_like({"CidrIpv6": Match.any_value(), "FromPort": 443}),
+        ]),
+    })
+
+
+def test_flow_logs_land_in_s3_as_partitioned_parquet(stack):
+    bucket = SecureS3Bucket(stack, "Logs")
+    vpc = StandardVpc(stack, "Vpc", flow_log_bucket=bucket, flow_log_fields=["srcaddr", "bytes"])
+    template = Template.from_stack(stack)
+
+    template.has_resource_properties("AWS::EC2::FlowLog", {
+        "LogDestinationType": "s3",
+        "LogFormat": "${srcaddr} ${bytes}",
+        "MaxAggregationInterval": 60,
+        "DestinationOptions": {
+            "fileFormat": "parquet",
+            "hiveCompatiblePartitions": True,
+            "perHourPartition": True,
+        },
+    })
+    template.resource_count_is("AWS::Glue::Database", 1)
+    template.has_resource_properties("AWS::Glue::Table", {
+        "TableInput": Match.object_like({
+            "Name": vpc.flow_log_table_name,
+            "PartitionKeys": [
+                {"Name": name, "Type": "string"} for name in ("year", "month", "day", "hour")
+            ],
+            "StorageDescriptor": Match.object_like({
+                "Columns": [
+                    {"Name": "srcaddr", "Type": "string"},
+                    {"Name": "bytes", "Type": "bigint"},
+                ],
+                "SerdeInfo": {"SerializationLibrary": PARQUET_SERDE},
+            }),
+        }),
+    })
+
+
+def test_flow_logs_can_use_an_existing_glue_database(stack):
+    bucket = SecureS3Bucket(stack, "Logs")
+    vpc = StandardVpc(stack, "Vpc", flow_log_bucket=bucket, flow_log_database_name="network")
+    template = Template.from_stack(stack)
+
+    template.resource_count_is("AWS::Glue::Database", 0)
+    template.has_resource_properties("AWS::Glue::Table", {"DatabaseName": "network"})
+    assert vpc.flow_log_database_name == "network"
+
+
+def test_flow_log_delivery_can_use_the_bucket_key(stack):
+    key = kms.Key(stack, "Key")
+    bucket = SecureS3Bucket(stack, "Logs", encryption_key=key)
+    StandardVpc(stack, "Vpc", flow_log_bucket=bucket)
+    template = Template.from_stack(stack)
+
+    template.has_resource_properties("AWS::KMS::Key", {
+        "KeyPolicy": {"Statement": Match.array_with([
+            Match.object_like({
+                "Principal": {"Service": "delivery.logs.amazonaws.com"},
+                "Action": FLOW_LOG_KEY_ACTIONS,
+                "Effect": "Allow",
+            }),
+        ])},
+    })
+
+
+def test_flow_logs_go_to_cloudwatch_without_a_bucket(stack):
+    StandardVpc(stack, "Vpc")
+    template = Template.from_stack(stack)
+
+    template.has_resource_properties("AWS::EC2::FlowLog", {
+        "LogDestinationType": "cloud-watch-logs",
+    })
+    template.resource_count_is("AWS::Glue::Table", 0)
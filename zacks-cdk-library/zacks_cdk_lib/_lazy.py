@@ -0,0 +1,25 @@
+import importlib
+
+
+def lazy_exports(package: str, exports: dict):
+    """
+    Module __getattr__ and __dir__ that import each export on first access.
+    
+    exports maps a public name to the submodule defining it, relative to the
+    package. Importing a subpackage then only loads the jsii modules of the
+    constructs that are actually used.
+    """
+    namespace = importlib.import_module(package).__dict__
+    
+    def __getattr__(name):
+        if name not in exports:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        value = getattr(importlib.import_module(exports[name], package), name)
+        # Cache on the package so later lookups skip __getattr__
+        namespace[name] = value
+        return value
+    
+    def __dir__():
+        return sorted(set(namespace) | set(exports))
+    
+    return __getattr__, __dir__
\ No newline at end of file
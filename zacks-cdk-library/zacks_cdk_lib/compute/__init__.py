@@ -1,4 +1,33 @@
-from .lambda_function import LambdaFunction
-from .ec2_instance import StandardEC2Instance
+from typing import TYPE_CHECKING
 
-__all__ = ['LambdaFunction', 'StandardEC2Instance']
\ No newline at end of file
+from .._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .asset_cache import AssetFingerprintCache
+    from .dependency_layer import DependencyLayer
+    from .lambda_function import LambdaFunction
+    from .ec2_instance import StandardEC2Instance
+    from .auto_scaling_group import StandardAutoScalingGroup
+    from .golden_ami_pipeline import GoldenAmiPipeline
+    from .power_tuning import LambdaPowerTuner
+
+__all__ = [
+    'LambdaFunction',
+    'StandardEC2Instance',
+    'StandardAutoScalingGroup',
+    'GoldenAmiPipeline',
+    'LambdaPowerTuner',
+    'AssetFingerprintCache',
+    'DependencyLayer',
+]
+
+# Constructs are imported on first access, so only the jsii modules in use get loaded
+__getattr__, __dir__ = lazy_exports(__name__, {
+    'AssetFingerprintCache': '.asset_cache',
+    'DependencyLayer': '.dependency_layer',
+    'LambdaFunction': '.lambda_function',
+    'StandardEC2Instance': '.ec2_instance',
+    'StandardAutoScalingGroup': '.auto_scaling_group',
+    'GoldenAmiPipeline': '.golden_ami_pipeline',
+    'LambdaPowerTuner': '.power_tuning',
+})
\ No newline at end of file
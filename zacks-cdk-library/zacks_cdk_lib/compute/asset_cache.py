@@ -0,0 +1,209 @@
+import hashlib
+import json
+import os
+import shutil
+import stat
+
+from constructs import Construct
+from aws_cdk import (
+    aws_lambda as _lambda,
+    AssetHashType,
+    Stage,
+)
+
+# Context key CDK uses to skip staging (e.g. when running under SAM)
+DISABLE_ASSET_STAGING_CONTEXT = "aws:cdk:disable-asset-staging"
+
+# File CDK always excludes from staged assets
+EXCLUDED_FILES = (".is_custom_resource",)
+
+
+class AssetFingerprintCache:
+    """
+    An on-disk cache of Lambda code asset hashes keyed by file metadata.
+    
+    Features:
+    - Content hash reused while relative paths, modes, mtimes, sizes and inodes are unchanged
+    - Staged copy kept in the cache and hard-linked into the cloud assembly
+    - Staged files identical to what Code.from_asset copies
+    - Safe to share one cache between every LambdaFunction in an app
+    """
+    
+    def __init__(self, cache_dir: str = None):
+        self.cache_dir = os.path.abspath(
+            cache_dir
+            or os.environ.get("ZACKS_CDK_ASSET_CACHE")
+            or os.path.join(".cdk.staging", "asset-cache")
+        )
+        self.index_path = os.path.join(self.cache_dir, "fingerprints.json")
+        self._index = self._load_index()
+        self._resolved = {}
+    
+    def code_from_asset(self, scope: Construct, path: str) -> _lambda.Code:
+        """Return Lambda code for the given directory, reusing cached hashes and staging"""
+        source = os.path.abspath(path)
+        
+        # Single files (e.g. pre-built zips) are cheap to hash, leave them to CDK
+        if not os.path.isdir(source):
+            return _lambda.Code.from_asset(path)
+        
+        if source not in self._resolved:
+            self._resolved[source] = self._fingerprint(source)
+        digest = self._resolved[source]
+        
+        # Pre-populate the cloud assembly so CDK finds the asset already staged
+        stage = Stage.of(scope)
+        if stage is not None and not scope.node.try_get_context(DISABLE_ASSET_STAGING_CONTEXT):
+            staged_path = os.path.join(stage.asset_outdir, f"asset.{self.asset_hash(digest)}")
+            if not os.path.exists(staged_path):
+                _link_tree(self._staged_copy(digest), staged_path)
+        
+        return _lambda.Code.from_asset(
+            path,
+            asset_hash=digest,
+            asset_hash_type=AssetHashType.CUSTOM,
+        )
+    
+    @staticmethod
+    def asset_hash(digest: str) -> str:
+        """The asset hash CDK derives from a custom hash"""
+        return hashlib.sha256(digest.encode("utf-8")).hexdigest()
+    
+    def _fingerprint(self, source: str) -> str:
+        """Return the content digest of a directory, hashing only when its metadata changed"""
+        entries = _walk(source)
+        stat_key = _stat_key(entries)
+        
+        cached = self._index.get(source)
+        if cached and cached["stat_key"] == stat_key and os.path.isdir(
+            self._staged_copy(cached["digest"])
+        ):
+            return cached["digest"]
+        
+        digest = _content_digest(entries)
+        staged_copy = self._staged_copy(digest)
+        if not os.path.isdir(staged_copy):
+            _stage(entries, staged_copy)
+        
+        # Drop the staged copy of the previous content unless another source shares it
+        if cached and cached["digest"] != digest:
+            self._index.pop(source)
+            if all(entry["digest"] != cached["digest"] for entry in self._index.values()):
+                shutil.rmtree(self._staged_copy(cached["digest"]), ignore_errors=True)
+        
+        self._index[source] = {"stat_key": stat_key, "digest": digest}
+        self._save_index()
+        return digest
+    
+    def _staged_copy(self, digest: str) -> str:
+        return os.path.join(self.cache_dir, "staged", f"asset.{self.asset_hash(digest)}")
+    
+    def _load_index(self) -> dict:
+        try:
+            with open(self.index_path) as fp:
+                return json.load(fp)
+        except (OSError, ValueError):
+            return {}
+    
+    def _save_index(self):
+        os.makedirs(self.cache_dir, exist_ok=True)
+        temp_path = f"{self.index_path}.{os.getpid()}"
+        with open(temp_path, "w") as fp:
+            json.dump(self._index, fp, indent=1, sort_keys=True)
+        os.replace(temp_path, self.index_path)
+
+
+def _walk(root: str) -> list:
+    """
+    List the entries CDK would stage for a directory, in a stable order.
+    
+    Symlinks pointing inside the directory are kept as relative links and
+    external symlinks are followed, matching CDK's default copy behaviour.
+    """
+    real_root = os.path.realpath(root)
+    entries = []
+    
+    def visit(directory, rel_dir):
+        for name in sorted(os.listdir(directory)):
+            if name in EXCLUDED_FILES:
+                continue
+            path = os.path.join(directory, name)
+            rel = os.path.join(rel_dir, name) if rel_dir else name
+            if os.path.islink(path):
+                target = os.path.realpath(path)
+                if target == real_root or target.startswith(real_root + os.sep):
+                    link = os.path.relpath(target, os.path.dirname(os.path.join(real_root, rel)))
+                    entries.append((rel, "link", link, os.lstat(path)))
+                    continue
+            st = os.stat(path)
+            if stat.S_ISDIR(st.st_mode):
+                entries.append((rel, "dir", None, st))
+                visit(path, rel)
+            else:
+                entries.append((rel, "file", path, st))
+    
+    visit(root, "")
+    return entries
+
+
+def _stat_key(entries: list) -> str:
+    """Hash the metadata of every entry without reading file contents"""
+    digest = hashlib.sha256()
+    for rel, kind, target, st in entries:
+        link = target if kind == "link" else ""
+        # The mode is part of the content digest, and chmod leaves the mtime alone
+        fields = (rel, kind, link, st.st_mode, st.st_size, st.st_mtime_ns, st.st_ino)
+        digest.update("\0".join(str(field) for field in fields).encode("utf-8") + b"\n")
+    return digest.hexdigest()
+
+
+def _content_digest(entries: list) -> str:
+    """Hash the paths, modes and contents of every entry"""
+    digest = hashlib.sha256()
+    for rel, kind, target, st in entries:
+        digest.update(f"{rel}\0{kind}\0".encode("utf-8"))
+        if kind == "file":
+            digest.update(f"{stat.S_IMODE(st.st_mode):o}\0".encode("utf-8"))
+            with open(target, "rb") as fp:
+                for chunk in iter(lambda: fp.read(1024 * 1024), b""):
+                    digest.update(chunk)
+        elif kind == "link":
+            digest.update(target.encode("utf-8"))
+        digest.update(b"\n")
+    return digest.hexdigest()
+
+
+def _stage(entries: list, destination: str):
+    """Copy the walked entries into a new directory"""
+    temp_path = f"{destination}.{os.getpid()}.tmp"
+    shutil.rmtree(temp_path, ignore_errors=True)
+    os.makedirs(temp_path)
+    for rel, kind, target, st in entries:
+        path = os.path.join(temp_path, rel)
+        if kind == "dir":
+            os.makedirs(path, exist_ok=True)
+        elif kind == "link":
+            os.symlink(target, path)
+        else:
+            shutil.copy(target, path)
+    os.replace(temp_path, destination)
+
+
+def _link_tree(source: str, destination: str):
+    """Hard-link a staged copy into place, copying where links are not possible"""
+    temp_path = f"{destination}.{os.getpid()}.tmp"
+    shutil.rmtree(temp_path, ignore_errors=True)
+    for directory, dirnames, filenames in os.walk(source):
+        rel_dir = os.path.relpath(directory, source)
+        os.makedirs(os.path.join(temp_path, rel_dir), exist_ok=True)
+        for name in dirnames + filenames:
+            path = os.path.join(directory, name)
+            target = os.path.join(temp_path, rel_dir, name)
+            if os.path.islink(path):
+                os.symlink(os.readlink(path), target)
+            elif name in filenames:
+                try:
+                    os.link(path, target)
+                except OSError:
+                    shutil.copy(path, target)
+    os.replace(temp_path, destination)
\ No newline at end of file
@@ -0,0 +1,237 @@
+from constructs import Construct
+from aws_cdk import (
+    aws_autoscaling as autoscaling,
+    aws_ec2 as ec2,
+    aws_elasticloadbalancingv2 as elbv2,
+    aws_iam as iam,
+    Duration,
+    Tags,
+)
+from .ec2_instance import (
+    ROOT_DEVICE_NAME,
+    default_instance_role,
+    default_machine_image,
+    default_security_group,
+    ebs_block_device,
+)
+
+# Predictive scaling modes, by the name used for predictive_scaling
+PREDICTIVE_SCALING_MODES = {
+    "forecast_only": "ForecastOnly",
+    "forecast_and_scale": "ForecastAndScale",
+}
+
+# Warm pool states, by the name used for warm_pool_state
+WARM_POOL_STATES = {
+    "stopped": autoscaling.PoolState.STOPPED,
+    "hibernated": autoscaling.PoolState.HIBERNATED,
+    "running": autoscaling.PoolState.RUNNING,
+}
+
+
+class StandardAutoScalingGroup(Construct):
+    """
+    An Auto Scaling group launched from the same defaults as StandardEC2Instance.
+    
+    Features:
+    - Amazon Linux 2, SSM role and security group defaults of StandardEC2Instance
+    - Launch template with gp3/io2 volumes (optional)
+    - Warm pool of stopped, hibernated or running instances (optional)
+    - Instance refresh when the launch template changes
+    - Target tracking on CPU utilization or ALB request count (optional)
+    - Predictive scaling on the same metric (optional)
+    """
+    
+    def __init__(
+        self,
+        scope: Construct,
+        id: str,
+        *,
+        vpc: ec2.IVpc,
+        instance_type: ec2.InstanceType = ec2.InstanceType("t3.micro"),
+        machine_image: ec2.IMachineImage = None,
+        key_name: str = None,
+        user_data: ec2.UserData = None,
+        security_group: ec2.SecurityGroup = None,
+        role: iam.Role = None,
+        subnet_selection: ec2.SubnetSelection = None,
+        min_capacity: int = 1,
+        max_capacity: int = 4,
+        desired_capacity: int = None,
+        root_volume: dict = None,
+        data_volumes: list = None,
+        ebs_optimized: bool = None,
+        warm_pool_state: str = None,
+        warm_pool_min_size: int = 0,
+        warm_pool_max_prepared_capacity: int = None,
+        instance_refresh: bool = True,
+        min_healthy_percentage: int = 90,
+        instance_warmup: Duration = Duration.minutes(5),
+        target_cpu_utilization: int = None,
+        target_group: elbv2.IApplicationTargetGroup = None,
+        target_requests_per_minute: int = None,
+        predictive_scaling: str = None,
+        **kwargs
+    ):
+        super().__init__(scope, id)
+        
+        if predictive_scaling is not None and predictive_scaling not in PREDICTIVE_SCALING_MODES:
+            raise ValueError(
+                f"predictive_scaling must be one of {list(PREDICTIVE_SCALING_MODES)}, "
+                f"got {predictive_scaling!r}"
+            )
+        if predictive_scaling is not None and (
+            target_cpu_utilization is None and target_requests_per_minute is None
+        ):
+            raise ValueError(
+                "predictive_scaling needs target_cpu_utilization or target_requests_per_minute"
+            )
+        if warm_pool_state is not None and warm_pool_state not in WARM_POOL_STATES:
+            raise ValueError(
+                f"warm_pool_state must be one of {list(WARM_POOL_STATES)}, got {warm_pool_state!r}"
+            )
+        if target_requests_per_minute is not None and target_group is None:
+            raise ValueError("target_requests_per_minute needs a target_group")
+        if warm_pool_state == "hibernated" and root_volume is None:
+            raise ValueError(
+                "Hibernated warm pools need an encrypted root_volume at least as large as "
+                "the instance memory"
+            )
+        
+        # Same defaults as a single StandardEC2Instance
+        self.security_group = security_group or default_security_group(self, vpc, id, key_name)
+        self.role = role or default_instance_role(self)
+        
+        volumes = []
+        if root_volume is not None:
+            volumes.append(ebs_block_device({"device_name": ROOT_DEVICE_NAME, **root_volume}))
+        for volume in data_volumes or []:
+            volumes.append(ebs_block_device(volume))
+        
+        # Every instance, warm or not, launches from one versioned template
+        self.launch_template = ec2.LaunchTemplate(
+            self,
+            "LaunchTemplate",
+            instance_type=instance_type,
+            machine_image=machine_image or default_machine_image(),
+            key_name=key_name,
+            user_data=user_data or ec2.UserData.for_linux(),
+            security_group=self.security_group,
+            role=self.role,
+            block_devices=volumes or None,
+            ebs_optimized=ebs_optimized,
+            hibernation_configured=warm_pool_state == "hibernated" or None,
+            require_imdsv2=True,
+        )
+        
+        # Replace instances gradually whenever the launch template changes
+        if instance_refresh:
+            kwargs.setdefault(
+                "update_policy",
+                autoscaling.UpdatePolicy.instance_refresh(
+                    strategy=autoscaling.InstanceRefreshStrategy.ROLLING,
+                    min_healthy_percentage=min_healthy_percentage,
+                    instance_warmup=instance_warmup,
+                    skip_matching=True,
+                ),
+            )
+        
+        self.auto_scaling_group = autoscaling.AutoScalingGroup(
+            self,
+            "AutoScalingGroup",
+            vpc=vpc,
+            launch_template=self.launch_template,
+            vpc_subnets=subnet_selection or ec2.SubnetSelection(
+                subnet_type=ec2.SubnetType.PRIVATE_WITH_EGRESS
+            ),
+            min_capacity=min_capacity,
+            max_capacity=max_capacity,
+            desired_capacity=desired_capacity,
+            default_instance_warmup=instance_warmup,
+            **kwargs
+        )
+        
+        # Keep pre-initialized instances ready so scale-out skips boot and user data
+        self.warm_pool = None
+        if warm_pool_state is not None:
+            self.warm_pool = self.auto_scaling_group.add_warm_pool(
+                pool_state=WARM_POOL_STATES[warm_pool_state],
+                min_size=warm_pool_min_size,
+                max_group_prepared_capacity=warm_pool_max_prepared_capacity,
+                reuse_on_scale_in=warm_pool_state != "running" or None,
+            )
+        
+        # Target tracking on CPU and/or request count per instance
+        if target_cpu_utilization is not None:
+            self.auto_scaling_group.scale_on_cpu_utilization(
+                "CpuScaling",
+                target_utilization_percent=target_cpu_utilization,
+            )
+        if target_group is not None:
+            self.auto_scaling_group.attach_to_application_target_group(target_group)
+        if target_requests_per_minute is not None:
+            self.auto_scaling_group.scale_on_request_count(
+                "RequestCountScaling",
+                target_requests_per_minute=target_requests_per_minute,
+            )
+        
+        # Launch capacity ahead of forecast load on the same metric
+        self.predictive_scaling_policy = None
+        if predictive_scaling is not None:
+            self.predictive_scaling_policy = self._add_predictive_scaling(
+                PREDICTIVE_SCALING_MODES[predictive_scaling],
+                target_cpu_utilization,
+                target_group,
+                target_requests_per_minute,
+                instance_warmup,
+            )
+        
+        # Add standard tags
+        Tags.of(self.auto_scaling_group).add("ManagedBy", "ZacksCDK")
+    
+    def _add_predictive_scaling(
+        self,
+        mode: str,
+        target_cpu_utilization: int = None,
+        target_group: elbv2.IApplicationTargetGroup = None,
+        target_requests_per_minute: int = None,
+        instance_warmup: Duration = None,
+    ) -> autoscaling.CfnScalingPolicy:
+        """Add a predictive scaling policy for the CPU or request count target"""
+        policy = autoscaling.CfnScalingPolicy
+        metric_pair = policy.PredictiveScalingPredefinedMetricPairProperty
+        if target_cpu_utilization is not None:
+            metric = policy.PredictiveScalingMetricSpecificationProperty(
+                target_value=target_cpu_utilization,
+                predefined_metric_pair_specification=metric_pair(
+                    predefined_metric_type="ASGCPUUtilization",
+                ),
+            )
+        else:
+            metric = policy.PredictiveScalingMetricSpecificationProperty(
+                target_value=target_requests_per_minute,
+                predefined_metric_pair_specification=metric_pair(
+                    predefined_metric_type="ALBRequestCount",
+                    resource_label=(
+                        f"{target_group.first_load_balancer_full_name}/"
+                        f"{target_group.target_group_full_name}"
+                    ),
+                ),
+            )
+        scheduling_buffer_time = int(instance_warmup.to_seconds()) if instance_warmup else None
+        return policy(
+            self,
+            "PredictiveScaling",
+            auto_scaling_group_name=self.auto_scaling_group.auto_scaling_group_name,
+            policy_type="PredictiveScaling",
+            predictive_scaling_configuration=policy.PredictiveScalingConfigurationProperty(
+                metric_specifications=[metric],
+                mode=mode,
+                scheduling_buffer_time=scheduling_buffer_time,
+            ),
+        )
+    
+    def add_security_group_rule(self, peer, port, description=None):
+        """Add an ingress rule to the group's security group"""
+        self.launch_template.connections.allow_from(peer, port, description)
+        return self
\ No newline at end of file
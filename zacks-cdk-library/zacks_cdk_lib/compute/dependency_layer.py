@@ -0,0 +1,140 @@
+import hashlib
+import os
+import re
+import subprocess
+import sys
+
+import jsii
+from constructs import Construct
+from aws_cdk import (
+    aws_lambda as _lambda,
+    AssetHashType,
+    BundlingOptions,
+    ILocalBundling,
+    Stack,
+)
+
+# manylinux wheel platform for each Lambda architecture
+PIP_PLATFORMS = {
+    "x86_64": "manylinux2014_x86_64",
+    "arm64": "manylinux2014_aarch64",
+}
+
+
+@jsii.implements(ILocalBundling)
+class _PipBundler:
+    """Install a requirements file into a layer directory with the local pip"""
+    
+    def __init__(self, requirements_path: str, runtime: _lambda.Runtime, architecture):
+        self.requirements_path = requirements_path
+        self.runtime = runtime
+        self.architecture = architecture
+    
+    def try_bundle(self, output_dir: str, options) -> bool:
+        # Download wheels for the Lambda platform so the layer works wherever synth runs
+        command = [
+            sys.executable, "-m", "pip", "install",
+            "--requirement", self.requirements_path,
+            "--target", os.path.join(output_dir, "python"),
+            "--platform", PIP_PLATFORMS[self.architecture.name],
+            "--implementation", "cp",
+            "--python-version", self.runtime.name.replace("python", ""),
+            "--only-binary", ":all:",
+            "--no-compile",
+            "--quiet",
+        ]
+        result = subprocess.run(command, stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
+        if result.returncode != 0:
+            raise RuntimeError(
+                f"pip install failed for {self.requirements_path}:\n"
+                f"{result.stdout.decode(errors='replace')}"
+            )
+        return True
+
+
+class DependencyLayer(Construct):
+    """
+    A Lambda layer built from a requirements file, shared by content hash.
+    
+    Features:
+    - Dependencies installed locally with pip (no Docker required)
+    - Wheels resolved for the target runtime and architecture
+    - One layer per distinct requirements content in each stack
+    - Bundled and uploaded once per app, however many stacks use it
+    """
+    
+    def __init__(
+        self,
+        scope: Construct,
+        id: str,
+        *,
+        requirements_path: str,
+        runtime: _lambda.Runtime = _lambda.Runtime.PYTHON_3_9,
+        architecture: _lambda.Architecture = _lambda.Architecture.X86_64,
+        description: str = None,
+        **kwargs
+    ):
+        super().__init__(scope, id)
+        
+        requirements_path = os.path.abspath(requirements_path)
+        self.requirements_path = requirements_path
+        self.runtime = runtime
+        self.architecture = architecture
+        self.content_hash = self.requirements_hash(requirements_path, runtime, architecture)
+        
+        # Keying the asset on content lets identical requirements share one bundle
+        self.layer = _lambda.LayerVersion(
+            self,
+            "Layer",
+            code=_lambda.Code.from_asset(
+                os.path.dirname(requirements_path),
+                asset_hash=self.content_hash,
+                asset_hash_type=AssetHashType.CUSTOM,
+                bundling=BundlingOptions(
+                    image=runtime.bundling_image,
+                    local=_PipBundler(requirements_path, runtime, architecture),
+                ),
+            ),
+            compatible_runtimes=[runtime],
+            compatible_architectures=[architecture],
+            description=description or (
+                f"Dependencies from {os.path.basename(requirements_path)} "
+                f"({self.content_hash[:12]})"
+            ),
+            **kwargs
+        )
+    
+    @classmethod
+    def for_requirements(
+        cls,
+        scope: Construct,
+        requirements_path: str,
+        runtime: _lambda.Runtime = _lambda.Runtime.PYTHON_3_9,
+        architecture: _lambda.Architecture = _lambda.Architecture.X86_64,
+    ) -> "DependencyLayer":
+        """Return the stack's layer for these requirements, creating it on first use"""
+        stack = Stack.of(scope)
+        content_hash = cls.requirements_hash(requirements_path, runtime, architecture)
+        id = f"DependencyLayer{content_hash[:12]}"
+        return stack.node.try_find_child(id) or cls(
+            stack,
+            id,
+            requirements_path=requirements_path,
+            runtime=runtime,
+            architecture=architecture,
+        )
+    
+    @staticmethod
+    def requirements_hash(
+        requirements_path: str,
+        runtime: _lambda.Runtime,
+        architecture: _lambda.Architecture,
+    ) -> str:
+        """Hash the meaningful lines of a requirements file with its target platform"""
+        digest = hashlib.sha256(f"{runtime.name}\0{architecture.name}\0".encode("utf-8"))
+        with open(requirements_path) as fp:
+            for line in fp:
+                line = re.sub(r"(^|\s)#.*", "", line).strip()
+                if line:
+                    digest.update(line.encode("utf-8") + b"\n")
+        return digest.hexdigest()
\ No newline at end of file
@@ -5,16 +5,41 @@
     Tags,
 )
 
+# Root device of Amazon Linux AMIs
+ROOT_DEVICE_NAME = "/dev/xvda"
+
+# Find the NVMe instance store disks, stripe them if there are several, and mount them
+INSTANCE_STORE_MOUNT_SCRIPT = """\
+devices=$(lsblk -d -n -o NAME,MODEL | awk '/Instance Storage/ {{print "/dev/" $1}}')
+if [ -n "$devices" ]; then
+  count=$(echo "$devices" | wc -l)
+  if [ "$count" -gt 1 ]; then
+    mdadm --create /dev/md0 --level=0 --raid-devices="$count" $devices --run
+    device=/dev/md0
+  else
+    device=$devices
+  fi
+  mkfs.xfs -f "$device"
+  mkdir -p {mount_point}
+  mount -o noatime "$device" {mount_point}
+  echo "$device {mount_point} xfs defaults,noatime,nofail 0 2" >> /etc/fstab
+fi"""
+
 
 class StandardEC2Instance(Construct):
     """
     A standardized EC2 instance with common configurations and best practices.
     
     Features:
-    - Amazon Linux 2 by default
+    - Amazon Linux 2 by default, or a golden AMI from a GoldenAmiPipeline
     - SSM enabled for management
     - Security group with common rules
     - Instance profile with common permissions
+    - IPv6 address and egress in dual-stack subnets (optional)
+    - gp3/io2 root and data volumes with explicit IOPS and throughput (optional)
+    - EBS optimization and cluster/partition/spread placement groups (optional)
+    - ENA Express on the primary network interface (optional)
+    - Instance store disks striped and mounted from user data (optional)
     """
     
     def __init__(
@@ -30,48 +55,60 @@ def __init__(
         security_group: ec2.SecurityGroup = None,
         role: iam.Role = None,
         subnet_selection: ec2.SubnetSelection = None,
+        ipv6_egress: bool = False,
+        root_volume: dict = None,
+        data_volumes: list = None,
+        ebs_optimized: bool = None,
+        placement_strategy: str = None,
+        placement_partitions: int = None,
+        ena_express: bool = False,
+        ena_express_udp: bool = False,
+        instance_store_mount_point: str = None,
         **kwargs
     ):
         super().__init__(scope, id)
         
         # Use Amazon Linux 2 by default if no image is specified
         if machine_image is None:
-            machine_image = ec2.AmazonLinuxImage(
-                generation=ec2.AmazonLinuxGeneration.AMAZON_LINUX_2,
-                edition=ec2.AmazonLinuxEdition.STANDARD,
-                virtualization=ec2.AmazonLinuxVirt.HVM,
-                storage=ec2.AmazonLinuxStorage.GENERAL_PURPOSE,
-            )
+            machine_image = default_machine_image()
         
         # Create a security group if not provided
         if security_group is None:
-            security_group = ec2.SecurityGroup(
-                self, 
-                "SecurityGroup",
-                vpc=vpc,
-                description=f"Security group for {id}",
-                allow_all_outbound=True,
-            )
-            
-            # Add SSH access if key_name is provided
-            if key_name:
-                security_group.add_ingress_rule(
-                    ec2.Peer.any_ipv4(),
-                    ec2.Port.tcp(22),
-                    "Allow SSH access"
-                )
+            security_group = default_security_group(self, vpc, id, key_name, ipv6_egress)
         
         # Create a role with SSM permissions if not provided
         if role is None:
-            role = iam.Role(
-                self, 
-                "InstanceRole",
-                assumed_by=iam.ServicePrincipal("ec2.amazonaws.com"),
+            role = default_instance_role(self)
+        
+        # Give the instance an IPv6 address so outbound traffic can use the egress-only gateway
+        if ipv6_egress:
+            kwargs.setdefault("ipv6_address_count", 1)
+        
+        # Provisioned EBS performance for the root and data volumes
+        volumes = []
+        if root_volume is not None:
+            volumes.append(ebs_block_device({"device_name": ROOT_DEVICE_NAME, **root_volume}))
+        for volume in data_volumes or []:
+            volumes.append(ebs_block_device(volume))
+        
+        # An instance with a launch template cannot toggle IMDSv1 itself, so the template does
+        require_imdsv2 = kwargs.pop("require_imdsv2", None) if volumes else None
+        
+        # Keep instances close together (cluster) or apart (partition, spread)
+        self.placement_group = kwargs.pop("placement_group", None)
+        if placement_strategy is not None and self.placement_group is None:
+            self.placement_group = ec2.PlacementGroup(
+                self,
+                "PlacementGroup",
+                strategy=ec2.PlacementGroupStrategy[placement_strategy.upper()],
+                partitions=placement_partitions,
             )
-            role.add_managed_policy(
-                iam.ManagedPolicy.from_aws_managed_policy_name(
-                    "AmazonSSMManagedInstanceCore"
-                )
+        
+        # Mount the instance store at boot
+        if instance_store_mount_point:
+            user_data = user_data or ec2.UserData.for_linux()
+            user_data.add_commands(
+                INSTANCE_STORE_MOUNT_SCRIPT.format(mount_point=instance_store_mount_point)
             )
         
         # Create the EC2 instance
@@ -85,16 +122,122 @@ def __init__(
             user_data=user_data,
             security_group=security_group,
             role=role,
+            ebs_optimized=ebs_optimized,
+            placement_group=self.placement_group,
             vpc_subnets=subnet_selection or ec2.SubnetSelection(
                 subnet_type=ec2.SubnetType.PRIVATE_WITH_EGRESS
             ),
             **kwargs
         )
         
+        # Instances cannot set gp3 throughput directly, so volumes come from a launch template
+        self.launch_template = None
+        if volumes:
+            self.launch_template = ec2.LaunchTemplate(
+                self,
+                "LaunchTemplate",
+                block_devices=volumes,
+                require_imdsv2=require_imdsv2,
+            )
+            self.instance.node.default_child.launch_template = (
+                ec2.CfnInstance.LaunchTemplateSpecificationProperty(
+                    launch_template_id=self.launch_template.launch_template_id,
+                    version=self.launch_template.latest_version_number,
+                )
+            )
+        
+        if ena_express:
+            self._enable_ena_express(ena_express_udp)
+        
         # Add standard tags
         Tags.of(self.instance).add("ManagedBy", "ZacksCDK")
+    
+    def _enable_ena_express(self, udp: bool):
+        """Move the subnet and security groups onto a primary network interface with ENA Express"""
+        instance = self.instance.node.default_child
+        network_interface = {
+            "DeviceIndex": "0",
+            "SubnetId": instance.subnet_id,
+            "GroupSet": instance.security_group_ids,
+            "EnaSrdSpecification": {
+                "EnaSrdEnabled": True,
+                "EnaSrdUdpSpecification": {"EnaSrdUdpEnabled": udp},
+            },
+        }
+        if instance.ipv6_address_count is not None:
+            network_interface["Ipv6AddressCount"] = instance.ipv6_address_count
+            instance.add_property_deletion_override("Ipv6AddressCount")
+        instance.add_property_override("NetworkInterfaces", [network_interface])
+        instance.add_property_deletion_override("SubnetId")
+        instance.add_property_deletion_override("SecurityGroupIds")
         
     def add_security_group_rule(self, peer, port, description=None):
         """Add an ingress rule to the instance's security group"""
         self.instance.connections.allow_from(peer, port, description)
-        return self
\ No newline at end of file
+        return self
+
+
+def default_machine_image() -> ec2.IMachineImage:
+    """Amazon Linux 2, the default image of standard instances"""
+    return ec2.AmazonLinuxImage(
+        generation=ec2.AmazonLinuxGeneration.AMAZON_LINUX_2,
+        edition=ec2.AmazonLinuxEdition.STANDARD,
+        virtualization=ec2.AmazonLinuxVirt.HVM,
+        storage=ec2.AmazonLinuxStorage.GENERAL_PURPOSE,
+    )
+
+
+def default_security_group(
+    scope: Construct,
+    vpc: ec2.IVpc,
+    name: str,
+    key_name: str = None,
+    ipv6_egress: bool = False,
+) -> ec2.SecurityGroup:
+    """A security group with all outbound traffic, and SSH when a key pair is used"""
+    security_group = ec2.SecurityGroup(
+        scope, 
+        "SecurityGroup",
+        vpc=vpc,
+        description=f"Security group for {name}",
+        allow_all_outbound=True,
+        allow_all_ipv6_outbound=ipv6_egress or None,
+    )
+    
+    # Add SSH access if key_name is provided
+    if key_name:
+        security_group.add_ingress_rule(
+            ec2.Peer.any_ipv4(),
+            ec2.Port.tcp(22),
+            "Allow SSH access"
+        )
+    return security_group
+
+
+def default_instance_role(scope: Construct) -> iam.Role:
+    """An instance role with SSM permissions"""
+    role = iam.Role(
+        scope, 
+        "InstanceRole",
+        assumed_by=iam.ServicePrincipal("ec2.amazonaws.com"),
+    )
+    role.add_managed_policy(
+        iam.ManagedPolicy.from_aws_managed_policy_name(
+            "AmazonSSMManagedInstanceCore"
+        )
+    )
+    return role
+
+
+def ebs_block_device(volume: dict) -> ec2.BlockDevice:
+    """Build an encrypted EBS block device from a volume dict"""
+    volume = dict(volume)
+    device_name = volume.pop("device_name")
+    volume_type = volume.pop("volume_type", ec2.EbsDeviceVolumeType.GP3)
+    if isinstance(volume_type, str):
+        volume_type = ec2.EbsDeviceVolumeType[volume_type.upper()]
+    volume.setdefault("encrypted", True)
+    return ec2.BlockDevice(
+        device_name=device_name,
+        volume=ec2.BlockDeviceVolume.ebs(volume.pop("size"), volume_type=volume_type, **volume),
+    )
\ No newline at end of file
@@ -0,0 +1,274 @@
+import hashlib
+import json
+
+import jsii
+from constructs import Construct
+from aws_cdk import (
+    aws_ec2 as ec2,
+    aws_iam as iam,
+    aws_imagebuilder as imagebuilder,
+    Aws,
+    CfnDynamicReference,
+    CfnDynamicReferenceService,
+    Names,
+    Stack,
+    Tags,
+)
+from .ec2_instance import ROOT_DEVICE_NAME, default_instance_role, default_security_group
+
+# Latest Amazon Linux 2 AMI, the same base StandardEC2Instance uses by default
+DEFAULT_PARENT_IMAGE = (
+    "ssm:/aws/service/ami-amazon-linux-latest/amzn2-ami-kernel-5.10-hvm-x86_64-gp2"
+)
+
+# Only rebuild on schedule when the parent image or a component has a newer version
+REBUILD_START_CONDITION = "EXPRESSION_MATCH_AND_DEPENDENCY_UPDATES_AVAILABLE"
+ALWAYS_START_CONDITION = "EXPRESSION_MATCH_ONLY"
+
+
+@jsii.implements(ec2.IMachineImage)
+class GoldenAmiPipeline(Construct):
+    """
+    An EC2 Image Builder pipeline that bakes components into a golden AMI.
+    
+    Features:
+    - AWS-managed components by name and inline shell components
+    - Scheduled rebuilds when the parent image or components are updated
+    - Latest AMI ID published to an SSM parameter
+    - First image baked during deployment so the parameter always exists (optional)
+    - Usable directly as the machine_image of StandardEC2Instance and
+      StandardAutoScalingGroup; the AMI ID is resolved from the parameter at launch
+    """
+    
+    def __init__(
+        self,
+        scope: Construct,
+        id: str,
+        *,
+        components: list,
+        parent_image: str = DEFAULT_PARENT_IMAGE,
+        parameter_name: str = None,
+        instance_types: list = None,
+        root_volume_size: int = None,
+        vpc: ec2.IVpc = None,
+        schedule_expression: str = "cron(0 4 ? * sun *)",
+        rebuild_only_on_updates: bool = True,
+        image_tests: bool = True,
+        build_on_deploy: bool = True,
+        **kwargs
+    ):
+        super().__init__(scope, id)
+        
+        if not components:
+            raise ValueError("GoldenAmiPipeline needs at least one component")
+        
+        self.name = Names.unique_resource_name(self, max_length=64, separator="-")
+        self.parameter_name = parameter_name or f"/golden-ami/{self.name}"
+        
+        # Inline components are immutable per version, so their names carry a content hash
+        component_arns = []
+        recipe_hash = hashlib.sha256(f"{parent_image}\0{root_volume_size}\0".encode("utf-8"))
+        for index, component in enumerate(components):
+            if isinstance(component, str):
+                component_arns.append(self.managed_component_arn(component))
+                recipe_hash.update(component.encode("utf-8") + b"\n")
+            else:
+                document = self.component_document(component["commands"])
+                content_hash = hashlib.sha256(document.encode("utf-8")).hexdigest()[:8]
+                recipe_hash.update(document.encode("utf-8") + b"\n")
+                component_arns.append(
+                    imagebuilder.CfnComponent(
+                        self,
+                        f"Component{index}",
+                        name=f"{self.name}-{component['name']}-{content_hash}",
+                        platform="Linux",
+                        version=component.get("version", "1.0.0"),
+                        description=component.get("description"),
+                        data=document,
+                    ).attr_arn
+                )
+        
+        # Changing the component list or base produces a new recipe (and a new bake)
+        root_block_device = None
+        if root_volume_size is not None:
+            root_block_device = [
+                imagebuilder.CfnImageRecipe.InstanceBlockDeviceMappingProperty(
+                    device_name=ROOT_DEVICE_NAME,
+                    ebs=imagebuilder.CfnImageRecipe.EbsInstanceBlockDeviceSpecificationProperty(
+                        volume_size=root_volume_size,
+                        volume_type="gp3",
+                        encrypted=True,
+                        delete_on_termination=True,
+                    ),
+                )
+            ]
+        self.recipe = imagebuilder.CfnImageRecipe(
+            self,
+            "Recipe",
+            name=f"{self.name}-{recipe_hash.hexdigest()[:8]}",
+            version="1.0.0",
+            parent_image=parent_image,
+            components=[
+                imagebuilder.CfnImageRecipe.ComponentConfigurationProperty(component_arn=arn)
+                for arn in component_arns
+            ],
+            block_device_mappings=root_block_device,
+        )
+        
+        # Build instances get the same SSM role as StandardEC2Instance plus Image Builder access
+        self.role = default_instance_role(self)
+        self.role.add_managed_policy(
+            iam.ManagedPolicy.from_aws_managed_policy_name("EC2InstanceProfileForImageBuilder")
+        )
+        instance_profile = iam.InstanceProfile(self, "InstanceProfile", role=self.role)
+        
+        subnet_id = None
+        security_group_ids = None
+        if vpc is not None:
+            subnet_id = vpc.select_subnets(
+                subnet_type=ec2.SubnetType.PRIVATE_WITH_EGRESS
+            ).subnet_ids[0]
+            security_group_ids = [default_security_group(self, vpc, id).security_group_id]
+        
+        metadata_options = (
+            imagebuilder.CfnInfrastructureConfiguration.InstanceMetadataOptionsProperty(
+                http_tokens="required",
+            )
+        )
+        self.infrastructure_configuration = imagebuilder.CfnInfrastructureConfiguration(
+            self,
+            "InfrastructureConfiguration",
+            name=self.name,
+            instance_profile_name=instance_profile.instance_profile_name,
+            instance_types=instance_types or ["t3.medium"],
+            subnet_id=subnet_id,
+            security_group_ids=security_group_ids,
+            instance_metadata_options=metadata_options,
+            terminate_instance_on_failure=True,
+        )
+        
+        # Publish every new AMI ID to the parameter instances resolve at launch
+        self.distribution_configuration = imagebuilder.CfnDistributionConfiguration(
+            self,
+            "DistributionConfiguration",
+            name=self.name,
+            distributions=[
+                imagebuilder.CfnDistributionConfiguration.DistributionProperty(
+                    region=Aws.REGION,
+                    ami_distribution_configuration={
+                        "Name": f"{self.name}-{{{{ imagebuilder:buildDate }}}}",
+                    },
+                    ssm_parameter_configurations=[
+                        imagebuilder.CfnDistributionConfiguration.SsmParameterConfigurationProperty(
+                            parameter_name=self.parameter_name,
+                            data_type="aws:ec2:image",
+                        )
+                    ],
+                )
+            ],
+        )
+        
+        image_tests_configuration = imagebuilder.CfnImagePipeline.ImageTestsConfigurationProperty(
+            image_tests_enabled=image_tests,
+        )
+        self.pipeline = imagebuilder.CfnImagePipeline(
+            self,
+            "Pipeline",
+            name=self.name,
+            image_recipe_arn=self.recipe.attr_arn,
+            infrastructure_configuration_arn=self.infrastructure_configuration.attr_arn,
+            distribution_configuration_arn=self.distribution_configuration.attr_arn,
+            image_tests_configuration=image_tests_configuration,
+            schedule=imagebuilder.CfnImagePipeline.ScheduleProperty(
+                schedule_expression=schedule_expression,
+                pipeline_execution_start_condition=(
+                    REBUILD_START_CONDITION if rebuild_only_on_updates else ALWAYS_START_CONDITION
+                ),
+            ) if schedule_expression else None,
+            **kwargs
+        )
+        
+        # Bake once during deployment so instances never launch before the parameter exists
+        self.image = None
+        if build_on_deploy:
+            self.image = imagebuilder.CfnImage(
+                self,
+                "Image",
+                image_recipe_arn=self.recipe.attr_arn,
+                infrastructure_configuration_arn=self.infrastructure_configuration.attr_arn,
+                distribution_configuration_arn=self.distribution_configuration.attr_arn,
+                image_tests_configuration=imagebuilder.CfnImage.ImageTestsConfigurationProperty(
+                    image_tests_enabled=image_tests,
+                ),
+            )
+        
+        # Add standard tags
+        Tags.of(self).add("ManagedBy", "ZacksCDK")
+        
+        # Export outputs
+        self.pipeline_arn = self.pipeline.attr_arn
+    
+    def get_image(self, scope: Construct) -> ec2.MachineImageConfig:
+        """
+        Resolve the latest baked AMI from the parameter.
+        
+        Launch templates resolve it at every launch, so Auto Scaling groups pick up
+        new bakes immediately; single instances resolve it when CloudFormation
+        creates or replaces them (a dynamic reference, so the first deploy can
+        bake the image before it is read).
+        """
+        if self.image is not None:
+            scope.node.add_dependency(self.image)
+        if isinstance(scope, ec2.LaunchTemplate):
+            return ec2.MachineImage.resolve_ssm_parameter_at_launch(
+                self.parameter_name
+            ).get_image(scope)
+        return ec2.MachineImageConfig(
+            image_id=CfnDynamicReference(
+                CfnDynamicReferenceService.SSM, self.parameter_name
+            ).to_string(),
+            os_type=ec2.OperatingSystemType.LINUX,
+            user_data=ec2.UserData.for_linux(),
+        )
+    
+    @staticmethod
+    def managed_component_arn(name: str) -> str:
+        """ARN of the latest version of an AWS-managed component, or the ARN itself"""
+        if name.startswith("arn:"):
+            return name
+        return (
+            f"arn:{Aws.PARTITION}:imagebuilder:{Aws.REGION}:aws:component/{name}/x.x.x"
+        )
+    
+    @staticmethod
+    def component_document(commands: list) -> str:
+        """Image Builder document running the commands in the build phase (JSON is valid YAML)"""
+        return json.dumps({
+            "schemaVersion": 1.0,
+            "phases": [
+                {
+                    "name": "build",
+                    "steps": [
+                        {
+                            "name": "Run",
+                            "action": "ExecuteBash",
+                            "inputs": {"commands": list(commands)},
+                        }
+                    ],
+                }
+            ],
+        }, indent=2)
+    
+    def grant_read_parameter(self, identity):
+        """Grant permission to read the golden AMI parameter to the given identity"""
+        return iam.Grant.add_to_principal(
+            grantee=identity,
+            actions=["ssm:GetParameter", "ssm:GetParameters"],
+            resource_arns=[
+                Stack.of(self).format_arn(
+                    service="ssm",
+                    resource="parameter",
+                    resource_name=self.parameter_name.lstrip("/"),
+                )
+            ],
+        )
\ No newline at end of file
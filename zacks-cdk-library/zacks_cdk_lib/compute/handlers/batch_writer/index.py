@@ -0,0 +1,160 @@
+import hashlib
+import json
+import os
+import time
+from decimal import Decimal
+
+import boto3
+
+TABLE_NAME = os.environ["TABLE_NAME"]
+table = boto3.resource("dynamodb").Table(TABLE_NAME)
+
+PARTITION_KEY = os.environ["PARTITION_KEY"]
+SORT_KEY = os.environ.get("SORT_KEY")
+SORT_KEY_TYPE = os.environ.get("SORT_KEY_TYPE", "S")
+KEY_NAMES = [PARTITION_KEY] + ([SORT_KEY] if SORT_KEY else [])
+
+# Write-sharding scheme of the table, if any (see EnhancedDynamoTable.configure_sharding)
+SHARD_COUNT = int(os.environ.get("SHARD_COUNT", "0"))
+SHARD_SEPARATOR = os.environ.get("SHARD_SEPARATOR", "#")
+SHARD_ATTRIBUTE = os.environ.get("SHARD_ATTRIBUTE", "shard")
+
+# BatchWriteItem takes at most 25 requests; unprocessed ones are retried with backoff
+MAX_BATCH_SIZE = 25
+MAX_ATTEMPTS = 5
+
+
+def parse_record(record):
+    """
+    Turn a queued request into a (method, item) pair.
+
+    The body is the JSON request body; path parameters and the HTTP method
+    arrive as message attributes set by the API Gateway mapping template.
+    """
+    attributes = {
+        name: value["stringValue"]
+        for name, value in record.get("messageAttributes", {}).items()
+    }
+    method = attributes.pop("method", "POST")
+    body = json.loads(record["body"] or "{}", parse_float=Decimal)
+    if not isinstance(body, dict):
+        raise ValueError("Request body must be a JSON object")
+    item = {**body, **attributes}
+    if SORT_KEY and SORT_KEY_TYPE == "N" and isinstance(item.get(SORT_KEY), str):
+        item[SORT_KEY] = Decimal(item[SORT_KEY])
+    missing = [name for name in KEY_NAMES if name not in item]
+    if missing:
+        raise ValueError(f"Missing key attributes {missing}")
+    return method, item
+
+
+def key_string(value):
+    """Key value as text; numbers in plain notation without trailing zeros"""
+    if isinstance(value, (int, float, Decimal)) and not isinstance(value, bool):
+        return format(Decimal(str(value)).normalize(), "f")
+    return str(value)
+
+
+def shard_number(item):
+    """
+    Write shard of an item, the same scheme as EnhancedDynamoTable.write_shard.
+
+    SHA-256 of the partition key value, plus a NUL byte and the sort key value
+    when the table has one; the first 8 bytes as a big-endian integer modulo
+    SHARD_COUNT. Every write and delete of one item lands on the same shard.
+    """
+    key = key_string(item[PARTITION_KEY])
+    if SORT_KEY:
+        key += "\0" + key_string(item[SORT_KEY])
+    digest = hashlib.sha256(key.encode("utf-8")).digest()
+    return int.from_bytes(digest[:8], "big") % SHARD_COUNT
+
+
+def write_request(method, item):
+    """BatchWriteItem request for a parsed item, on its write shard when the table is sharded"""
+    if SHARD_COUNT:
+        number = shard_number(item)
+        item = {
+            **item,
+            PARTITION_KEY: f"{item[PARTITION_KEY]}{SHARD_SEPARATOR}{number}",
+            SHARD_ATTRIBUTE: number,
+        }
+    if method == "DELETE":
+        return {"DeleteRequest": {"Key": {name: item[name] for name in KEY_NAMES}}}
+    return {"PutRequest": {"Item": item}}
+
+
+def request_key(request):
+    """The primary key a write request targets, as a hashable tuple"""
+    if "DeleteRequest" in request:
+        attributes = request["DeleteRequest"]["Key"]
+    else:
+        attributes = request["PutRequest"]["Item"]
+    return tuple(key_string(attributes[name]) for name in KEY_NAMES)
+
+
+def batch_write(requests):
+    """BatchWriteItem the requests, returning those still unprocessed after retries"""
+    for attempt in range(MAX_ATTEMPTS):
+        response = table.meta.client.batch_write_item(RequestItems={TABLE_NAME: requests})
+        requests = response.get("UnprocessedItems", {}).get(TABLE_NAME, [])
+        if not requests:
+            return []
+        if attempt < MAX_ATTEMPTS - 1:
+            time.sleep(min(0.05 * 2 ** attempt, 1.0))
+    return requests
+
+
+def write_one(request):
+    """Write a single request, returning whether it succeeded"""
+    try:
+        if "DeleteRequest" in request:
+            table.delete_item(Key=request["DeleteRequest"]["Key"])
+        else:
+            table.put_item(Item=request["PutRequest"]["Item"])
+        return True
+    except Exception as error:
+        print(json.dumps({"key": request_key(request), "error": str(error)}, default=str))
+        return False
+
+
+def write_chunk(chunk):
+    """
+    Write up to 25 (request, message IDs) entries and return the ones that failed.
+
+    A request DynamoDB rejects fails the whole BatchWriteItem call, so the
+    chunk is then retried one request at a time to find the bad records.
+    """
+    try:
+        unprocessed = batch_write([request for request, _ in chunk])
+    except Exception as error:
+        print(json.dumps({"error": str(error)}))
+        return [entry for entry in chunk if not write_one(entry[0])]
+    entries = {request_key(request): (request, message_ids) for request, message_ids in chunk}
+    return [entries[request_key(request)] for request in unprocessed]
+
+
+def handler(event, context):
+    """Write a batch of queued requests with BatchWriteItem, reporting only failed records"""
+    failures = []
+    requests = {}
+    for record in event["Records"]:
+        try:
+            request = write_request(*parse_record(record))
+        except (ValueError, KeyError) as error:
+            print(json.dumps({"messageId": record["messageId"], "error": str(error)}))
+            failures.append(record["messageId"])
+            continue
+
+        # BatchWriteItem rejects two requests for one key, so the last one wins; earlier
+        # messages for the key succeed or fail with it
+        key = request_key(request)
+        _, message_ids = requests.pop(key, (None, []))
+        requests[key] = (request, message_ids + [record["messageId"]])
+
+    entries = list(requests.values())
+    for start in range(0, len(entries), MAX_BATCH_SIZE):
+        for _, message_ids in write_chunk(entries[start:start + MAX_BATCH_SIZE]):
+            failures.extend(message_ids)
+
+    return {"batchItemFailures": [{"itemIdentifier": message_id} for message_id in failures]}
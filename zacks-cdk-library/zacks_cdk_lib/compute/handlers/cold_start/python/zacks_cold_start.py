@@ -0,0 +1,56 @@
+"""
+Cold start hooks for functions deployed with LambdaFunction(cold_start_mode=...).
+
+Import this module at the top of the handler:
+
+    from zacks_cold_start import client
+
+    def handler(event, context):
+        client("dynamodb").get_item(...)
+
+- snapstart: the modules in ZACKS_WARMUP_IMPORTS are imported and the clients in
+  ZACKS_WARMUP_CLIENTS are created before the snapshot is taken, so restored
+  environments start with them already loaded.
+- lazy: nothing is loaded at init; clients are created on first use and reused
+  for the lifetime of the execution environment.
+"""
+import importlib
+import os
+import random
+
+MODE = os.environ.get("ZACKS_COLD_START_MODE", "")
+
+_clients = {}
+
+
+def _names(variable):
+    return [name.strip() for name in os.environ.get(variable, "").split(",") if name.strip()]
+
+
+def client(service_name, **kwargs):
+    """Return a cached boto3 client, creating it on first use"""
+    key = (service_name, tuple(sorted(kwargs.items())))
+    if key not in _clients:
+        import boto3
+        _clients[key] = boto3.client(service_name, **kwargs)
+    return _clients[key]
+
+
+def warm_up():
+    """Import heavy modules and prime SDK clients"""
+    for module_name in _names("ZACKS_WARMUP_IMPORTS"):
+        importlib.import_module(module_name)
+    for service_name in _names("ZACKS_WARMUP_CLIENTS"):
+        client(service_name)
+
+
+def _after_restore():
+    # Restored environments share the snapshot's random state, so reseed it
+    random.seed()
+
+
+if MODE == "snapstart":
+    from snapshot_restore_py import register_after_restore, register_before_snapshot
+
+    register_before_snapshot(warm_up)
+    register_after_restore(_after_restore)
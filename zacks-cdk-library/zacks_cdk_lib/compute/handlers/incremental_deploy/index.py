@@ -0,0 +1,149 @@
+import json
+import mimetypes
+import os
+import tempfile
+import zipfile
+from urllib.parse import quote
+
+import boto3
+
+s3 = boto3.client("s3")
+cloudfront = boto3.client("cloudfront")
+
+# CloudFront allows 3000 file paths in progress per distribution at a time; larger
+# deploys invalidate /* instead
+MAX_INVALIDATION_PATHS = int(os.environ.get("MAX_INVALIDATION_PATHS", "3000"))
+
+# DeleteObjects takes at most 1000 keys per request
+MAX_DELETE_KEYS = 1000
+
+
+def chunks(items, size):
+    """Split a list into consecutive lists of at most size items"""
+    return [items[start:start + size] for start in range(0, len(items), size)]
+
+
+def read_json(bucket, key, default=None):
+    """Read a JSON object from S3, or return default if it does not exist"""
+    try:
+        body = s3.get_object(Bucket=bucket, Key=key)["Body"].read()
+    except s3.exceptions.NoSuchKey:
+        return default
+    return json.loads(body)
+
+
+def upload(props, manifest, keys):
+    """Upload only the given keys from the content archive, with their metadata"""
+    with tempfile.TemporaryFile() as archive:
+        s3.download_fileobj(props["ContentBucket"], props["ContentKey"], archive)
+        archive.seek(0)
+        with zipfile.ZipFile(archive) as content:
+            for key in keys:
+                content_type = mimetypes.guess_type(key)[0] or "application/octet-stream"
+                with content.open(key) as body:
+                    s3.upload_fileobj(
+                        body,
+                        props["DestinationBucket"],
+                        key,
+                        ExtraArgs={
+                            "ContentType": content_type,
+                            "CacheControl": manifest[key]["cache_control"],
+                        },
+                    )
+
+
+def invalidation_paths(keys, index_document):
+    """Viewer paths for changed keys, including directory URLs served by index documents"""
+    paths = []
+    for key in keys:
+        paths.append("/" + quote(key, safe="/-_.~"))
+        if key == index_document or key.endswith("/" + index_document):
+            paths.append("/" + quote(key[:-len(index_document)], safe="/-_.~"))
+    return sorted(set(paths))
+
+
+def invalidate(distribution_id, paths, request_id):
+    """Submit one invalidation for the paths and return its ID without waiting for it"""
+    if len(paths) > MAX_INVALIDATION_PATHS:
+        # More paths than may be in progress at once; one wildcard covers them all
+        paths = ["/*"]
+    response = cloudfront.create_invalidation(
+        DistributionId=distribution_id,
+        InvalidationBatch={
+            "Paths": {"Quantity": len(paths), "Items": paths},
+            "CallerReference": request_id,
+        },
+    )
+    return response["Invalidation"]["Id"]
+
+
+def handler(event, context):
+    """Sync a content archive into the bucket using the synth-time manifest"""
+    physical_id = event.get("PhysicalResourceId") or event["LogicalResourceId"]
+    if event["RequestType"] == "Delete":
+        return {"PhysicalResourceId": physical_id}
+
+    props = event["ResourceProperties"]
+    manifest = read_json(props["ManifestBucket"], props["ManifestKey"])
+    previous = read_json(props["StateBucket"], props["DeployedManifestKey"])
+    first_deploy = previous is None
+    previous = previous or {}
+
+    # Objects whose content or metadata changed, and objects no longer in the site
+    changed = sorted(key for key, entry in manifest.items() if previous.get(key) != entry)
+    deleted = sorted(key for key in previous if key not in manifest)
+
+    # HTML goes last so pages never reference assets that are not uploaded yet
+    if changed:
+        upload(props, manifest, sorted(changed, key=lambda key: (key.endswith(".html"), key)))
+    for batch in chunks(deleted, MAX_DELETE_KEYS):
+        s3.delete_objects(
+            Bucket=props["DestinationBucket"],
+            Delete={"Objects": [{"Key": key} for key in batch], "Quiet": True},
+        )
+    s3.put_object(
+        Bucket=props["StateBucket"],
+        Key=props["DeployedManifestKey"],
+        Body=json.dumps(manifest, sort_keys=True).encode("utf-8"),
+        ContentType="application/json",
+        CacheControl="no-store",
+    )
+
+    # Only objects the edges may have cached need invalidating; new keys were never served
+    stale = [key for key in changed if key in previous] + deleted
+    paths = invalidation_paths(stale, props["IndexDocument"])
+    if first_deploy:
+        # Nothing records what an earlier (non-incremental) deploy left at the edges
+        paths = ["/*"]
+    invalidation_id = ""
+    if paths and props.get("DistributionId"):
+        invalidation_id = invalidate(props["DistributionId"], paths, event["RequestId"])
+
+    print(json.dumps({
+        "uploaded": len(changed),
+        "deleted": len(deleted),
+        "invalidated": len(paths),
+        "invalidation": invalidation_id,
+    }))
+    return {
+        "PhysicalResourceId": physical_id,
+        "Data": {
+            "Uploaded": len(changed),
+            "Deleted": len(deleted),
+            "Invalidated": len(paths),
+            "InvalidationId": invalidation_id,
+        },
+    }
+
+
+def is_complete(event, context):
+    """Poll the invalidation handler submitted; the deploy completes once every edge has it"""
+    invalidation_id = event.get("Data", {}).get("InvalidationId")
+    if event["RequestType"] == "Delete" or not invalidation_id:
+        return {"IsComplete": True}
+
+    response = cloudfront.get_invalidation(
+        DistributionId=event["ResourceProperties"]["DistributionId"],
+        Id=invalidation_id,
+    )
+    return {"IsComplete": response["Invalidation"]["Status"] == "Completed"}
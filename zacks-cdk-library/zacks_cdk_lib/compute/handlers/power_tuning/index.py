@@ -0,0 +1,170 @@
+import base64
+import hashlib
+import json
+import math
+import os
+import re
+
+import boto3
+
+lambda_client = boto3.client("lambda")
+logs_client = boto3.client("logs")
+
+# On-demand prices per GB-second and per request (us-east-1)
+GB_SECOND_PRICE = {
+    "x86_64": float(os.environ.get("X86_64_GB_SECOND_PRICE", "0.0000166667")),
+    "arm64": float(os.environ.get("ARM64_GB_SECOND_PRICE", "0.0000133334")),
+}
+REQUEST_PRICE = float(os.environ.get("REQUEST_PRICE", "0.0000002"))
+
+DURATION_PATTERN = re.compile(r"\tDuration: ([0-9.]+) ms")
+BILLED_DURATION_PATTERN = re.compile(r"Billed Duration: ([0-9.]+) ms")
+
+
+def percentile(values, pct):
+    """Nearest-rank percentile of a list of numbers"""
+    ordered = sorted(values)
+    rank = max(int(math.ceil(pct / 100.0 * len(ordered))), 1)
+    return ordered[rank - 1]
+
+
+def summarize(values):
+    """Summarize a list of measurements into percentiles"""
+    return {
+        "avg": sum(values) / len(values),
+        "p50": percentile(values, 50),
+        "p90": percentile(values, 90),
+        "p99": percentile(values, 99),
+        "max": max(values),
+    }
+
+
+def copy_name(execution):
+    """Name of the tuning copy used by one state machine execution"""
+    digest = hashlib.sha256(execution.encode("utf-8")).hexdigest()[:12]
+    return f"{os.environ['COPY_PREFIX']}-{digest}"
+
+
+def get_configuration(function_name):
+    """Configuration of a function, or None if it does not exist"""
+    try:
+        return lambda_client.get_function_configuration(FunctionName=function_name)
+    except lambda_client.exceptions.ResourceNotFoundException:
+        return None
+
+
+def create_copy(name, memory, architecture, layers):
+    """
+    Create a copy of the target function with the given settings.
+
+    The copy runs the target's code with its role, environment and network
+    settings, so measurements match the target without ever modifying it (or
+    the versions its aliases point to).
+    """
+    target = lambda_client.get_function_configuration(FunctionName=os.environ["TARGET_FUNCTION"])
+    options = {
+        "FunctionName": name,
+        "Role": target["Role"],
+        "Handler": target["Handler"],
+        "Runtime": target["Runtime"],
+        "Timeout": target["Timeout"],
+        "MemorySize": memory,
+        "Architectures": [architecture],
+        "Layers": layers,
+        "Code": {"S3Bucket": os.environ["CODE_BUCKET"], "S3Key": os.environ["CODE_KEY"]},
+        "Environment": {"Variables": target.get("Environment", {}).get("Variables", {})},
+        "Description": f"Power tuning copy of {os.environ['TARGET_FUNCTION']}",
+        "Tags": {"ManagedBy": "ZacksCDK"},
+    }
+    vpc = target.get("VpcConfig") or {}
+    if vpc.get("SubnetIds"):
+        options["VpcConfig"] = {
+            "SubnetIds": vpc["SubnetIds"],
+            "SecurityGroupIds": vpc["SecurityGroupIds"],
+        }
+    if target.get("EphemeralStorage"):
+        options["EphemeralStorage"] = target["EphemeralStorage"]
+    lambda_client.create_function(**options)
+
+
+def delete_copy(name):
+    """Delete a tuning copy and its log group, if they exist"""
+    try:
+        lambda_client.delete_function(FunctionName=name)
+    except lambda_client.exceptions.ResourceNotFoundException:
+        pass
+    try:
+        logs_client.delete_log_group(logGroupName=f"/aws/lambda/{name}")
+    except logs_client.exceptions.ResourceNotFoundException:
+        pass
+
+
+def configure(name, memory, architecture, layers):
+    """Bring the tuning copy to a memory/architecture combination and wait until it is ready"""
+    current = get_configuration(name)
+    if current is not None and current.get("Architectures", ["x86_64"])[0] != architecture:
+        # Layers are architecture specific, so a new architecture gets a fresh copy
+        delete_copy(name)
+        current = None
+    if current is None:
+        create_copy(name, memory, architecture, layers)
+        lambda_client.get_waiter("function_active_v2").wait(FunctionName=name)
+        return
+    current_layers = [layer["Arn"] for layer in current.get("Layers", [])]
+    if current["MemorySize"] != memory or current_layers != layers:
+        lambda_client.update_function_configuration(
+            FunctionName=name,
+            MemorySize=memory,
+            Layers=layers,
+        )
+        lambda_client.get_waiter("function_updated_v2").wait(FunctionName=name)
+
+
+def invoke(name, payload):
+    """Invoke the tuning copy once and return its duration and billed duration"""
+    response = lambda_client.invoke(
+        FunctionName=name,
+        LogType="Tail",
+        Payload=json.dumps(payload).encode(),
+    )
+    if response.get("FunctionError"):
+        raise RuntimeError(f"Invocation of {name} failed")
+    log = base64.b64decode(response["LogResult"]).decode()
+    return (
+        float(DURATION_PATTERN.search(log).group(1)),
+        float(BILLED_DURATION_PATTERN.search(log).group(1)),
+    )
+
+
+def measure(configuration, name):
+    """Measure one memory/architecture combination"""
+    memory = int(configuration["memory"])
+    architecture = configuration["architecture"]
+    payload = configuration.get("payload") or {}
+    configure(name, memory, architecture, list(configuration.get("layers") or []))
+
+    # The first invocation absorbs the cold start and is not counted
+    invoke(name, payload)
+    durations, costs = [], []
+    for _ in range(int(configuration["invocations"])):
+        duration, billed = invoke(name, payload)
+        durations.append(duration)
+        costs.append(
+            billed / 1000.0 * memory / 1024.0 * GB_SECOND_PRICE[architecture]
+            + REQUEST_PRICE
+        )
+    return {
+        "memory": memory,
+        "architecture": architecture,
+        "invocations": len(durations),
+        "duration_ms": summarize(durations),
+        "cost_usd": summarize(costs),
+    }
+
+
+def handler(event, context):
+    name = copy_name(event["execution"])
+    if event.get("action") == "cleanup":
+        delete_copy(name)
+        return {"deleted": name}
+    return measure(event["configuration"], name)
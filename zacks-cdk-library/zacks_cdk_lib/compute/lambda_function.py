@@ -1,10 +1,23 @@
-from constructs import Construct
+import os
+
+import jsii
+from constructs import Construct, IValidation
 from aws_cdk import (
     aws_lambda as _lambda,
     aws_logs as logs,
     Duration,
     RemovalPolicy,
+    Stack,
 )
+from .asset_cache import AssetFingerprintCache
+from .dependency_layer import DependencyLayer
+
+HANDLERS_DIR = os.path.join(os.path.dirname(__file__), "handlers")
+
+COLD_START_MODES = ("snapstart", "lazy")
+
+# The cold start hooks are pure Python, so the layer works on every architecture
+COLD_START_LAYER_ID = "ColdStartHooksLayer"
 
 
 class LambdaFunction(Construct):
@@ -12,11 +25,15 @@ class LambdaFunction(Construct):
     A custom Lambda function construct with sensible defaults and additional features.
     
     Features:
-    - Configurable memory and timeout
+    - Configurable memory, timeout and architecture (x86_64 or arm64)
     - Log retention settings
     - Dead letter queue support (optional)
     - Environment variables
-    - VPC configuration (optional)
+    - VPC configuration with IPv6 egress in dual-stack subnets (optional)
+    - Provisioned concurrency on a live alias with auto-scaling (optional)
+    - Asset fingerprint cache for large code directories (optional)
+    - Shared dependency layer built from a requirements file (optional)
+    - SnapStart or lazy-init cold start mode with warmup hooks (optional)
     """
     
     def __init__(
@@ -28,31 +45,169 @@ def __init__(
         handler: str = "index.handler",
         runtime: _lambda.Runtime = _lambda.Runtime.PYTHON_3_9,
         memory_size: int = 128,
+        architecture: _lambda.Architecture = None,
         timeout: Duration = Duration.seconds(30),
         environment: dict = None,
         log_retention: logs.RetentionDays = logs.RetentionDays.ONE_WEEK,
         description: str = None,
+        dead_letter_queue_enabled: bool = False,
+        alias_name: str = "live",
+        provisioned_concurrency: int = None,
+        max_provisioned_concurrency: int = None,
+        utilization_target: float = 0.7,
+        scheduled_scaling: list = None,
+        asset_cache: AssetFingerprintCache = None,
+        dependency_layer: DependencyLayer = None,
+        requirements_path: str = None,
+        cold_start_mode: str = None,
+        warmup_imports: list = None,
+        warmup_clients: list = None,
+        ipv6_egress: bool = False,
         **kwargs
     ):
         super().__init__(scope, id)
         
+        # Let a VPC-attached function send traffic over IPv6 instead of through NAT
+        if ipv6_egress:
+            if kwargs.get("vpc") is None:
+                raise ValueError("ipv6_egress needs the function to be attached to a vpc")
+            kwargs["ipv6_allowed_for_dual_stack"] = True
+            if kwargs.get("security_groups") is None:
+                kwargs.setdefault("allow_all_ipv6_outbound", True)
+        
+        # Reject combinations Lambda would refuse at deploy time
+        self._validate_cold_start_mode(cold_start_mode, runtime, provisioned_concurrency, kwargs)
+        
+        # Keep the settings that companion constructs need to reproduce
+        if asset_cache is not None:
+            self.code = asset_cache.code_from_asset(self, code_path)
+        else:
+            self.code = _lambda.Code.from_asset(code_path)
+        self.memory_size = memory_size
+        self.timeout = timeout
+        self.architecture = architecture or _lambda.Architecture.X86_64
+        
+        # Share one dependency layer between every function with the same requirements
+        layers = list(kwargs.pop("layers", None) or [])
+        if requirements_path and dependency_layer is None:
+            dependency_layer = DependencyLayer.for_requirements(
+                self, requirements_path, runtime, self.architecture
+            )
+        if dependency_layer is not None:
+            layers.append(dependency_layer.layer)
+        self.dependency_layer = dependency_layer
+        
+        # Ship the cold start hooks and tell them what to warm up
+        environment = dict(environment or {})
+        if cold_start_mode:
+            layers.append(self._cold_start_layer())
+            environment["ZACKS_COLD_START_MODE"] = cold_start_mode
+            if warmup_imports:
+                environment["ZACKS_WARMUP_IMPORTS"] = ",".join(warmup_imports)
+            if warmup_clients:
+                environment["ZACKS_WARMUP_CLIENTS"] = ",".join(warmup_clients)
+        if cold_start_mode == "snapstart":
+            kwargs["snap_start"] = _lambda.SnapStartConf.ON_PUBLISHED_VERSIONS
+        
         # Create the Lambda function with provided parameters
         self.function = _lambda.Function(
             self,
             "Function",
             runtime=runtime,
             handler=handler,
-            code=_lambda.Code.from_asset(code_path),
+            code=self.code,
             memory_size=memory_size,
+            architecture=architecture,
+            layers=layers or None,
             timeout=timeout,
-            environment=environment or {},
+            environment=environment,
             description=description or f"Lambda function created with my-cdk-lib",
             log_retention=log_retention,
+            dead_letter_queue_enabled=dead_letter_queue_enabled or None,
             **kwargs
         )
         
         # Store the function as a public property
         self.lambda_function = self.function
+        self.layers = layers
+        self.dead_letter_queue = self.function.dead_letter_queue
+        
+        # Version and alias are only published when a mode needs them
+        self.version = None
+        self.alias = None
+        self.scaling = None
+        
+        # Keep provisioned environments on a live alias and scale them on utilization
+        if provisioned_concurrency:
+            self._add_alias(alias_name, provisioned_concurrency)
+            self.scaling = self.alias.add_auto_scaling(
+                min_capacity=provisioned_concurrency,
+                max_capacity=max_provisioned_concurrency or provisioned_concurrency * 2,
+            )
+            self.scaling.scale_on_utilization(utilization_target=utilization_target)
+            
+            # Add scheduled scaling windows for predictable peaks
+            for window in scheduled_scaling or []:
+                window = dict(window)
+                self.scaling.scale_on_schedule(window.pop("id"), **window)
+        
+        # SnapStart only applies to published versions
+        if cold_start_mode == "snapstart":
+            self._add_alias(alias_name)
+        
+        # Integrations should target the alias when one exists instead of $LATEST
+        self.invoke_target = self.alias or self.function
+        if self.alias is not None:
+            self.node.add_validation(_AliasOnlyValidation(self))
+    
+    def _add_alias(self, alias_name: str, provisioned_concurrency: int = None):
+        """Publish a version of the function and point the live alias at it"""
+        if self.alias is None:
+            self.version = self.function.current_version
+            self.alias = _lambda.Alias(
+                self,
+                "Alias",
+                alias_name=alias_name,
+                version=self.version,
+                provisioned_concurrent_executions=provisioned_concurrency,
+            )
+        return self.alias
+    
+    def _cold_start_layer(self):
+        """Return the stack's cold start hooks layer, creating it on first use"""
+        stack = Stack.of(self)
+        layer = stack.node.try_find_child(COLD_START_LAYER_ID)
+        if layer is None:
+            layer = _lambda.LayerVersion(
+                stack,
+                COLD_START_LAYER_ID,
+                code=_lambda.Code.from_asset(os.path.join(HANDLERS_DIR, "cold_start")),
+                description="Cold start hooks for zacks_cdk_lib LambdaFunctions",
+            )
+        return layer
+    
+    @staticmethod
+    def _validate_cold_start_mode(cold_start_mode, runtime, provisioned_concurrency, options):
+        """Raise if the cold start mode cannot be used with the other settings"""
+        if cold_start_mode is None:
+            return
+        if cold_start_mode not in COLD_START_MODES:
+            raise ValueError(
+                f"cold_start_mode must be one of {COLD_START_MODES}, got '{cold_start_mode}'"
+            )
+        if cold_start_mode != "snapstart":
+            return
+        if not supports_snap_start(runtime):
+            raise ValueError(
+                f"SnapStart is not supported for {runtime.name}; use Python 3.12 or later"
+            )
+        if provisioned_concurrency:
+            raise ValueError("SnapStart cannot be combined with provisioned concurrency")
+        if options.get("filesystem") is not None:
+            raise ValueError("SnapStart cannot be combined with an EFS file system")
+        storage = options.get("ephemeral_storage_size")
+        if storage is not None and storage.to_mebibytes() > 512:
+            raise ValueError("SnapStart cannot be combined with more than 512 MB of /tmp storage")
     
     def add_environment_variable(self, key: str, value: str):
         """Add an environment variable to the Lambda function"""
@@ -62,4 +217,38 @@ def add_environment_variable(self, key: str, value: str):
     def grant_invoke(self, identity):
         """Grant invoke permissions to the given identity"""
         self.function.grant_invoke(identity)
-        return self
\ No newline at end of file
+        return self
+
+
+def supports_snap_start(runtime: _lambda.Runtime) -> bool:
+    """Whether Lambda SnapStart is available for a Python runtime"""
+    if runtime.family != _lambda.RuntimeFamily.PYTHON:
+        return False
+    version = runtime.name[len("python"):].split(".")
+    return tuple(int(part) for part in version) >= (3, 12)
+
+
+@jsii.implements(IValidation)
+class _AliasOnlyValidation:
+    """Fail synth when an integration invokes a LambdaFunction at $LATEST instead of its alias"""
+    
+    def __init__(self, function: LambdaFunction):
+        self.function = function
+    
+    def validate(self):
+        stack = Stack.of(self.function)
+        unqualified = [
+            stack.resolve(self.function.function.function_name),
+            stack.resolve(self.function.function.function_arn),
+        ]
+        errors = []
+        for construct in stack.node.find_all():
+            if not isinstance(construct, (_lambda.CfnPermission, _lambda.CfnEventSourceMapping)):
+                continue
+            if stack.resolve(construct.function_name) in unqualified:
+                errors.append(
+                    f"{construct.node.path} invokes {self.function.node.path} at $LATEST; "
+                    f"integrate with its invoke_target ('{self.function.alias.alias_name}' alias) "
+                    f"instead"
+                )
+        return errors
\ No newline at end of file
@@ -0,0 +1,272 @@
+import os
+
+from constructs import Construct
+from aws_cdk import (
+    aws_iam as iam,
+    aws_lambda as _lambda,
+    aws_stepfunctions as sfn,
+    aws_stepfunctions_tasks as tasks,
+    ArnFormat,
+    Aws,
+    Duration,
+    Names,
+    Stack,
+)
+from .dependency_layer import DependencyLayer
+from .lambda_function import COLD_START_LAYER_ID, HANDLERS_DIR, LambdaFunction
+from ..storage import SecureS3Bucket
+
+
+class LambdaPowerTuner(Construct):
+    """
+    A Step Functions state machine that profiles a LambdaFunction across
+    memory sizes and architectures.
+    
+    Features:
+    - Runs every memory/architecture combination against the target function
+    - Duration and cost percentiles (p50/p90/p99) per combination
+    - Results written as JSON to a SecureS3Bucket
+    - Measurements run on a temporary copy of the function, so the deployed
+      function, its versions and aliases are never modified
+    - Layers matched to each architecture (dependency layers rebuilt for it)
+    """
+    
+    def __init__(
+        self,
+        scope: Construct,
+        id: str,
+        *,
+        function: LambdaFunction,
+        memory_sizes: list = None,
+        architectures: list = None,
+        invocations: int = 20,
+        payload: dict = None,
+        architecture_layers: dict = None,
+        results_bucket: SecureS3Bucket = None,
+        results_prefix: str = "power-tuning/",
+        **kwargs
+    ):
+        super().__init__(scope, id)
+        
+        memory_sizes = memory_sizes or [128, 256, 512, 1024, 1769, 3008]
+        architectures = architectures or [
+            _lambda.Architecture.X86_64,
+            _lambda.Architecture.ARM_64,
+        ]
+        
+        # Create a results bucket if not provided
+        self.results_bucket = results_bucket or SecureS3Bucket(self, "ResultsBucket")
+        
+        # Measurements run on temporary copies named after this prefix, never on the target
+        self.copy_prefix = Names.unique_resource_name(self, max_length=40, separator="-")
+        
+        # Locate the deployed code so the executor can create the copies
+        code_config = function.code.bind(function.function)
+        code_location = code_config.s3_location
+        
+        # Create the executor that creates, invokes and measures the copies
+        self.executor = LambdaFunction(
+            self,
+            "Executor",
+            code_path=os.path.join(HANDLERS_DIR, "power_tuning"),
+            memory_size=256,
+            timeout=Duration.minutes(15),
+            environment={
+                "TARGET_FUNCTION": function.function.function_name,
+                "COPY_PREFIX": self.copy_prefix,
+                "CODE_BUCKET": code_location.bucket_name,
+                "CODE_KEY": code_location.object_key,
+            },
+            description=f"Power tuning executor for {function.node.path}",
+        )
+        
+        # Build the list of combinations to measure, each with layers for its architecture
+        configurations = []
+        layer_arns = set()
+        for architecture in architectures:
+            layers = self._layers_for(function, architecture, architecture_layers or {})
+            layer_arns.update(layers)
+            configurations.extend(
+                {
+                    "memory": memory,
+                    "architecture": architecture.name,
+                    "layers": layers,
+                    "invocations": invocations,
+                    "payload": payload or {},
+                }
+                for memory in memory_sizes
+            )
+        self._grant_executor(function, code_location, sorted(layer_arns))
+        
+        # Combinations run one at a time because they share the same copy
+        plan = sfn.Pass(
+            self,
+            "Plan",
+            parameters={"configurations": configurations},
+        )
+        measure = sfn.Map(
+            self,
+            "MeasureConfigurations",
+            items_path=sfn.JsonPath.string_at("$.configurations"),
+            item_selector={
+                "configuration": sfn.JsonPath.string_at("$$.Map.Item.Value"),
+                "execution": sfn.JsonPath.execution_name,
+            },
+            max_concurrency=1,
+            result_path="$.results",
+        )
+        measure.item_processor(
+            tasks.LambdaInvoke(
+                self,
+                "Measure",
+                lambda_function=self.executor.function,
+                payload_response_only=True,
+            )
+        )
+        cleanup_payload = sfn.TaskInput.from_object({
+            "action": "cleanup",
+            "execution": sfn.JsonPath.execution_name,
+        })
+        cleanup = tasks.LambdaInvoke(
+            self,
+            "Cleanup",
+            lambda_function=self.executor.function,
+            payload=cleanup_payload,
+            result_path=sfn.JsonPath.DISCARD,
+        )
+        write_results = tasks.CallAwsService(
+            self,
+            "WriteResults",
+            service="s3",
+            action="putObject",
+            parameters={
+                "Bucket": self.results_bucket.bucket.bucket_name,
+                "Key": sfn.JsonPath.format(
+                    f"{results_prefix}{{}}.json",
+                    sfn.JsonPath.execution_name,
+                ),
+                "ContentType": "application/json",
+                "Body": sfn.JsonPath.json_to_string(sfn.JsonPath.object_at("$.results")),
+            },
+            iam_resources=[self.results_bucket.bucket.arn_for_objects(f"{results_prefix}*")],
+            result_path=sfn.JsonPath.DISCARD,
+        )
+        
+        # Always delete the copy, even on failure
+        cleanup_after_failure = tasks.LambdaInvoke(
+            self,
+            "CleanupAfterFailure",
+            lambda_function=self.executor.function,
+            payload=cleanup_payload,
+            result_path=sfn.JsonPath.DISCARD,
+        ).next(sfn.Fail(self, "TuningFailed"))
+        measure.add_catch(cleanup_after_failure, result_path="$.error")
+        
+        self.state_machine = sfn.StateMachine(
+            self,
+            "StateMachine",
+            definition_body=sfn.DefinitionBody.from_chainable(
+                plan.next(measure).next(cleanup).next(write_results)
+            ),
+            timeout=Duration.hours(6),
+            **kwargs
+        )
+        self.results_bucket.grant_write(self.state_machine)
+    
+    def _layers_for(self, function, architecture, architecture_layers: dict) -> list:
+        """Layer ARNs to attach to the copy of the function for one architecture"""
+        if architecture.name in architecture_layers:
+            return [layer.layer_version_arn for layer in architecture_layers[architecture.name]]
+        if architecture.name == function.architecture.name:
+            return [layer.layer_version_arn for layer in function.layers]
+        
+        arns = []
+        for layer in function.layers:
+            dependency_layer = function.dependency_layer
+            if dependency_layer is not None and layer is dependency_layer.layer:
+                # Rebuild the requirements with wheels for the other architecture
+                layer = DependencyLayer.for_requirements(
+                    self,
+                    dependency_layer.requirements_path,
+                    dependency_layer.runtime,
+                    architecture,
+                ).layer
+            elif layer.node.id != COLD_START_LAYER_ID:
+                raise ValueError(
+                    f"Layer {layer.node.path} of {function.node.path} may not work on "
+                    f"{architecture.name}; pass its {architecture.name} build in "
+                    f"architecture_layers"
+                )
+            arns.append(layer.layer_version_arn)
+        return arns
+    
+    def _grant_executor(self, function, code_location, layer_arns: list):
+        """Let the executor read the target and manage its tuning copies"""
+        stack = Stack.of(self)
+        copy_arn = stack.format_arn(
+            service="lambda",
+            resource="function",
+            resource_name=f"{self.copy_prefix}-*",
+            arn_format=ArnFormat.COLON_RESOURCE_NAME,
+        )
+        statements = [
+            iam.PolicyStatement(
+                actions=["lambda:GetFunctionConfiguration"],
+                resources=[function.function.function_arn],
+            ),
+            iam.PolicyStatement(
+                actions=[
+                    "lambda:CreateFunction",
+                    "lambda:GetFunctionConfiguration",
+                    "lambda:UpdateFunctionConfiguration",
+                    "lambda:DeleteFunction",
+                    "lambda:InvokeFunction",
+                    "lambda:TagResource",
+                ],
+                resources=[copy_arn],
+            ),
+            iam.PolicyStatement(
+                actions=["logs:DeleteLogGroup"],
+                resources=[
+                    stack.format_arn(
+                        service="logs",
+                        resource="log-group",
+                        resource_name=f"/aws/lambda/{self.copy_prefix}-*",
+                        arn_format=ArnFormat.COLON_RESOURCE_NAME,
+                    )
+                ],
+            ),
+            iam.PolicyStatement(
+                actions=["iam:PassRole"],
+                resources=[function.function.role.role_arn],
+            ),
+            iam.PolicyStatement(
+                actions=["s3:GetObject"],
+                resources=[
+                    f"arn:{Aws.PARTITION}:s3:::{code_location.bucket_name}"
+                    f"/{code_location.object_key}"
+                ],
+            ),
+        ]
+        if layer_arns:
+            statements.append(
+                iam.PolicyStatement(actions=["lambda:GetLayerVersion"], resources=layer_arns)
+            )
+        if function.function.is_bound_to_vpc:
+            # Creating a function in a VPC checks the subnets and security groups
+            statements.append(
+                iam.PolicyStatement(
+                    actions=[
+                        "ec2:DescribeSecurityGroups",
+                        "ec2:DescribeSubnets",
+                        "ec2:DescribeVpcs",
+                    ],
+                    resources=["*"],
+                )
+            )
+        for statement in statements:
+            self.executor.function.add_to_role_policy(statement)
+    
+    def grant_start_execution(self, identity):
+        """Grant permission to start a tuning run to the given identity"""
+        return self.state_machine.grant_start_execution(identity)
\ No newline at end of file
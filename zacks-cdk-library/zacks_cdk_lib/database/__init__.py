@@ -1,3 +1,13 @@
-from .dynamo_table import EnhancedDynamoTable
+from typing import TYPE_CHECKING
 
-__all__ = ['EnhancedDynamoTable']
\ No newline at end of file
+from .._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .dynamo_table import EnhancedDynamoTable
+
+__all__ = ['EnhancedDynamoTable']
+
+# Constructs are imported on first access, so only the jsii modules in use get loaded
+__getattr__, __dir__ = lazy_exports(__name__, {
+    'EnhancedDynamoTable': '.dynamo_table',
+})
\ No newline at end of file
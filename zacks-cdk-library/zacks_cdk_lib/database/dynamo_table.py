@@ -1,9 +1,37 @@
+import hashlib
+from decimal import Decimal
+
 from constructs import Construct
 from aws_cdk import (
+    aws_dax as dax,
     aws_dynamodb as dynamodb,
+    aws_ec2 as ec2,
+    aws_iam as iam,
+    Duration,
     RemovalPolicy,
 )
 
+# DAX API actions matching the DynamoDB read and write grants
+DAX_READ_ACTIONS = [
+    "dax:BatchGetItem",
+    "dax:ConditionCheckItem",
+    "dax:GetItem",
+    "dax:Query",
+    "dax:Scan",
+]
+DAX_WRITE_ACTIONS = [
+    "dax:BatchWriteItem",
+    "dax:DeleteItem",
+    "dax:PutItem",
+    "dax:UpdateItem",
+]
+
+# Port DAX serves TLS-encrypted traffic on
+DAX_TLS_PORT = 9111
+
+# GSI that indexes every item by its write shard for scatter-gather reads
+SCATTER_GATHER_INDEX_NAME = "ScatterGatherIndex"
+
 
 class EnhancedDynamoTable(Construct):
     """
@@ -12,10 +40,14 @@ class EnhancedDynamoTable(Construct):
     Features:
     - Configurable capacity (on-demand by default)
     - Point-in-time recovery
-    - Auto-scaling (for provisioned capacity)
+    - Target-tracking and scheduled auto-scaling for the table and its GSIs
+      (for provisioned capacity)
     - TTL support
     - Stream configuration
     - Global secondary indexes
+    - DAX accelerator cluster in a VPC (optional)
+    - CloudWatch Contributor Insights for the table and its GSIs (optional)
+    - Write sharding of hot partition keys with a scatter-gather GSI (optional)
     """
     
     def __init__(
@@ -34,10 +66,38 @@ def __init__(
         stream: dynamodb.StreamViewType = None,
         ttl_attribute: str = None,
         global_indexes: list = None,
+        max_read_capacity: int = None,
+        max_write_capacity: int = None,
+        target_utilization: int = 70,
+        scheduled_scaling: list = None,
+        dax_vpc: ec2.IVpc = None,
+        dax_subnet_type: ec2.SubnetType = ec2.SubnetType.PRIVATE_WITH_EGRESS,
+        dax_node_type: str = "dax.t3.small",
+        dax_replication_factor: int = 3,
+        dax_item_ttl: Duration = Duration.minutes(5),
+        dax_query_ttl: Duration = Duration.minutes(5),
+        contributor_insights: bool = False,
+        write_shards: int = None,
+        shard_attribute: str = "shard",
+        shard_separator: str = "#",
+        scatter_gather_sort_key: dynamodb.Attribute = None,
         **kwargs
     ):
         super().__init__(scope, id)
         
+        if write_shards is not None:
+            if write_shards < 2:
+                raise ValueError("write_shards must be at least 2")
+            if partition_key.type != dynamodb.AttributeType.STRING:
+                raise ValueError("Write sharding needs a string partition key to suffix")
+        
+        # Report the most accessed and throttled keys of the table and every GSI
+        self._contributor_insights = (
+            dynamodb.ContributorInsightsSpecification(enabled=True)
+            if contributor_insights
+            else None
+        )
+        
         # Create the DynamoDB table
         self.table = dynamodb.Table(
             self,
@@ -51,6 +111,7 @@ def __init__(
             point_in_time_recovery=point_in_time_recovery,
             removal_policy=removal_policy,
             stream=stream,
+            contributor_insights_specification=self._contributor_insights,
             **kwargs
         )
         
@@ -58,10 +119,187 @@ def __init__(
         if ttl_attribute:
             self.table.add_time_to_live_attribute(ttl_attribute)
         
+        # Scale provisioned capacity between the given capacity and the maximum
+        self._auto_scaling = None
+        if billing_mode == dynamodb.BillingMode.PROVISIONED and (
+            max_read_capacity or max_write_capacity
+        ):
+            self._auto_scaling = {
+                "read_capacity": read_capacity or 5,
+                "write_capacity": write_capacity or 5,
+                "max_read_capacity": max_read_capacity,
+                "max_write_capacity": max_write_capacity,
+                "target_utilization": target_utilization,
+                "scheduled_scaling": scheduled_scaling or [],
+            }
+            self._add_auto_scaling()
+        
         # Add global secondary indexes if provided
         if global_indexes:
             for index in global_indexes:
-                self.table.add_global_secondary_index(**index)
+                self.add_global_secondary_index(**index)
+        
+        # Spread each logical partition key over N suffixed keys ("key#0".."key#N-1")
+        self.write_shards = write_shards
+        self.shard_attribute = None
+        self.scatter_gather_index_name = None
+        self.sharding_environment = {}
+        if write_shards is not None:
+            self._add_write_sharding(
+                partition_key,
+                write_shards,
+                shard_attribute,
+                shard_separator,
+                scatter_gather_sort_key or sort_key,
+            )
+        
+        # Put a DAX cluster in front of the table if a VPC is provided
+        self.dax_vpc = dax_vpc
+        self.dax_cluster = None
+        self.dax_endpoint = None
+        if dax_vpc is not None:
+            self._add_dax_cluster(
+                dax_vpc,
+                dax_subnet_type,
+                dax_node_type,
+                dax_replication_factor,
+                dax_item_ttl,
+                dax_query_ttl,
+            )
+    
+    def _add_write_sharding(
+        self,
+        partition_key: dynamodb.Attribute,
+        write_shards: int,
+        shard_attribute: str,
+        shard_separator: str,
+        sort_key: dynamodb.Attribute = None,
+    ):
+        """Add the scatter-gather GSI and record the sharding scheme for writers"""
+        self.shard_attribute = shard_attribute
+        self.scatter_gather_index_name = SCATTER_GATHER_INDEX_NAME
+        
+        # Writers also store the shard number, so readers can query every shard in parallel
+        self.add_global_secondary_index(
+            index_name=SCATTER_GATHER_INDEX_NAME,
+            partition_key=dynamodb.Attribute(
+                name=shard_attribute,
+                type=dynamodb.AttributeType.NUMBER,
+            ),
+            sort_key=sort_key,
+        )
+        
+        self.sharding_environment = {
+            "SHARD_COUNT": str(write_shards),
+            "SHARD_PARTITION_KEY": partition_key.name,
+            "SHARD_SEPARATOR": shard_separator,
+            "SHARD_ATTRIBUTE": shard_attribute,
+            "SHARD_INDEX_NAME": SCATTER_GATHER_INDEX_NAME,
+        }
+    
+    def configure_sharding(self, function, prefix: str = ""):
+        """
+        Pass the write-sharding scheme to a LambdaFunction as environment variables.
+        
+        Writers store items under "<key><SHARD_SEPARATOR><n>" with n in
+        [0, SHARD_COUNT) and the same n in SHARD_ATTRIBUTE, where n is
+        write_shard(SHARD_COUNT, key, sort_key): a stable hash of the item's
+        primary key, so every write and delete of an item lands on one shard
+        while the items of a hot partition key spread over all of them.
+        Readers of a single item compute its shard; readers of a logical key
+        query all SHARD_COUNT keys; readers of the whole table query
+        SHARD_INDEX_NAME once per shard number and merge the results.
+        """
+        if self.write_shards is None:
+            raise ValueError(f"{self.node.path} has no write sharding; set write_shards")
+        for key, value in self.sharding_environment.items():
+            function.add_environment_variable(f"{prefix}{key}", value)
+        return self
+    
+    @staticmethod
+    def write_shard(shard_count: int, partition_key, sort_key=None) -> int:
+        """
+        The write shard of an item under the configure_sharding scheme.
+        
+        SHA-256 of the partition key value, plus a NUL byte and the sort key
+        value when the table has one (numbers in plain notation without
+        trailing zeros), with the first 8 bytes read as a big-endian integer
+        modulo shard_count.
+        """
+        key = _key_string(partition_key)
+        if sort_key is not None:
+            key += "\0" + _key_string(sort_key)
+        digest = hashlib.sha256(key.encode("utf-8")).digest()
+        return int.from_bytes(digest[:8], "big") % shard_count
+    
+    def _add_dax_cluster(
+        self,
+        vpc: ec2.IVpc,
+        subnet_type: ec2.SubnetType,
+        node_type: str,
+        replication_factor: int,
+        item_ttl: Duration,
+        query_ttl: Duration,
+    ):
+        """Create a DAX cluster with its subnet group, parameter group and security group"""
+        subnet_group = dax.CfnSubnetGroup(
+            self,
+            "DaxSubnetGroup",
+            subnet_ids=vpc.select_subnets(subnet_type=subnet_type).subnet_ids,
+            description=f"DAX subnet group for {self.node.path}",
+        )
+        
+        # Item and query cache TTLs
+        parameter_group = dax.CfnParameterGroup(
+            self,
+            "DaxParameterGroup",
+            description=f"DAX parameters for {self.node.path}",
+            parameter_name_values={
+                "record-ttl-millis": str(int(item_ttl.to_milliseconds())),
+                "query-ttl-millis": str(int(query_ttl.to_milliseconds())),
+            },
+        )
+        
+        # Clients are allowed in with allow_dax_access_from
+        self.dax_security_group = ec2.SecurityGroup(
+            self,
+            "DaxSecurityGroup",
+            vpc=vpc,
+            description=f"Security group for DAX cluster of {self.node.path}",
+            allow_all_outbound=False,
+        )
+        self.dax_connections = ec2.Connections(
+            security_groups=[self.dax_security_group],
+            default_port=ec2.Port.tcp(DAX_TLS_PORT),
+        )
+        
+        # DAX reads and writes the table with its own role
+        role = iam.Role(
+            self,
+            "DaxRole",
+            assumed_by=iam.ServicePrincipal("dax.amazonaws.com"),
+        )
+        self.table.grant_read_write_data(role)
+        
+        self.dax_cluster = dax.CfnCluster(
+            self,
+            "DaxCluster",
+            iam_role_arn=role.role_arn,
+            node_type=node_type,
+            replication_factor=replication_factor,
+            subnet_group_name=subnet_group.ref,
+            parameter_group_name=parameter_group.ref,
+            security_group_ids=[self.dax_security_group.security_group_id],
+            cluster_endpoint_encryption_type="TLS",
+            sse_specification=dax.CfnCluster.SSESpecificationProperty(sse_enabled=True),
+        )
+        self.dax_cluster.node.add_dependency(role)
+        self.dax_endpoint = self.dax_cluster.attr_cluster_discovery_endpoint_url
+    
+    def allow_dax_access_from(self, other: ec2.IConnectable):
+        """Allow the given connectable (e.g. a Lambda function) to reach the DAX cluster"""
+        self.dax_connections.allow_default_port_from(other, "Allow DAX access")
+        return self
     
     def add_global_secondary_index(
         self,
@@ -72,8 +310,20 @@ def add_global_secondary_index(
         write_capacity: int = None,
         projection_type: dynamodb.ProjectionType = dynamodb.ProjectionType.ALL,
         non_key_attributes: list = None,
+        max_read_capacity: int = None,
+        max_write_capacity: int = None,
+        **kwargs
     ):
-        """Add a global secondary index to the table"""
+        """Add a global secondary index to the table, auto-scaled like the table"""
+        # Indexes get the table's Contributor Insights setting unless given their own
+        if self._contributor_insights is not None and "contributor_insights_enabled" not in kwargs:
+            kwargs.setdefault("contributor_insights_specification", self._contributor_insights)
+        
+        # Auto-scaled indexes start from the table's capacity unless given their own
+        if self._auto_scaling is not None:
+            read_capacity = read_capacity or self._auto_scaling["read_capacity"]
+            write_capacity = write_capacity or self._auto_scaling["write_capacity"]
+        
         self.table.add_global_secondary_index(
             index_name=index_name,
             partition_key=partition_key,
@@ -82,17 +332,97 @@ def add_global_secondary_index(
             write_capacity=write_capacity,
             projection_type=projection_type,
             non_key_attributes=non_key_attributes,
+            **kwargs
         )
+        if self._auto_scaling is not None:
+            self._add_auto_scaling(
+                index_name=index_name,
+                read_capacity=read_capacity,
+                write_capacity=write_capacity,
+                max_read_capacity=max_read_capacity,
+                max_write_capacity=max_write_capacity,
+            )
         return self
     
+    def _add_auto_scaling(
+        self,
+        index_name: str = None,
+        read_capacity: int = None,
+        write_capacity: int = None,
+        max_read_capacity: int = None,
+        max_write_capacity: int = None,
+    ):
+        """Register target tracking and scheduled scaling for the table or one of its GSIs"""
+        settings = self._auto_scaling
+        dimensions = [
+            (
+                "read",
+                read_capacity or settings["read_capacity"],
+                max_read_capacity or settings["max_read_capacity"],
+            ),
+            (
+                "write",
+                write_capacity or settings["write_capacity"],
+                max_write_capacity or settings["max_write_capacity"],
+            ),
+        ]
+        for dimension, min_capacity, max_capacity in dimensions:
+            if not max_capacity:
+                continue
+            if index_name is None and dimension == "read":
+                scalable = self.table.auto_scale_read_capacity(
+                    min_capacity=min_capacity, max_capacity=max_capacity
+                )
+            elif index_name is None:
+                scalable = self.table.auto_scale_write_capacity(
+                    min_capacity=min_capacity, max_capacity=max_capacity
+                )
+            elif dimension == "read":
+                scalable = self.table.auto_scale_global_secondary_index_read_capacity(
+                    index_name, min_capacity=min_capacity, max_capacity=max_capacity
+                )
+            else:
+                scalable = self.table.auto_scale_global_secondary_index_write_capacity(
+                    index_name, min_capacity=min_capacity, max_capacity=max_capacity
+                )
+            scalable.scale_on_utilization(
+                target_utilization_percent=settings["target_utilization"]
+            )
+            
+            # Scheduled windows apply to the table and every GSI unless limited to one dimension
+            for window in settings["scheduled_scaling"]:
+                window = dict(window)
+                if window.pop("dimension", dimension) != dimension:
+                    continue
+                scalable.scale_on_schedule(window.pop("id"), **window)
+    
     def grant_read_data(self, identity):
         """Grant read permissions to the given identity"""
+        self._grant_dax(identity, DAX_READ_ACTIONS)
         return self.table.grant_read_data(identity)
     
     def grant_write_data(self, identity):
         """Grant write permissions to the given identity"""
+        self._grant_dax(identity, DAX_WRITE_ACTIONS)
         return self.table.grant_write_data(identity)
     
     def grant_read_write_data(self, identity):
         """Grant read and write permissions to the given identity"""
-        return self.table.grant_read_write_data(identity)
\ No newline at end of file
+        self._grant_dax(identity, DAX_READ_ACTIONS + DAX_WRITE_ACTIONS)
+        return self.table.grant_read_write_data(identity)
+    
+    def _grant_dax(self, identity, actions: list):
+        """Grant the given DAX actions on the cluster, if there is one"""
+        if self.dax_cluster is not None:
+            iam.Grant.add_to_principal(
+                grantee=identity,
+                actions=actions,
+                resource_arns=[self.dax_cluster.attr_arn],
+            )
+
+
+def _key_string(value) -> str:
+    """Key value as hashed by write_shard"""
+    if isinstance(value, (int, float, Decimal)) and not isinstance(value, bool):
+        return format(Decimal(str(value)).normalize(), "f")
+    return str(value)
\ No newline at end of file
@@ -1,3 +1,13 @@
-from .vpc import StandardVpc
+from typing import TYPE_CHECKING
 
-__all__ = ['StandardVpc']
\ No newline at end of file
+from .._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .vpc import StandardVpc
+
+__all__ = ['StandardVpc']
+
+# Constructs are imported on first access, so only the jsii modules in use get loaded
+__getattr__, __dir__ = lazy_exports(__name__, {
+    'StandardVpc': '.vpc',
+})
\ No newline at end of file
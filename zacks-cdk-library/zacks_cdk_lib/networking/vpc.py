@@ -1,8 +1,79 @@
 from constructs import Construct
 from aws_cdk import (
     aws_ec2 as ec2,
+    aws_glue as glue,
+    aws_iam as iam,
+    Aws,
+    Fn,
+    Names,
     Tags,
 )
+from ..storage import SecureS3Bucket
+
+# Interface endpoints created by the endpoint profile unless a list is given
+DEFAULT_INTERFACE_ENDPOINTS = [
+    "ecr.api",
+    "ecr.dkr",
+    "logs",
+    "monitoring",
+    "sts",
+    "ssm",
+    "secretsmanager",
+]
+
+# Flow log fields delivered to S3 unless a list is given
+DEFAULT_FLOW_LOG_FIELDS = [
+    "version",
+    "account-id",
+    "interface-id",
+    "srcaddr",
+    "dstaddr",
+    "srcport",
+    "dstport",
+    "protocol",
+    "packets",
+    "bytes",
+    "start",
+    "end",
+    "action",
+    "log-status",
+    "vpc-id",
+    "subnet-id",
+    "instance-id",
+    "tcp-flags",
+    "pkt-srcaddr",
+    "pkt-dstaddr",
+    "az-id",
+    "flow-direction",
+    "traffic-path",
+]
+
+# Athena column types of numeric flow log fields; every other field is a string
+FLOW_LOG_FIELD_TYPES = {
+    "version": "int",
+    "srcport": "int",
+    "dstport": "int",
+    "protocol": "bigint",
+    "packets": "bigint",
+    "bytes": "bigint",
+    "start": "bigint",
+    "end": "bigint",
+    "tcp-flags": "int",
+    "traffic-path": "int",
+    "ecs-task-count": "int",
+}
+
+# Hive SerDe Athena uses to read the Parquet flow log files
+PARQUET_SERDE = "org.apache.hadoop.hive.ql.io.parquet.serde.ParquetHiveSerDe"
+
+# Key policy actions log delivery needs to write flow logs to an SSE-KMS bucket
+FLOW_LOG_KEY_ACTIONS = [
+    "kms:Encrypt",
+    "kms:Decrypt",
+    "kms:ReEncrypt*",
+    "kms:GenerateDataKey*",
+    "kms:DescribeKey",
+]
 
 
 class StandardVpc(Construct):
@@ -11,10 +82,14 @@ class StandardVpc(Construct):
     
     Features:
     - Public and private subnets across multiple AZs
-    - NAT gateways for private subnet internet access
-    - VPC flow logs
+    - NAT gateways for private subnet internet access (optionally one per AZ)
+    - VPC flow logs, to CloudWatch Logs or as hourly Parquet partitions in a
+      SecureS3Bucket with an Athena-ready Glue table (optional)
     - Network ACLs
     - Standard CIDR allocation
+    - S3/DynamoDB gateway endpoints and interface endpoints that bypass NAT (optional)
+    - One security group shared by every interface endpoint
+    - Dual-stack IPv6 with an egress-only internet gateway for private subnets (optional)
     """
     
     def __init__(
@@ -26,7 +101,15 @@ def __init__(
         max_azs: int = 2,
         nat_gateways: int = 1,
         enable_flow_logs: bool = True,
+        flow_log_bucket: SecureS3Bucket = None,
+        flow_log_prefix: str = "vpc-flow-logs/",
+        flow_log_fields: list = None,
+        flow_log_database_name: str = None,
         subnet_configuration: list = None,
+        nat_gateway_per_az: bool = False,
+        endpoint_profile: bool = False,
+        interface_endpoints: list = None,
+        dual_stack: bool = False,
         **kwargs
     ):
         super().__init__(scope, id)
@@ -51,23 +134,182 @@ def __init__(
                 ),
             ]
         
+        # Dual stack gives every subnet an IPv6 CIDR, and private subnets an
+        # egress-only internet gateway route for ::/0 that skips the NAT gateways
+        self.dual_stack = dual_stack
+        if dual_stack:
+            kwargs["ip_protocol"] = ec2.IpProtocol.DUAL_STACK
+        
         # Create the VPC
         self.vpc = ec2.Vpc(
             self,
             "VPC",
             cidr=cidr,
             max_azs=max_azs,
-            nat_gateways=nat_gateways,
+            nat_gateways=None if nat_gateway_per_az else nat_gateways,
             subnet_configuration=subnet_configuration,
             **kwargs
         )
         
         # Add flow logs if enabled
-        if enable_flow_logs:
+        self.flow_log_table = None
+        self.flow_log_database_name = None
+        self.flow_log_table_name = None
+        if enable_flow_logs and flow_log_bucket is not None:
+            self._add_s3_flow_log(
+                flow_log_bucket,
+                flow_log_prefix,
+                flow_log_fields or DEFAULT_FLOW_LOG_FIELDS,
+                flow_log_database_name,
+            )
+        elif enable_flow_logs:
             self.vpc.add_flow_log("FlowLog")
         
         # Add standard tags
         Tags.of(self.vpc).add("Name", f"{id}-vpc")
+        
+        # Keep AWS service traffic off the NAT gateways
+        self._endpoint_security_group = None
+        if endpoint_profile:
+            self.add_gateway_endpoint(ec2.GatewayVpcEndpointAwsService.S3)
+            self.add_gateway_endpoint(ec2.GatewayVpcEndpointAwsService.DYNAMODB)
+            if interface_endpoints is None:
+                interface_endpoints = DEFAULT_INTERFACE_ENDPOINTS
+        for service_name in interface_endpoints or []:
+            self.add_interface_endpoint(service_name)
+    
+    def _add_s3_flow_log(
+        self,
+        bucket: SecureS3Bucket,
+        prefix: str,
+        fields: list,
+        database_name: str = None,
+    ):
+        """
+        Deliver flow logs to S3 as Parquet and describe them with a Glue table.
+        
+        A KMS-encrypted bucket's key is granted to log delivery through its key
+        policy, so a key imported from another stack gets no grant; its own key
+        policy has to allow delivery.logs.amazonaws.com.
+        """
+        prefix = prefix.strip("/") + "/" if prefix.strip("/") else ""
+        self.vpc.add_flow_log(
+            "FlowLog",
+            destination=ec2.FlowLogDestination.to_s3(
+                bucket.bucket,
+                prefix,
+                file_format=ec2.FlowLogFileFormat.PARQUET,
+                hive_compatible_partitions=True,
+                per_hour_partition=True,
+            ),
+            log_format=[ec2.LogFormat.field(field) for field in fields],
+            max_aggregation_interval=ec2.FlowLogMaxAggregationInterval.ONE_MINUTE,
+        )
+        
+        # Log delivery encrypts with the bucket's key when it has one
+        if bucket.bucket.encryption_key is not None:
+            bucket.bucket.encryption_key.grant(
+                iam.ServicePrincipal("delivery.logs.amazonaws.com"),
+                *FLOW_LOG_KEY_ACTIONS,
+            )
+        
+        # Use the given Glue database or create one for this VPC; the table name is
+        # unique so several VPCs can share a database
+        unique_name = Names.unique_resource_name(self, max_length=54, separator="_").lower()
+        if database_name is None:
+            database = glue.CfnDatabase(
+                self,
+                "FlowLogDatabase",
+                catalog_id=Aws.ACCOUNT_ID,
+                database_input=glue.CfnDatabase.DatabaseInputProperty(
+                    name=unique_name,
+                ),
+            )
+            database_name = database.ref
+        
+        # Partition projection lets Athena compute partitions from the query instead of the catalog
+        location = Fn.join("", [
+            f"s3://{bucket.bucket.bucket_name}/{prefix}AWSLogs/aws-account-id=",
+            Aws.ACCOUNT_ID,
+            "/aws-service=vpcflowlogs/aws-region=",
+            Aws.REGION,
+            "/",
+        ])
+        self.flow_log_table = glue.CfnTable(
+            self,
+            "FlowLogTable",
+            catalog_id=Aws.ACCOUNT_ID,
+            database_name=database_name,
+            table_input=glue.CfnTable.TableInputProperty(
+                name=f"{unique_name}_flow_logs",
+                table_type="EXTERNAL_TABLE",
+                parameters={
+                    "classification": "parquet",
+                    "EXTERNAL": "TRUE",
+                    "projection.enabled": "true",
+                    "projection.year.type": "integer",
+                    "projection.year.range": "2020,2099",
+                    "projection.month.type": "integer",
+                    "projection.month.range": "1,12",
+                    "projection.month.digits": "2",
+                    "projection.day.type": "integer",
+                    "projection.day.range": "1,31",
+                    "projection.day.digits": "2",
+                    "projection.hour.type": "integer",
+                    "projection.hour.range": "0,23",
+                    "projection.hour.digits": "2",
+                    "storage.location.template": Fn.join("", [
+                        location,
+                        "year=${year}/month=${month}/day=${day}/hour=${hour}/",
+                    ]),
+                },
+                partition_keys=[
+                    glue.CfnTable.ColumnProperty(name=name, type="string")
+                    for name in ("year", "month", "day", "hour")
+                ],
+                storage_descriptor=glue.CfnTable.StorageDescriptorProperty(
+                    location=location,
+                    input_format="org.apache.hadoop.hive.ql.io.parquet.MapredParquetInputFormat",
+                    output_format="org.apache.hadoop.hive.ql.io.parquet.MapredParquetOutputFormat",
+                    serde_info=glue.CfnTable.SerdeInfoProperty(
+                        serialization_library=PARQUET_SERDE,
+                    ),
+                    columns=[
+                        glue.CfnTable.ColumnProperty(
+                            name=field.replace("-", "_"),
+                            type=FLOW_LOG_FIELD_TYPES.get(field, "string"),
+                        )
+                        for field in fields
+                    ],
+                ),
+            ),
+        )
+        self.flow_log_database_name = database_name
+        self.flow_log_table_name = f"{unique_name}_flow_logs"
+    
+    @property
+    def endpoint_security_group(self) -> ec2.SecurityGroup:
+        """The security group shared by every interface endpoint, allowing HTTPS from the VPC"""
+        if self._endpoint_security_group is None:
+            self._endpoint_security_group = ec2.SecurityGroup(
+                self,
+                "EndpointSecurityGroup",
+                vpc=self.vpc,
+                description=f"Interface endpoints of {self.node.path}",
+                allow_all_outbound=False,
+            )
+            self._endpoint_security_group.add_ingress_rule(
+                ec2.Peer.ipv4(self.vpc.vpc_cidr_block),
+                ec2.Port.tcp(443),
+                "HTTPS from the VPC",
+            )
+            if self.dual_stack:
+                self._endpoint_security_group.add_ingress_rule(
+                    ec2.Peer.ipv6(Fn.select(0, self.vpc.vpc_ipv6_cidr_blocks)),
+                    ec2.Port.tcp(443),
+                    "HTTPS from the VPC over IPv6",
+                )
+        return self._endpoint_security_group
     
     def add_interface_endpoint(self, service_name: str, subnets=None):
         """Add a VPC interface endpoint for the specified service"""
@@ -75,12 +317,14 @@ def add_interface_endpoint(self, service_name: str, subnets=None):
             f"{service_name.split('.')[-1]}Endpoint",
             service=ec2.InterfaceVpcEndpointAwsService(service_name),
             subnets=subnets,
+            security_groups=[self.endpoint_security_group],
+            open=False,
         )
     
     def add_gateway_endpoint(self, service: ec2.GatewayVpcEndpointAwsService, subnets=None):
         """Add a VPC gateway endpoint for the specified service"""
         return self.vpc.add_gateway_endpoint(
-            f"{service.name}Endpoint",
+            f"{service.name.split('.')[-1]}Endpoint",
             service=service,
             subnets=subnets,
         )
\ No newline at end of file
@@ -1,4 +1,27 @@
-from .serverless_api import ServerlessApi
-from .static_website import StaticWebsite
+from typing import TYPE_CHECKING
 
-__all__ = ['ServerlessApi', 'StaticWebsite']
\ No newline at end of file
+from .._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .serverless_api import ServerlessApi
+    from .static_website import StaticWebsite
+    from .queue_processor import QueueProcessor
+    from .stream_processor import DynamoStreamProcessor
+    from .s3_event_pipeline import S3EventPipeline
+
+__all__ = [
+    'ServerlessApi',
+    'StaticWebsite',
+    'QueueProcessor',
+    'DynamoStreamProcessor',
+    'S3EventPipeline',
+]
+
+# Constructs are imported on first access, so only the jsii modules in use get loaded
+__getattr__, __dir__ = lazy_exports(__name__, {
+    'ServerlessApi': '.serverless_api',
+    'StaticWebsite': '.static_website',
+    'QueueProcessor': '.queue_processor',
+    'DynamoStreamProcessor': '.stream_processor',
+    'S3EventPipeline': '.s3_event_pipeline',
+})
\ No newline at end of file
@@ -0,0 +1,210 @@
+import os
+import re
+
+from constructs import Construct
+from aws_cdk import (
+    aws_apigateway as apigw,
+    aws_dynamodb as dynamodb,
+    aws_iam as iam,
+    Aws,
+    Duration,
+)
+from .queue_processor import QueueProcessor
+from ..compute.lambda_function import HANDLERS_DIR
+from ..database import EnhancedDynamoTable
+
+# Where async write routes put requests: a queue drained in batches, or the table itself
+ASYNC_WRITE_TARGETS = ("sqs", "dynamodb")
+
+
+class ApiAsyncWriter(Construct):
+    """
+    Direct API Gateway service integrations that take writes off the Lambda path.
+    
+    Features:
+    - SQS SendMessage integration drained by a batched BatchWriteItem consumer
+      that applies the table's write-sharding scheme
+    - DynamoDB PutItem/DeleteItem integration with typed key and item attributes
+    - Per-record failure reporting so only failed writes are retried
+    - CORS headers on every integration response (optional)
+    """
+    
+    def __init__(
+        self,
+        scope: Construct,
+        id: str,
+        *,
+        table: EnhancedDynamoTable,
+        partition_key_name: str,
+        sort_key: dynamodb.Attribute = None,
+        target: str = "sqs",
+        item_attributes: dict = None,
+        enable_cors: bool = True,
+        batch_size: int = 100,
+        max_concurrency: int = None,
+        consumer_props: dict = None,
+    ):
+        super().__init__(scope, id)
+        
+        if target not in ASYNC_WRITE_TARGETS:
+            raise ValueError(
+                f"async_write_target must be one of {ASYNC_WRITE_TARGETS}, got {target!r}"
+            )
+        if target == "dynamodb" and table.write_shards:
+            raise ValueError(
+                "Direct DynamoDB writes cannot apply write sharding; use async_write_target='sqs'"
+            )
+        
+        self.table = table
+        self.partition_key_name = partition_key_name
+        self.sort_key = sort_key
+        self.target = target
+        self.item_attributes = item_attributes or {}
+        self.enable_cors = enable_cors
+        
+        # API Gateway assumes this role to call SQS or DynamoDB
+        self.role = iam.Role(
+            self,
+            "Role",
+            assumed_by=iam.ServicePrincipal("apigateway.amazonaws.com"),
+        )
+        self.processor = None
+        if target == "dynamodb":
+            table.grant_write_data(self.role)
+            return
+        
+        # Drain the queue in batches so write spikes become queue depth, not throttles
+        consumer_props = dict(consumer_props or {})
+        environment = {
+            "TABLE_NAME": table.table.table_name,
+            "PARTITION_KEY": partition_key_name,
+            **table.sharding_environment,
+        }
+        if sort_key is not None:
+            environment["SORT_KEY"] = sort_key.name
+            environment["SORT_KEY_TYPE"] = sort_key.type.name[0]
+        self.processor = QueueProcessor(
+            self,
+            "Processor",
+            lambda_code_path=os.path.join(HANDLERS_DIR, "batch_writer"),
+            lambda_props={
+                **consumer_props,
+                "environment": {**environment, **consumer_props.get("environment", {})},
+            },
+            batch_size=batch_size,
+            max_batching_window=Duration.seconds(5),
+            max_concurrency=max_concurrency,
+        )
+        table.grant_write_data(self.processor.function.function)
+        self.processor.grant_send_messages(self.role)
+    
+    def integration(self, method: str, path: str) -> tuple:
+        """Build the service integration and method responses for one async write route"""
+        path_parameters = re.findall(r"{(\w+)\+?}", path)
+        success_status = "202" if self.target == "sqs" else "200"
+        
+        if self.target == "sqs":
+            # The body becomes the message; the method and path parameters ride along as attributes
+            attributes = [("method", method)] + [
+                (name, f"$util.urlEncode($input.params().path.get('{name}'))")
+                for name in path_parameters
+            ]
+            fields = ["Action=SendMessage", "MessageBody=$util.urlEncode($body)"]
+            for number, (name, value) in enumerate(attributes, start=1):
+                fields += [
+                    f"MessageAttribute.{number}.Name={name}",
+                    f"MessageAttribute.{number}.Value.DataType=String",
+                    f"MessageAttribute.{number}.Value.StringValue={value}",
+                ]
+            request_template = (
+                '#set($body = $input.body)#if("$body" == "")#set($body = "{}")#end\n'
+                + "&".join(fields)
+            )
+            service_options = dict(
+                service="sqs",
+                path=f"{Aws.ACCOUNT_ID}/{self.processor.queue.queue_name}",
+            )
+            request_parameters = {
+                "integration.request.header.Content-Type": "'application/x-www-form-urlencoded'"
+            }
+        else:
+            action = "DeleteItem" if method == "DELETE" else "PutItem"
+            attributes = self._dynamodb_key_template(path_parameters)
+            if action == "PutItem":
+                for name, type_code in self.item_attributes.items():
+                    value = f"$input.path('$.{name}')"
+                    if type_code == "S":
+                        value = f'"$util.escapeJavaScript({value})"'
+                    elif type_code == "N":
+                        value = f'"{value}"'
+                    attributes[name] = f'{{"{type_code}": {value}}}'
+                if not self.item_attributes:
+                    attributes["payload"] = (
+                        r"""{"S": "$util.escapeJavaScript($input.body).replaceAll("\\'","'")"}"""
+                    )
+            request_template = (
+                f'{{"TableName": "{self.table.table.table_name}", '
+                f'"{"Key" if action == "DeleteItem" else "Item"}": {{'
+                + ", ".join(f'"{name}": {value}' for name, value in attributes.items())
+                + "}}"
+            )
+            service_options = dict(service="dynamodb", action=action)
+            request_parameters = None
+        
+        response_parameters = {
+            "method.response.header.Access-Control-Allow-Origin": "'*'"
+        } if self.enable_cors else None
+        integration_responses = [
+            apigw.IntegrationResponse(
+                status_code=success_status,
+                response_parameters=response_parameters,
+                response_templates={"application/json": '{"status": "accepted"}'},
+            ),
+            apigw.IntegrationResponse(
+                status_code="400",
+                selection_pattern="4\\d{2}",
+                response_parameters=response_parameters,
+                response_templates={"application/json": '{"message": "Invalid request"}'},
+            ),
+            apigw.IntegrationResponse(
+                status_code="500",
+                selection_pattern="5\\d{2}",
+                response_parameters=response_parameters,
+                response_templates={"application/json": '{"message": "Internal server error"}'},
+            ),
+        ]
+        integration = apigw.AwsIntegration(
+            integration_http_method="POST",
+            options=apigw.IntegrationOptions(
+                credentials_role=self.role,
+                passthrough_behavior=apigw.PassthroughBehavior.NEVER,
+                request_parameters=request_parameters,
+                request_templates={"application/json": request_template},
+                integration_responses=integration_responses,
+            ),
+            **service_options
+        )
+        method_responses = [
+            apigw.MethodResponse(
+                status_code=response.status_code,
+                response_parameters={
+                    "method.response.header.Access-Control-Allow-Origin": True
+                } if self.enable_cors else None,
+            )
+            for response in integration_responses
+        ]
+        return integration, method_responses
+    
+    def _dynamodb_key_template(self, path_parameters: list) -> dict:
+        """Typed key attributes, taken from the path when present and the body otherwise"""
+        keys = {self.partition_key_name: "S"}
+        if self.sort_key is not None:
+            keys[self.sort_key.name] = self.sort_key.type.name[0]
+        attributes = {}
+        for name, type_code in keys.items():
+            if name in path_parameters:
+                value = f"$util.escapeJavaScript($input.params().path.get('{name}'))"
+            else:
+                value = f"$util.escapeJavaScript($input.path('$.{name}'))"
+            attributes[name] = f'{{"{type_code}": "{value}"}}'
+        return attributes
\ No newline at end of file
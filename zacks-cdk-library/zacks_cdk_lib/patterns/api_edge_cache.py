@@ -0,0 +1,237 @@
+from constructs import Construct
+from aws_cdk import (
+    aws_apigateway as apigw,
+    aws_cloudfront as cloudfront,
+    aws_cloudfront_origins as origins,
+    aws_secretsmanager as secretsmanager,
+    aws_wafv2 as wafv2,
+    Duration,
+    Fn,
+)
+
+# Header CloudFront adds to every origin request when origin_verify is on
+ORIGIN_VERIFY_HEADER = "X-Origin-Verify"
+
+
+class ApiEdgeCache(Construct):
+    """
+    A CloudFront distribution with per-path caching in front of a REST or HTTP API.
+    
+    Features:
+    - Per-path cache and origin request policies with Brotli/gzip compression
+    - Pass-through default behavior that honours short origin Cache-Control
+    - Authorization (and x-api-key) always in the cache key
+    - HTTP/2 and HTTP/3
+    - Origin shield in a given region (optional)
+    - Origin-verify header enforced by a regional WAF web ACL (optional, REST only)
+    """
+    
+    def __init__(
+        self,
+        scope: Construct,
+        id: str,
+        *,
+        api,
+        require_api_key: bool = False,
+        behaviors: dict = None,
+        forward_headers: list = None,
+        origin_shield_region: str = None,
+        origin_verify: bool = False,
+    ):
+        super().__init__(scope, id)
+        
+        if origin_verify and not isinstance(api, apigw.RestApi):
+            raise ValueError("origin_verify needs a REST API (enforced by WAF)")
+        
+        # Credentials are part of every cache key so responses are never shared across callers
+        self.credential_headers = ["Authorization"]
+        if require_api_key:
+            self.credential_headers.append("x-api-key")
+        self.forward_headers = list(forward_headers or [])
+        
+        custom_headers = None
+        self.origin_verify_secret = None
+        if origin_verify:
+            self.origin_verify_secret = secretsmanager.Secret(
+                self,
+                "OriginVerifySecret",
+                description=(
+                    f"{ORIGIN_VERIFY_HEADER} header value CloudFront sends to {scope.node.path}"
+                ),
+                generate_secret_string=secretsmanager.SecretStringGenerator(
+                    exclude_punctuation=True,
+                    password_length=32,
+                ),
+            )
+            custom_headers = {
+                ORIGIN_VERIFY_HEADER: self.origin_verify_secret.secret_value.unsafe_unwrap()
+            }
+        
+        # Origin shield (billed per request) collapses requests from every edge into one region
+        origin_options = dict(
+            custom_headers=custom_headers,
+            origin_shield_region=origin_shield_region,
+            origin_shield_enabled=origin_shield_region is not None,
+        )
+        if isinstance(api, apigw.RestApi):
+            self.origin = origins.RestApiOrigin(api, **origin_options)
+        else:
+            self.origin = origins.HttpOrigin(
+                Fn.select(2, Fn.split("/", api.api_endpoint)), **origin_options
+            )
+        
+        # Uncached paths pass everything through but honour short origin Cache-Control
+        default_behavior = cloudfront.BehaviorOptions(
+            origin=self.origin,
+            viewer_protocol_policy=cloudfront.ViewerProtocolPolicy.REDIRECT_TO_HTTPS,
+            allowed_methods=cloudfront.AllowedMethods.ALLOW_ALL,
+            compress=True,
+            cache_policy=cloudfront.CachePolicy(
+                self,
+                "PassThroughCachePolicy",
+                comment=f"Pass-through for {scope.node.path}",
+                default_ttl=Duration.seconds(0),
+                min_ttl=Duration.seconds(0),
+                max_ttl=Duration.seconds(1),
+                header_behavior=cloudfront.CacheHeaderBehavior.allow_list(
+                    *self.credential_headers
+                ),
+                query_string_behavior=cloudfront.CacheQueryStringBehavior.all(),
+                enable_accept_encoding_brotli=True,
+                enable_accept_encoding_gzip=True,
+            ),
+            origin_request_policy=cloudfront.OriginRequestPolicy(
+                self,
+                "OriginRequestPolicy",
+                comment=f"Forwarded headers for {scope.node.path}",
+                header_behavior=_origin_request_headers(self.forward_headers),
+                query_string_behavior=cloudfront.OriginRequestQueryStringBehavior.all(),
+            ),
+        )
+        
+        # Each cacheable path keys on, and forwards, only what its responses depend on
+        additional_behaviors = {
+            path_pattern: self._behavior(index, path_pattern, settings)
+            for index, (path_pattern, settings) in enumerate((behaviors or {}).items())
+        }
+        
+        self.distribution = cloudfront.Distribution(
+            self,
+            "Distribution",
+            default_behavior=default_behavior,
+            additional_behaviors=additional_behaviors or None,
+            http_version=cloudfront.HttpVersion.HTTP2_AND_3,
+            comment=f"Edge cache for {scope.node.path}",
+        )
+        
+        # Block requests to the regional endpoint that did not come through CloudFront
+        self.web_acl = None
+        if origin_verify:
+            self._add_origin_verify_web_acl(api)
+        
+        # Export outputs
+        self.distribution_domain_name = self.distribution.distribution_domain_name
+        self.edge_endpoint = f"https://{self.distribution.distribution_domain_name}/"
+    
+    def _behavior(self, index: int, path_pattern: str, settings: dict):
+        """Cached behavior for one path pattern with its own cache and origin request policies"""
+        ttl = settings.get("ttl", Duration.minutes(5))
+        query_strings = settings.get("query_strings") or []
+        forward_headers = self.forward_headers + (settings.get("forward_headers") or [])
+        forward_query_strings = settings.get("forward_query_strings") or []
+        
+        origin_request_policy = None
+        if forward_headers or forward_query_strings:
+            origin_request_policy = cloudfront.OriginRequestPolicy(
+                self,
+                f"OriginRequestPolicy{index}",
+                comment=f"{path_pattern} on {self.node.scope.node.path}",
+                header_behavior=_origin_request_headers(forward_headers),
+                query_string_behavior=(
+                    cloudfront.OriginRequestQueryStringBehavior.allow_list(*forward_query_strings)
+                    if forward_query_strings
+                    else cloudfront.OriginRequestQueryStringBehavior.none()
+                ),
+            )
+        
+        return cloudfront.BehaviorOptions(
+            origin=self.origin,
+            viewer_protocol_policy=cloudfront.ViewerProtocolPolicy.REDIRECT_TO_HTTPS,
+            allowed_methods=cloudfront.AllowedMethods.ALLOW_ALL,
+            cached_methods=cloudfront.CachedMethods.CACHE_GET_HEAD_OPTIONS,
+            compress=True,
+            cache_policy=cloudfront.CachePolicy(
+                self,
+                f"CachePolicy{index}",
+                comment=f"{path_pattern} on {self.node.scope.node.path}",
+                default_ttl=ttl,
+                min_ttl=Duration.seconds(0),
+                max_ttl=settings.get("max_ttl", ttl),
+                header_behavior=cloudfront.CacheHeaderBehavior.allow_list(
+                    *self.credential_headers, *(settings.get("headers") or [])
+                ),
+                query_string_behavior=(
+                    cloudfront.CacheQueryStringBehavior.allow_list(*query_strings)
+                    if query_strings
+                    else cloudfront.CacheQueryStringBehavior.none()
+                ),
+                enable_accept_encoding_brotli=True,
+                enable_accept_encoding_gzip=True,
+            ),
+            origin_request_policy=origin_request_policy,
+        )
+    
+    def _add_origin_verify_web_acl(self, api: apigw.RestApi):
+        """Allow only requests carrying the origin-verify secret on the REST stage"""
+        secret_value = self.origin_verify_secret.secret_value.unsafe_unwrap()
+        metric_prefix = self.node.scope.node.id
+        self.web_acl = wafv2.CfnWebACL(
+            self,
+            "OriginVerifyWebAcl",
+            scope="REGIONAL",
+            default_action=wafv2.CfnWebACL.DefaultActionProperty(block={}),
+            visibility_config=wafv2.CfnWebACL.VisibilityConfigProperty(
+                cloud_watch_metrics_enabled=True,
+                metric_name=f"{metric_prefix}OriginVerify",
+                sampled_requests_enabled=True,
+            ),
+            rules=[
+                wafv2.CfnWebACL.RuleProperty(
+                    name="AllowCloudFront",
+                    priority=0,
+                    action=wafv2.CfnWebACL.RuleActionProperty(allow={}),
+                    statement=wafv2.CfnWebACL.StatementProperty(
+                        byte_match_statement=wafv2.CfnWebACL.ByteMatchStatementProperty(
+                            field_to_match=wafv2.CfnWebACL.FieldToMatchProperty(
+                                single_header={"Name": ORIGIN_VERIFY_HEADER.lower()},
+                            ),
+                            positional_constraint="EXACTLY",
+                            search_string=secret_value,
+                            text_transformations=[
+                                wafv2.CfnWebACL.TextTransformationProperty(
+                                    priority=0, type="NONE"
+                                )
+                            ],
+                        ),
+                    ),
+                    visibility_config=wafv2.CfnWebACL.VisibilityConfigProperty(
+                        cloud_watch_metrics_enabled=True,
+                        metric_name=f"{metric_prefix}AllowCloudFront",
+                        sampled_requests_enabled=True,
+                    ),
+                )
+            ],
+        )
+        wafv2.CfnWebACLAssociation(
+            self,
+            "OriginVerifyWebAclAssociation",
+            resource_arn=api.deployment_stage.stage_arn,
+            web_acl_arn=self.web_acl.attr_arn,
+        )
+
+
+def _origin_request_headers(headers: list) -> cloudfront.OriginRequestHeaderBehavior:
+    """Forward only the given headers to the origin, or none"""
+    if headers:
+        return cloudfront.OriginRequestHeaderBehavior.allow_list(*headers)
+    return cloudfront.OriginRequestHeaderBehavior.none()
\ No newline at end of file
@@ -0,0 +1,99 @@
+from constructs import Construct
+from aws_cdk import (
+    aws_lambda_event_sources as event_sources,
+    aws_sqs as sqs,
+    Duration,
+)
+from ..compute import LambdaFunction
+
+
+class QueueProcessor(Construct):
+    """
+    A queue-driven processing pattern with SQS and a batched Lambda consumer.
+    
+    Features:
+    - SQS queue with a dead letter queue
+    - Lambda consumer with configurable batch size and batching window
+    - Maximum concurrency cap for the consumer (optional)
+    - Partial batch responses (ReportBatchItemFailures)
+    - Visibility timeout derived from the function timeout
+    """
+    
+    def __init__(
+        self,
+        scope: Construct,
+        id: str,
+        *,
+        lambda_code_path: str,
+        lambda_handler: str = "index.handler",
+        lambda_props: dict = None,
+        batch_size: int = 100,
+        max_batching_window: Duration = Duration.seconds(1),
+        max_concurrency: int = None,
+        report_batch_item_failures: bool = True,
+        max_receive_count: int = 3,
+        queue_props: dict = None,
+        **kwargs
+    ):
+        super().__init__(scope, id)
+        
+        # Create Lambda function
+        self.function = LambdaFunction(
+            self,
+            "Function",
+            code_path=lambda_code_path,
+            handler=lambda_handler,
+            **(lambda_props or {})
+        )
+        
+        # Create the dead letter queue for messages that keep failing
+        self.dead_letter_queue = sqs.Queue(
+            self,
+            "DeadLetterQueue",
+            encryption=sqs.QueueEncryption.SQS_MANAGED,
+            enforce_ssl=True,
+            retention_period=Duration.days(14),
+        )
+        
+        # Keep messages invisible long enough for every retry of a batch to finish;
+        # queue_props override any of these defaults
+        defaults = {
+            "encryption": sqs.QueueEncryption.SQS_MANAGED,
+            "enforce_ssl": True,
+            "visibility_timeout": self.visibility_timeout_for(
+                self.function.timeout, max_batching_window
+            ),
+            "dead_letter_queue": sqs.DeadLetterQueue(
+                max_receive_count=max_receive_count,
+                queue=self.dead_letter_queue,
+            ),
+        }
+        self.queue = sqs.Queue(self, "Queue", **{**defaults, **(queue_props or {})})
+        
+        # Subscribe the consumer to the queue
+        self.function.invoke_target.add_event_source(
+            event_sources.SqsEventSource(
+                self.queue,
+                batch_size=batch_size,
+                max_batching_window=max_batching_window,
+                max_concurrency=max_concurrency,
+                report_batch_item_failures=report_batch_item_failures,
+                **kwargs
+            )
+        )
+        
+        # Export outputs
+        self.queue_url = self.queue.queue_url
+        self.queue_arn = self.queue.queue_arn
+    
+    @staticmethod
+    def visibility_timeout_for(function_timeout: Duration, max_batching_window: Duration = None):
+        """Six times the function timeout plus the batching window, as AWS recommends"""
+        seconds = 6 * function_timeout.to_seconds()
+        if max_batching_window is not None:
+            seconds += max_batching_window.to_seconds()
+        return Duration.seconds(min(seconds, 12 * 60 * 60))
+    
+    def grant_send_messages(self, identity):
+        """Grant permission to send messages to the queue to the given identity"""
+        return self.queue.grant_send_messages(identity)
\ No newline at end of file
@@ -0,0 +1,204 @@
+from constructs import Construct
+from aws_cdk import (
+    aws_events as events,
+    aws_events_targets as targets,
+    aws_iam as iam,
+    aws_s3_notifications as s3n,
+    aws_sns as sns,
+    aws_sns_subscriptions as subscriptions,
+    aws_stepfunctions as sfn,
+    aws_stepfunctions_tasks as tasks,
+    ArnFormat,
+    Duration,
+    Names,
+    Stack,
+)
+from .queue_processor import QueueProcessor
+from ..storage import SecureS3Bucket
+
+# Ways object-created events can be fanned out before reaching the queue
+FAN_OUT_TARGETS = ("sns", "eventbridge")
+
+
+class S3EventPipeline(Construct):
+    """
+    An object-created pipeline from a SecureS3Bucket to batched Lambda consumers.
+    
+    Features:
+    - Prefix/suffix-filtered object-created notifications buffered in SQS
+    - Fan-out through an SNS topic or EventBridge rule (optional)
+    - Batched LambdaFunction consumer with a concurrency cap and a DLQ
+    - Step Functions Distributed Map for bulk backfills of S3 keys (optional)
+    """
+    
+    def __init__(
+        self,
+        scope: Construct,
+        id: str,
+        *,
+        bucket: SecureS3Bucket,
+        lambda_code_path: str,
+        lambda_handler: str = "index.handler",
+        lambda_props: dict = None,
+        filters: list = None,
+        fan_out: str = None,
+        batch_size: int = 100,
+        max_batching_window: Duration = Duration.seconds(5),
+        max_concurrency: int = None,
+        max_receive_count: int = 3,
+        queue_props: dict = None,
+        backfill: bool = False,
+        backfill_batch_size: int = 100,
+        backfill_max_concurrency: int = 100,
+        **kwargs
+    ):
+        super().__init__(scope, id)
+        
+        if fan_out is not None and fan_out not in FAN_OUT_TARGETS:
+            raise ValueError(f"fan_out must be one of {FAN_OUT_TARGETS}, got {fan_out!r}")
+        
+        self.bucket = bucket
+        
+        # Buffer events in SQS so bulk loads queue up instead of throttling the consumer
+        self.processor = QueueProcessor(
+            self,
+            "Processor",
+            lambda_code_path=lambda_code_path,
+            lambda_handler=lambda_handler,
+            lambda_props=lambda_props,
+            batch_size=batch_size,
+            max_batching_window=max_batching_window,
+            max_concurrency=max_concurrency,
+            max_receive_count=max_receive_count,
+            queue_props=queue_props,
+            **kwargs
+        )
+        self.function = self.processor.function
+        self.queue = self.processor.queue
+        self.dead_letter_queue = self.processor.dead_letter_queue
+        
+        self.function.add_environment_variable("BUCKET_NAME", bucket.bucket.bucket_name)
+        bucket.grant_read(self.function.function)
+        
+        # Route object-created events to the queue
+        self.topic = None
+        self.rule = None
+        if fan_out == "sns":
+            # Raw delivery keeps the S3 event as the message body; other subscribers can be added
+            self.topic = sns.Topic(self, "Topic", enforce_ssl=True)
+            self.topic.add_subscription(
+                subscriptions.SqsSubscription(self.queue, raw_message_delivery=True)
+            )
+            bucket.add_object_created_notification(s3n.SnsDestination(self.topic), filters)
+        elif fan_out == "eventbridge":
+            bucket.bucket.enable_event_bridge_notification()
+            self.rule = events.Rule(
+                self,
+                "ObjectCreatedRule",
+                event_pattern=events.EventPattern(
+                    source=["aws.s3"],
+                    detail_type=["Object Created"],
+                    detail=self._event_pattern_detail(filters),
+                ),
+                targets=[targets.SqsQueue(self.queue)],
+            )
+        else:
+            bucket.add_object_created_notification(s3n.SqsDestination(self.queue), filters)
+        
+        # Let consumers hand large key lists to a Distributed Map instead of the queue
+        self.backfill_state_machine = None
+        if backfill:
+            self._add_backfill(backfill_batch_size, backfill_max_concurrency)
+        
+        # Export outputs
+        self.queue_url = self.queue.queue_url
+        self.queue_arn = self.queue.queue_arn
+    
+    def _event_pattern_detail(self, filters: list = None) -> dict:
+        """
+        Match the bucket and any of the key filters in an EventBridge pattern.
+        
+        An entry with neither prefix nor suffix matches every key, so the pattern
+        then leaves the key out instead of narrowing to the other entries.
+        """
+        detail = {"bucket": {"name": [self.bucket.bucket.bucket_name]}}
+        key_patterns = []
+        for key_filter in filters or []:
+            prefix = key_filter.get("prefix")
+            suffix = key_filter.get("suffix")
+            if prefix and suffix:
+                key_patterns.append(
+                    {"wildcard": f"{_escape_wildcard(prefix)}*{_escape_wildcard(suffix)}"}
+                )
+            elif prefix:
+                key_patterns.append({"prefix": prefix})
+            elif suffix:
+                key_patterns.append({"suffix": suffix})
+            else:
+                key_patterns = []
+                break
+        if key_patterns:
+            detail["object"] = {"key": key_patterns}
+        return detail
+    
+    def _add_backfill(self, batch_size: int, max_concurrency: int):
+        """
+        Create a Distributed Map that feeds batches of keys to the consumer.
+        
+        Executions take {"manifest_key": "<key>"}, a JSON array of items stored in
+        the bucket, and invoke the consumer with {"Items": [...], "BatchInput":
+        {"bucket": "<name>"}}. Manifests should be written under a prefix the
+        notification filters do not match.
+        """
+        invoke = tasks.LambdaInvoke(
+            self,
+            "ProcessBatch",
+            lambda_function=self.function.invoke_target,
+            payload_response_only=True,
+        )
+        backfill_map = sfn.DistributedMap(
+            self,
+            "BackfillMap",
+            item_reader=sfn.S3JsonItemReader(
+                bucket=self.bucket.bucket,
+                key=sfn.JsonPath.string_at("$.manifest_key"),
+            ),
+            item_batcher=sfn.ItemBatcher(
+                max_items_per_batch=batch_size,
+                batch_input={"bucket": self.bucket.bucket.bucket_name},
+            ),
+            max_concurrency=max_concurrency,
+            map_execution_type=sfn.StateMachineType.EXPRESS,
+            result_path=sfn.JsonPath.DISCARD,
+        )
+        backfill_map.item_processor(invoke)
+        
+        # A known name lets the consumer reference the ARN without a circular dependency
+        state_machine_name = Names.unique_resource_name(self, max_length=80, separator="-")
+        self.backfill_state_machine = sfn.StateMachine(
+            self,
+            "BackfillStateMachine",
+            state_machine_name=state_machine_name,
+            definition_body=sfn.DefinitionBody.from_chainable(backfill_map),
+        )
+        state_machine_arn = Stack.of(self).format_arn(
+            service="states",
+            resource="stateMachine",
+            resource_name=state_machine_name,
+            arn_format=ArnFormat.COLON_RESOURCE_NAME,
+        )
+        self.function.add_environment_variable("BACKFILL_STATE_MACHINE_ARN", state_machine_arn)
+        self.function.function.add_to_role_policy(
+            iam.PolicyStatement(actions=["states:StartExecution"], resources=[state_machine_arn])
+        )
+    
+    def grant_start_backfill(self, identity):
+        """Grant permission to start a backfill to the given identity"""
+        if self.backfill_state_machine is None:
+            raise ValueError(f"{self.node.path} has no backfill; set backfill=True")
+        return self.backfill_state_machine.grant_start_execution(identity)
+
+
+def _escape_wildcard(value: str) -> str:
+    """Escape backslashes and asterisks so an EventBridge wildcard matches them literally"""
+    return value.replace("\\", "\\\\").replace("*", "\\*")
\ No newline at end of file
@@ -1,25 +1,51 @@
+import re
+
 from constructs import Construct
 from aws_cdk import (
     aws_lambda as _lambda,
     aws_apigateway as apigw,
+    aws_apigatewayv2 as apigwv2,
+    aws_apigatewayv2_integrations as integrations,
     aws_dynamodb as dynamodb,
-    aws_iam as iam,
+    Duration,
+    Size,
 )
-from ..compute import LambdaFunction
+from .api_async_writer import ApiAsyncWriter
+from ..compute import DependencyLayer, LambdaFunction
 from ..database import EnhancedDynamoTable
 
+# API Gateway flavours: REST (v1) with caching and API keys, or the lower-latency HTTP API (v2)
+API_TYPES = ("rest", "http")
+
+# Usage plan throttle for API key holders when no throttle is given
+DEFAULT_USAGE_PLAN_THROTTLE = {"rate_limit": 10, "burst_limit": 20}
+
 
 class ServerlessApi(Construct):
     """
     A complete serverless API pattern with API Gateway, Lambda, and DynamoDB.
     
     Features:
-    - REST API with API Gateway
+    - REST API with API Gateway, or an HTTP API (v2) for lower latency
     - Lambda function for backend processing
     - DynamoDB table for data storage
     - Proper IAM permissions
     - CORS configuration
-    - API key (optional)
+    - API key and usage plan (optional, REST only)
+    - Stage-wide and per-route throttling (optional)
+    - Stage cache cluster with per-route TTLs and cache keys (optional, REST only)
+    - Response compression above a size threshold (optional, REST only)
+    - CloudFront edge cache with per-path cache and origin request policies,
+      Brotli/gzip compression and origin shield (optional, see ApiEdgeCache)
+    - Origin-verify header enforced by WAF so only CloudFront reaches the API
+      (optional, REST only)
+    - Async write routes integrated directly with SQS (drained by a batched
+      BatchWriteItem consumer) or DynamoDB PutItem/DeleteItem, with reads kept
+      on the Lambda proxy (optional, REST only, see ApiAsyncWriter)
+    - API Gateway integration on the Lambda live alias (optional)
+    - Shared dependency layer for the Lambda function (optional)
+    - DAX endpoint passed to the Lambda function when the table has DAX (optional)
+    - Write-sharding scheme passed to the Lambda function when the table is sharded (optional)
     """
     
     def __init__(
@@ -33,10 +59,43 @@ def __init__(
         enable_cors: bool = True,
         require_api_key: bool = False,
         table_props: dict = None,
+        lambda_props: dict = None,
+        dependency_layer: DependencyLayer = None,
+        api_type: str = "rest",
+        throttle: dict = None,
+        route_throttles: dict = None,
+        cached_routes: dict = None,
+        cache_cluster_size: str = "0.5",
+        cache_ttl: Duration = Duration.minutes(5),
+        minimum_compression_size: int = None,
+        edge_cache: bool = False,
+        edge_cache_behaviors: dict = None,
+        edge_forward_headers: list = None,
+        origin_shield_region: str = None,
+        origin_verify: bool = False,
+        async_write_routes: list = None,
+        async_write_target: str = "sqs",
+        async_item_attributes: dict = None,
+        async_batch_size: int = 100,
+        async_max_concurrency: int = None,
+        async_consumer_props: dict = None,
         **kwargs
     ):
         super().__init__(scope, id)
         
+        if api_type not in API_TYPES:
+            raise ValueError(f"api_type must be one of {API_TYPES}, got {api_type!r}")
+        if api_type == "http" and (require_api_key or cached_routes or minimum_compression_size):
+            raise ValueError(
+                "HTTP APIs do not support API keys, caching or compression; use api_type='rest'"
+            )
+        if origin_verify and (api_type == "http" or not edge_cache):
+            raise ValueError(
+                "origin_verify needs edge_cache and api_type='rest' (enforced by WAF)"
+            )
+        if async_write_routes and api_type == "http":
+            raise ValueError("async_write_routes need api_type='rest'")
+        
         # Create DynamoDB table
         table_props = table_props or {}
         self.table = EnhancedDynamoTable(
@@ -49,56 +108,288 @@ def __init__(
             sort_key=table_props.get("sort_key") or None,
             **{k: v for k, v in table_props.items() if k not in ["partition_key_name", "sort_key"]}
         )
+        self.partition_key_name = table_props.get("partition_key_name", "id")
+        self.sort_key = table_props.get("sort_key") or None
         
         # Create Lambda function
+        lambda_props = dict(lambda_props or {})
+        environment = {
+            "TABLE_NAME": self.table.table.table_name,
+            **self.table.sharding_environment,
+        }
+        
+        # Run the function next to the DAX cluster so it can use the endpoint
+        if self.table.dax_cluster is not None:
+            environment["DAX_ENDPOINT"] = self.table.dax_endpoint
+            lambda_props.setdefault("vpc", self.table.dax_vpc)
+        
         self.function = LambdaFunction(
             self,
             "Function",
             code_path=lambda_code_path,
             handler=lambda_handler,
             environment={
-                "TABLE_NAME": self.table.table.table_name,
+                **environment,
+                **lambda_props.pop("environment", {}),
             },
+            dependency_layer=dependency_layer,
+            **lambda_props
         )
         
         # Grant Lambda function access to DynamoDB table
-        self.table.table.grant_read_write_data(self.function.function)
+        self.table.grant_read_write_data(self.function.function)
+        if self.table.dax_cluster is not None:
+            self.table.allow_dax_access_from(self.function.function)
+        
+        # Take writes off the synchronous path: API Gateway talks to SQS or DynamoDB directly
+        self.async_writes = None
+        self.async_writer = None
+        self.async_write_role = None
+        if async_write_routes:
+            self.async_writes = ApiAsyncWriter(
+                self,
+                "AsyncWriter",
+                table=self.table,
+                partition_key_name=self.partition_key_name,
+                sort_key=self.sort_key,
+                target=async_write_target,
+                item_attributes=async_item_attributes,
+                enable_cors=enable_cors,
+                batch_size=async_batch_size,
+                max_concurrency=async_max_concurrency,
+                consumer_props=async_consumer_props,
+            )
+            self.async_writer = self.async_writes.processor
+            self.async_write_role = self.async_writes.role
         
         # Create API Gateway
-        api_props = {
-            "rest_api_name": api_name or f"{id}-api",
-            "description": f"API for {id}",
-        }
+        self.route_methods = {}
+        if api_type == "http":
+            self._create_http_api(
+                api_name or f"{id}-api", f"API for {id}", enable_cors, throttle, route_throttles
+            )
+        else:
+            self._create_rest_api(
+                id,
+                api_name or f"{id}-api",
+                enable_cors,
+                require_api_key,
+                throttle,
+                route_throttles,
+                cached_routes,
+                cache_cluster_size,
+                cache_ttl,
+                minimum_compression_size,
+                {
+                    route: self.async_writes.integration(*self.split_route(route))
+                    for route in async_write_routes or []
+                },
+            )
         
-        if require_api_key:
-            api_props["api_key_required"] = True
+        # Serve cacheable paths from CloudFront edge locations
+        self.edge_cache = None
+        self.distribution = None
+        self.origin_verify_secret = None
+        if edge_cache:
+            # Imported here so APIs without an edge cache never load the CloudFront
+            # and WAF jsii modules
+            from .api_edge_cache import ApiEdgeCache
+            
+            self.edge_cache = ApiEdgeCache(
+                self,
+                "EdgeCache",
+                api=self.api,
+                require_api_key=require_api_key,
+                behaviors=edge_cache_behaviors,
+                forward_headers=edge_forward_headers,
+                origin_shield_region=origin_shield_region,
+                origin_verify=origin_verify,
+            )
+            self.distribution = self.edge_cache.distribution
+            self.origin_verify_secret = self.edge_cache.origin_verify_secret
+        
+        # Export outputs
+        self.api_endpoint = self.api.url
+        self.table_name = self.table.table.table_name
+        if self.edge_cache is not None:
+            self.distribution_domain_name = self.edge_cache.distribution_domain_name
+            self.edge_endpoint = self.edge_cache.edge_endpoint
+    
+    def _create_rest_api(
+        self,
+        id: str,
+        api_name: str,
+        enable_cors: bool,
+        require_api_key: bool,
+        throttle: dict = None,
+        route_throttles: dict = None,
+        cached_routes: dict = None,
+        cache_cluster_size: str = None,
+        cache_ttl: Duration = None,
+        minimum_compression_size: int = None,
+        async_integrations: dict = None,
+    ):
+        """Create the REST API with its stage cache, throttling and usage plan"""
+        route_throttles = route_throttles or {}
+        cached_routes = cached_routes or {}
+        async_integrations = async_integrations or {}
         
+        # Stage settings per "<path>/<METHOD>"; only the listed routes are cached
+        method_options = {}
+        for route, settings in route_throttles.items():
+            method, path = self.split_route(route)
+            method_options.setdefault(f"{path}/{method}", {}).update(
+                throttling_rate_limit=settings.get("rate_limit"),
+                throttling_burst_limit=settings.get("burst_limit"),
+            )
+        for route, settings in cached_routes.items():
+            method, path = self.split_route(route)
+            method_options.setdefault(f"{path}/{method}", {}).update(
+                caching_enabled=True,
+                cache_ttl=settings.get("ttl", cache_ttl),
+            )
+        
+        routes = {**route_throttles, **cached_routes, **async_integrations}
         self.api = apigw.LambdaRestApi(
             self,
             "Api",
-            handler=self.function.function,
-            proxy=True,
+            handler=self.function.invoke_target,
+            proxy=not routes,
+            rest_api_name=api_name,
+            description=f"API for {id}",
             default_cors_preflight_options=apigw.CorsOptions(
                 allow_origins=apigw.Cors.ALL_ORIGINS,
                 allow_methods=apigw.Cors.ALL_METHODS,
             ) if enable_cors else None,
-            **api_props
+            default_method_options=apigw.MethodOptions(
+                api_key_required=True,
+            ) if require_api_key else None,
+            min_compression_size=Size.bytes(minimum_compression_size)
+            if minimum_compression_size is not None else None,
+            deploy_options=apigw.StageOptions(
+                cache_cluster_enabled=bool(cached_routes) or None,
+                cache_cluster_size=cache_cluster_size if cached_routes else None,
+                throttling_rate_limit=(throttle or {}).get("rate_limit"),
+                throttling_burst_limit=(throttle or {}).get("burst_limit"),
+                method_options={
+                    key: apigw.MethodDeploymentOptions(**options)
+                    for key, options in method_options.items()
+                } or None,
+            ),
         )
         
+        # Routes with their own stage settings need explicit methods in front of {proxy+}
+        if routes:
+            self.api.root.add_method("ANY")
+            self.api.root.add_proxy()
+        for route in routes:
+            method, path = self.split_route(route)
+            cache_keys = self.cache_key_parameters(
+                path, cached_routes.get(route, {}).get("cache_key_parameters")
+            ) if route in cached_routes else []
+            if route in async_integrations:
+                integration, method_responses = async_integrations[route]
+                self.route_methods[route] = self.api.root.resource_for_path(path).add_method(
+                    method,
+                    integration,
+                    method_responses=method_responses,
+                )
+                continue
+            self.route_methods[route] = self.api.root.resource_for_path(path).add_method(
+                method,
+                apigw.LambdaIntegration(
+                    self.function.invoke_target,
+                    cache_key_parameters=cache_keys or None,
+                ),
+                request_parameters={
+                    parameter: parameter.startswith("method.request.path.")
+                    for parameter in cache_keys
+                } if cache_keys else None,
+            )
+        
         if require_api_key:
             plan = self.api.add_usage_plan("UsagePlan",
                 name=f"{id}-usage-plan",
-                throttle=apigw.ThrottleSettings(
-                    rate_limit=10,
-                    burst_limit=20
-                )
+                throttle=apigw.ThrottleSettings(**(throttle or DEFAULT_USAGE_PLAN_THROTTLE)),
             )
             key = self.api.add_api_key("ApiKey")
             plan.add_api_key(key)
             plan.add_api_stage(
-                stage=self.api.deployment_stage
+                stage=self.api.deployment_stage,
+                throttle=[
+                    apigw.ThrottlingPerMethod(
+                        method=self.route_methods[route],
+                        throttle=apigw.ThrottleSettings(**settings),
+                    )
+                    for route, settings in route_throttles.items()
+                ] or None,
             )
-            
-        # Export outputs
-        self.api_endpoint = self.api.url
-        self.table_name = self.table.table.table_name
\ No newline at end of file
+    
+    def _create_http_api(
+        self,
+        api_name: str,
+        description: str,
+        enable_cors: bool,
+        throttle: dict = None,
+        route_throttles: dict = None,
+    ):
+        """Create the HTTP API with stage-wide and per-route throttling"""
+        # Payload format 1.0 keeps the event shape of the REST proxy integration
+        integration = integrations.HttpLambdaIntegration(
+            "Integration",
+            self.function.invoke_target,
+            payload_format_version=apigwv2.PayloadFormatVersion.VERSION_1_0,
+        )
+        self.api = apigwv2.HttpApi(
+            self,
+            "Api",
+            api_name=api_name,
+            description=description,
+            default_integration=integration,
+            cors_preflight=apigwv2.CorsPreflightOptions(
+                allow_origins=["*"],
+                allow_methods=[apigwv2.CorsHttpMethod.ANY],
+                allow_headers=["*"],
+            ) if enable_cors else None,
+        )
+        
+        stage = self.api.default_stage.node.default_child
+        if throttle:
+            stage.default_route_settings = apigwv2.CfnStage.RouteSettingsProperty(
+                throttling_rate_limit=throttle.get("rate_limit"),
+                throttling_burst_limit=throttle.get("burst_limit"),
+            )
+        
+        # Route settings only apply to routes that exist, so declare them explicitly
+        route_settings = {}
+        for route, settings in (route_throttles or {}).items():
+            method, path = self.split_route(route)
+            self.route_methods[route] = self.api.add_routes(
+                path=path,
+                methods=[apigwv2.HttpMethod[method]],
+                integration=integration,
+            )[0]
+            stage.node.add_dependency(self.route_methods[route])
+            route_settings[f"{method} {path}"] = {
+                "ThrottlingRateLimit": settings.get("rate_limit"),
+                "ThrottlingBurstLimit": settings.get("burst_limit"),
+            }
+        if route_settings:
+            stage.add_property_override("RouteSettings", route_settings)
+    
+    @staticmethod
+    def split_route(route: str) -> tuple:
+        """Split "GET /items/{id}" into its method and path; a bare path means GET"""
+        method, _, path = route.strip().rpartition(" ")
+        return (method.strip().upper() or "GET"), "/" + path.strip("/")
+    
+    @staticmethod
+    def cache_key_parameters(path: str, parameters: list = None) -> list:
+        """Path parameters plus the given ones, as method.request.* cache keys"""
+        keys = [f"method.request.path.{name}" for name in re.findall(r"{(\w+)\+?}", path)]
+        for parameter in parameters or []:
+            if not parameter.startswith("method.request."):
+                parameter = f"method.request.{parameter}"
+            if parameter not in keys:
+                keys.append(parameter)
+        return keys
\ No newline at end of file
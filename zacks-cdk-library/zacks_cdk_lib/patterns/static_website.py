@@ -1,16 +1,36 @@
+import fnmatch
+import hashlib
+import json
+import os
+
 from constructs import Construct
 from aws_cdk import (
     aws_s3 as s3,
+    aws_s3_assets as s3_assets,
     aws_s3_deployment as s3deploy,
     aws_cloudfront as cloudfront,
     aws_cloudfront_origins as origins,
     aws_certificatemanager as acm,
     aws_route53 as route53,
     aws_route53_targets as targets,
+    custom_resources as cr,
+    CustomResource,
+    Duration,
     RemovalPolicy,
+    Size,
+    Stage,
 )
+from ..compute import LambdaFunction
+from ..compute.lambda_function import HANDLERS_DIR
 from ..storage import SecureS3Bucket
 
+# Fingerprinted assets never change under the same name
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+IMMUTABLE_TTL = Duration.days(365)
+
+# Key, in the private state bucket, of the manifest of what the website bucket holds
+DEPLOYED_MANIFEST_KEY = "deploy-manifest.json"
+
 
 class StaticWebsite(Construct):
     """
@@ -18,10 +38,16 @@ class StaticWebsite(Construct):
     
     Features:
     - S3 bucket for static content
-    - CloudFront distribution with HTTPS
+    - CloudFront distribution with HTTPS, HTTP/3 and Brotli/gzip compression
+    - Short edge TTLs for HTML, with browsers revalidating every load
+    - Year-long immutable caching for fingerprinted asset paths (optional)
+    - Per-path cache behaviors with matching Cache-Control on upload (optional)
+    - Origin shield in a given region (optional)
     - Custom domain with ACM certificate (optional)
     - Route53 DNS records (optional)
     - Content deployment from local directory
+    - Incremental deploys that upload changed objects and invalidate only their
+      paths, diffed against a synth-time content-hash manifest (optional)
     """
     
     def __init__(
@@ -35,6 +61,11 @@ def __init__(
         hosted_zone_name: str = None,
         index_document: str = "index.html",
         error_document: str = "error.html",
+        html_ttl: Duration = Duration.minutes(5),
+        immutable_asset_patterns: list = None,
+        cache_behaviors: dict = None,
+        origin_shield_region: str = None,
+        incremental_deploy: bool = False,
         **kwargs
     ):
         super().__init__(scope, id)
@@ -80,15 +111,50 @@ def __init__(
                 
                 domain_names = [domain_name]
         
+        # TTL and upload Cache-Control for each path pattern; everything else is treated as HTML
+        self.path_cache_settings = {}
+        for path_pattern in immutable_asset_patterns or []:
+            self.path_cache_settings[path_pattern] = (IMMUTABLE_TTL, IMMUTABLE_CACHE_CONTROL)
+        for path_pattern, settings in (cache_behaviors or {}).items():
+            ttl = settings.get("ttl", Duration.days(1))
+            self.path_cache_settings[path_pattern] = (
+                ttl,
+                settings.get("cache_control", f"public, max-age={int(ttl.to_seconds())}"),
+            )
+        
+        # Shielding is opt-in: it is billed per request on top of regular CloudFront traffic
+        origin = origins.S3Origin(
+            self.bucket.bucket,
+            origin_shield_region=origin_shield_region,
+            origin_shield_enabled=origin_shield_region is not None,
+        )
+        
+        # Edges keep HTML for html_ttl (s-maxage) while browsers revalidate every time
+        self.html_cache_control = (
+            f"public, max-age=0, s-maxage={int(html_ttl.to_seconds())}, must-revalidate"
+        )
+        default_behavior = cloudfront.BehaviorOptions(
+            origin=origin,
+            viewer_protocol_policy=cloudfront.ViewerProtocolPolicy.REDIRECT_TO_HTTPS,
+            cache_policy=self._cache_policy("HtmlCachePolicy", "HTML", html_ttl),
+            compress=True,
+        )
+        additional_behaviors = {}
+        for index, (path_pattern, (ttl, _)) in enumerate(self.path_cache_settings.items()):
+            additional_behaviors[path_pattern] = cloudfront.BehaviorOptions(
+                origin=origin,
+                viewer_protocol_policy=cloudfront.ViewerProtocolPolicy.REDIRECT_TO_HTTPS,
+                cache_policy=self._cache_policy(f"CachePolicy{index}", path_pattern, ttl),
+                compress=True,
+            )
+        
         # Create CloudFront distribution
         self.distribution = cloudfront.Distribution(
             self,
             "Distribution",
-            default_behavior=cloudfront.BehaviorOptions(
-                origin=origins.S3Origin(self.bucket.bucket),
-                viewer_protocol_policy=cloudfront.ViewerProtocolPolicy.REDIRECT_TO_HTTPS,
-                cache_policy=cloudfront.CachePolicy.CACHING_OPTIMIZED,
-            ),
+            default_behavior=default_behavior,
+            additional_behaviors=additional_behaviors or None,
+            http_version=cloudfront.HttpVersion.HTTP2_AND_3,
             default_root_object=index_document,
             error_responses=[
                 cloudfront.ErrorResponse(
@@ -114,17 +180,165 @@ def __init__(
             )
         
         # Deploy website content if path is provided
-        if website_content_path:
-            s3deploy.BucketDeployment(
+        self.content_manifest = None
+        if website_content_path and incremental_deploy:
+            self._add_incremental_deployment(website_content_path, index_document)
+        elif website_content_path:
+            source = s3deploy.Source.asset(website_content_path)
+            
+            # Each path pattern is uploaded with its own Cache-Control; the filters keep
+            # every deployment (and its pruning) to its own objects
+            asset_deployments = []
+            for index, (path_pattern, (_, cache_control)) in enumerate(
+                self.path_cache_settings.items()
+            ):
+                asset_deployments.append(
+                    s3deploy.BucketDeployment(
+                        self,
+                        f"DeployAssets{index}",
+                        sources=[source],
+                        destination_bucket=self.bucket.bucket,
+                        exclude=["*"],
+                        include=[path_pattern.lstrip("/")],
+                        cache_control=[s3deploy.CacheControl.from_string(cache_control)],
+                    )
+                )
+            
+            # HTML goes last so pages never reference assets that are not uploaded yet
+            deployment = s3deploy.BucketDeployment(
                 self,
                 "DeployWebsite",
-                sources=[s3deploy.Source.asset(website_content_path)],
+                sources=[source],
                 destination_bucket=self.bucket.bucket,
+                exclude=[
+                    path_pattern.lstrip("/") for path_pattern in self.path_cache_settings
+                ] or None,
+                cache_control=[s3deploy.CacheControl.from_string(self.html_cache_control)],
                 distribution=self.distribution,
                 distribution_paths=["/*"],
             )
+            for asset_deployment in asset_deployments:
+                deployment.node.add_dependency(asset_deployment)
         
         # Export outputs
         self.bucket_name = self.bucket.bucket.bucket_name
         self.distribution_domain_name = self.distribution.distribution_domain_name
-        self.distribution_id = self.distribution.distribution_id
\ No newline at end of file
+        self.distribution_id = self.distribution.distribution_id
+    
+    def _add_incremental_deployment(self, website_content_path: str, index_document: str):
+        """Deploy through a custom resource that syncs only what the manifest says changed"""
+        # The manifest asset only changes, and so only triggers a deploy, when content
+        # or Cache-Control does; it is written into the cloud assembly, which CDK owns
+        self.content_manifest = content_manifest(website_content_path, self.cache_control_for)
+        asset_outdir = Stage.of(self).asset_outdir
+        os.makedirs(asset_outdir, exist_ok=True)
+        manifest_path = os.path.join(asset_outdir, f"manifest.{self.node.addr}.json")
+        with open(manifest_path, "w") as fp:
+            json.dump(self.content_manifest, fp, indent=1, sort_keys=True)
+        manifest_asset = s3_assets.Asset(self, "ManifestAsset", path=manifest_path)
+        content_asset = s3_assets.Asset(self, "ContentAsset", path=website_content_path)
+        
+        # CloudFront can read every key in the website bucket, so the deployed manifest
+        # is kept in a private bucket of its own
+        self.state_bucket = SecureS3Bucket(
+            self,
+            "DeployStateBucket",
+            versioned=False,
+            removal_policy=RemovalPolicy.DESTROY,
+            auto_delete_objects=True,
+        )
+        
+        self.deploy_function = LambdaFunction(
+            self,
+            "DeployFunction",
+            code_path=os.path.join(HANDLERS_DIR, "incremental_deploy"),
+            memory_size=1024,
+            timeout=Duration.minutes(15),
+            ephemeral_storage_size=Size.gibibytes(2),
+            description=f"Incremental content deploys for {self.node.path}",
+        )
+        manifest_asset.grant_read(self.deploy_function.function)
+        content_asset.grant_read(self.deploy_function.function)
+        self.bucket.grant_read_write(self.deploy_function.function)
+        self.state_bucket.grant_read_write(self.deploy_function.function)
+        self.distribution.grant_create_invalidation(self.deploy_function.function)
+        
+        # Invalidations are submitted by the deploy and polled here, so no function
+        # ever waits on CloudFront
+        self.invalidation_status_function = LambdaFunction(
+            self,
+            "InvalidationStatusFunction",
+            code_path=os.path.join(HANDLERS_DIR, "incremental_deploy"),
+            handler="index.is_complete",
+            description=f"Invalidation status of incremental deploys for {self.node.path}",
+        )
+        self.distribution.grant(
+            self.invalidation_status_function.function, "cloudfront:GetInvalidation"
+        )
+        
+        provider = cr.Provider(
+            self,
+            "DeployProvider",
+            on_event_handler=self.deploy_function.function,
+            is_complete_handler=self.invalidation_status_function.function,
+            query_interval=Duration.seconds(30),
+            total_timeout=Duration.hours(1),
+        )
+        self.deployment = CustomResource(
+            self,
+            "IncrementalDeployment",
+            service_token=provider.service_token,
+            properties={
+                "ContentBucket": content_asset.s3_bucket_name,
+                "ContentKey": content_asset.s3_object_key,
+                "ManifestBucket": manifest_asset.s3_bucket_name,
+                "ManifestKey": manifest_asset.s3_object_key,
+                "DestinationBucket": self.bucket.bucket.bucket_name,
+                "StateBucket": self.state_bucket.bucket.bucket_name,
+                "DeployedManifestKey": DEPLOYED_MANIFEST_KEY,
+                "DistributionId": self.distribution.distribution_id,
+                "IndexDocument": index_document,
+            },
+        )
+    
+    def cache_control_for(self, key: str) -> str:
+        """Cache-Control of the first behavior whose path pattern matches the object key"""
+        for path_pattern, (_, cache_control) in self.path_cache_settings.items():
+            if fnmatch.fnmatchcase("/" + key, "/" + path_pattern.lstrip("/")):
+                return cache_control
+        return self.html_cache_control
+    
+    def _cache_policy(self, id: str, description: str, ttl: Duration) -> cloudfront.CachePolicy:
+        """Cache policy keyed on the path alone, with compressed variants cached separately"""
+        return cloudfront.CachePolicy(
+            self,
+            id,
+            comment=f"{description} on {self.node.path}",
+            default_ttl=ttl,
+            min_ttl=Duration.seconds(0),
+            max_ttl=ttl if ttl.to_seconds() > IMMUTABLE_TTL.to_seconds() else IMMUTABLE_TTL,
+            cookie_behavior=cloudfront.CacheCookieBehavior.none(),
+            header_behavior=cloudfront.CacheHeaderBehavior.none(),
+            query_string_behavior=cloudfront.CacheQueryStringBehavior.none(),
+            enable_accept_encoding_brotli=True,
+            enable_accept_encoding_gzip=True,
+        )
+
+
+def content_manifest(root: str, cache_control_for) -> dict:
+    """Map every file under root to its content hash and Cache-Control"""
+    manifest = {}
+    for directory, dirnames, filenames in os.walk(root):
+        dirnames.sort()
+        for name in sorted(filenames):
+            path = os.path.join(directory, name)
+            key = os.path.relpath(path, root).replace(os.sep, "/")
+            digest = hashlib.sha256()
+            with open(path, "rb") as fp:
+                for chunk in iter(lambda: fp.read(1024 * 1024), b""):
+                    digest.update(chunk)
+            manifest[key] = {
+                "hash": digest.hexdigest(),
+                "cache_control": cache_control_for(key),
+            }
+    return manifest
\ No newline at end of file
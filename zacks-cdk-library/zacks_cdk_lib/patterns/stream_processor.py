@@ -0,0 +1,120 @@
+from constructs import Construct
+from aws_cdk import (
+    aws_cloudwatch as cloudwatch,
+    aws_lambda as _lambda,
+    aws_lambda_event_sources as event_sources,
+    aws_sqs as sqs,
+    Duration,
+)
+from ..compute import LambdaFunction
+from ..database import EnhancedDynamoTable
+
+
+class DynamoStreamProcessor(Construct):
+    """
+    A DynamoDB Streams processing pipeline with a Lambda consumer.
+    
+    Features:
+    - LambdaFunction attached to the stream of an EnhancedDynamoTable
+    - Parallelization factor, batch size and batching window
+    - Bisect-on-error, retry limit and maximum record age
+    - Partial batch responses (ReportBatchItemFailures)
+    - On-failure destination (SQS queue) for records that keep failing
+    - Tumbling-window aggregation (optional)
+    - Event filtering so the consumer only sees relevant changes (optional)
+    - Iterator age alarm
+    """
+    
+    def __init__(
+        self,
+        scope: Construct,
+        id: str,
+        *,
+        table: EnhancedDynamoTable,
+        lambda_code_path: str,
+        lambda_handler: str = "index.handler",
+        lambda_props: dict = None,
+        starting_position: _lambda.StartingPosition = _lambda.StartingPosition.LATEST,
+        batch_size: int = 100,
+        max_batching_window: Duration = Duration.seconds(1),
+        parallelization_factor: int = 10,
+        bisect_batch_on_error: bool = True,
+        retry_attempts: int = 3,
+        max_record_age: Duration = Duration.hours(1),
+        report_batch_item_failures: bool = True,
+        on_failure_queue: sqs.IQueue = None,
+        tumbling_window: Duration = None,
+        event_names: list = None,
+        filters: list = None,
+        iterator_age_alarm_threshold: Duration = Duration.minutes(1),
+        **kwargs
+    ):
+        super().__init__(scope, id)
+        
+        if table.table.table_stream_arn is None:
+            raise ValueError(
+                f"{table.node.path} has no stream; create it with a stream view type"
+            )
+        
+        # Create Lambda function
+        self.function = LambdaFunction(
+            self,
+            "Function",
+            code_path=lambda_code_path,
+            handler=lambda_handler,
+            **(lambda_props or {})
+        )
+        
+        # Records that exhaust their retries are sent here with their batch details
+        self.on_failure_queue = on_failure_queue or sqs.Queue(
+            self,
+            "OnFailureQueue",
+            encryption=sqs.QueueEncryption.SQS_MANAGED,
+            enforce_ssl=True,
+            retention_period=Duration.days(14),
+        )
+        
+        # Only invoke the consumer for the change types and patterns it cares about;
+        # patterns are alternatives, and event_names narrows every one of them
+        filter_patterns = [dict(pattern) for pattern in filters or []]
+        if event_names:
+            if not filter_patterns:
+                filter_patterns.append({})
+            for pattern in filter_patterns:
+                pattern["eventName"] = _lambda.FilterRule.or_(*event_names)
+        
+        # Subscribe the consumer to the table stream
+        self.function.invoke_target.add_event_source(
+            event_sources.DynamoEventSource(
+                table.table,
+                starting_position=starting_position,
+                batch_size=batch_size,
+                max_batching_window=max_batching_window,
+                parallelization_factor=parallelization_factor,
+                bisect_batch_on_error=bisect_batch_on_error,
+                retry_attempts=retry_attempts,
+                max_record_age=max_record_age,
+                on_failure=event_sources.SqsDlq(self.on_failure_queue),
+                tumbling_window=tumbling_window,
+                report_batch_item_failures=report_batch_item_failures,
+                filters=[_lambda.FilterCriteria.filter(pattern) for pattern in filter_patterns]
+                or None,
+                **kwargs
+            )
+        )
+        
+        # Alarm when the consumer falls behind the stream
+        self.iterator_age_alarm = cloudwatch.Alarm(
+            self,
+            "IteratorAgeAlarm",
+            metric=self.function.function.metric(
+                "IteratorAge",
+                statistic="Maximum",
+                period=Duration.minutes(1),
+            ),
+            threshold=iterator_age_alarm_threshold.to_milliseconds(),
+            evaluation_periods=5,
+            comparison_operator=cloudwatch.ComparisonOperator.GREATER_THAN_THRESHOLD,
+            treat_missing_data=cloudwatch.TreatMissingData.NOT_BREACHING,
+            alarm_description=f"Stream consumer of {table.node.path} is falling behind",
+        )
\ No newline at end of file
@@ -1,3 +1,13 @@
-from .security_group import CommonSecurityGroups
+from typing import TYPE_CHECKING
 
-__all__ = ['CommonSecurityGroups']
\ No newline at end of file
+from .._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .security_group import CommonSecurityGroups
+
+__all__ = ['CommonSecurityGroups']
+
+# Constructs are imported on first access, so only the jsii modules in use get loaded
+__getattr__, __dir__ = lazy_exports(__name__, {
+    'CommonSecurityGroups': '.security_group',
+})
\ No newline at end of file
@@ -1,3 +1,13 @@
-from .s3_bucket import SecureS3Bucket
+from typing import TYPE_CHECKING
 
-__all__ = ['SecureS3Bucket']
\ No newline at end of file
+from .._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .s3_bucket import SecureS3Bucket
+
+__all__ = ['SecureS3Bucket']
+
+# Constructs are imported on first access, so only the jsii modules in use get loaded
+__getattr__, __dir__ = lazy_exports(__name__, {
+    'SecureS3Bucket': '.s3_bucket',
+})
\ No newline at end of file
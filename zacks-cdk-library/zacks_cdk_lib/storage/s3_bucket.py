@@ -1,3 +1,6 @@
+import hashlib
+import re
+
 from constructs import Construct
 from aws_cdk import (
     aws_s3 as s3,
@@ -17,6 +20,11 @@ class SecureS3Bucket(Construct):
     - Public access blocked
     - Lifecycle rules for cost optimization
     - Access logging (optional)
+    - S3 Bucket Key for KMS encryption, cutting KMS request volume
+    - Transfer Acceleration (optional)
+    - Abort rule for incomplete multipart uploads (optional)
+    - Intelligent-Tiering archive configurations (optional)
+    - Request metrics filters per prefix (optional)
     """
     
     def __init__(
@@ -32,6 +40,11 @@ def __init__(
         auto_delete_objects: bool = False,
         lifecycle_rules: list = None,
         enable_access_logging: bool = False,
+        bucket_key_enabled: bool = True,
+        transfer_acceleration: bool = False,
+        abort_incomplete_multipart_upload_after: Duration = None,
+        intelligent_tiering_configurations: list = None,
+        request_metrics_prefixes: list = None,
         **kwargs
     ):
         super().__init__(scope, id)
@@ -43,6 +56,9 @@ def __init__(
         else:
             encryption = s3.BucketEncryption.KMS
         
+        # The Bucket Key lets S3 reuse a data key instead of calling KMS for every object
+        bucket_key_enabled = bucket_key_enabled and encryption_key is not None
+        
         # Create the bucket with secure defaults
         self.bucket = s3.Bucket(
             self,
@@ -55,6 +71,12 @@ def __init__(
             enforce_ssl=enforce_ssl,
             removal_policy=removal_policy,
             auto_delete_objects=auto_delete_objects,
+            bucket_key_enabled=bucket_key_enabled or None,
+            transfer_acceleration=transfer_acceleration or None,
+            intelligent_tiering_configurations=[
+                s3.IntelligentTieringConfiguration(**configuration)
+                for configuration in intelligent_tiering_configurations or []
+            ] or None,
             **kwargs
         )
         
@@ -73,6 +95,17 @@ def __init__(
                 ]
             )
         
+        # Clean up parts of multipart uploads that were never completed
+        if abort_incomplete_multipart_upload_after is not None:
+            self.bucket.add_lifecycle_rule(
+                id="AbortIncompleteMultipartUploads",
+                abort_incomplete_multipart_upload_after=abort_incomplete_multipart_upload_after,
+            )
+        
+        # Publish CloudWatch request metrics for each prefix
+        for prefix in request_metrics_prefixes or []:
+            self.bucket.add_metric(id=self.metrics_filter_id(prefix), prefix=prefix or None)
+        
         # Set up access logging if requested
         if enable_access_logging:
             log_bucket = s3.Bucket(
@@ -83,9 +116,62 @@ def __init__(
                 block_public_access=s3.BlockPublicAccess.BLOCK_ALL,
                 enforce_ssl=enforce_ssl,
                 removal_policy=removal_policy,
+                bucket_key_enabled=bucket_key_enabled or None,
             )
             self.bucket.enable_access_logging(log_bucket)
             self.log_bucket = log_bucket
+        
+        # Export outputs
+        self.transfer_acceleration_url = (
+            self.bucket.transfer_acceleration_url_for_object()
+            if transfer_acceleration
+            else None
+        )
+    
+    @staticmethod
+    def metrics_filter_id(prefix: str) -> str:
+        """
+        The request metrics filter ID used for a prefix.
+        
+        A readable slug of the prefix followed by a hash of the whole prefix,
+        so prefixes that slug to the same text still get distinct IDs.
+        """
+        if not prefix:
+            return "EntireBucket"
+        digest = hashlib.sha256(prefix.encode("utf-8")).hexdigest()[:8]
+        slug = re.sub(r"[^A-Za-z0-9_.-]+", "-", prefix).strip("-")
+        return f"{slug[:55]}-{digest}" if slug else digest
+    
+    def add_object_created_notification(self, destination, filters: list = None):
+        """
+        Send object-created events to the given notification destination.
+        
+        Each filter is a dict with an optional "prefix" and "suffix", combined
+        into one S3 key filter; an event is sent when any filter matches, or
+        for every object without filters. S3 rejects configurations for the
+        same event whose prefixes and suffixes could both match one key, so
+        overlapping filters (e.g. "logs/" and "logs/2024/") raise a ValueError.
+        """
+        key_filters = [
+            s3.NotificationKeyFilter(
+                prefix=key_filter.get("prefix") or None,
+                suffix=key_filter.get("suffix") or None,
+            )
+            for key_filter in filters or [{}]
+        ]
+        for index, key_filter in enumerate(key_filters):
+            for other in key_filters[:index]:
+                if _key_filters_overlap(key_filter, other):
+                    raise ValueError(
+                        f"Notification filters {_describe(other)} and {_describe(key_filter)} "
+                        f"overlap; S3 cannot deliver the same event to both"
+                    )
+        for key_filter in key_filters:
+            if key_filter.prefix is None and key_filter.suffix is None:
+                self.bucket.add_object_created_notification(destination)
+            else:
+                self.bucket.add_object_created_notification(destination, key_filter)
+        return self
     
     def grant_read(self, identity):
         """Grant read permissions to the given identity"""
@@ -97,4 +183,18 @@ def grant_write(self, identity):
     
     def grant_read_write(self, identity):
         """Grant read and write permissions to the given identity"""
-        return self.bucket.grant_read_write(identity)
\ No newline at end of file
+        return self.bucket.grant_read_write(identity)
+
+
+def _key_filters_overlap(first: s3.NotificationKeyFilter, second: s3.NotificationKeyFilter) -> bool:
+    """Whether some object key could match both notification key filters"""
+    first_prefix, second_prefix = first.prefix or "", second.prefix or ""
+    first_suffix, second_suffix = first.suffix or "", second.suffix or ""
+    return (
+        (first_prefix.startswith(second_prefix) or second_prefix.startswith(first_prefix))
+        and (first_suffix.endswith(second_suffix) or second_suffix.endswith(first_suffix))
+    )
+
+
+def _describe(key_filter: s3.NotificationKeyFilter) -> str:
+    return f"(prefix={key_filter.prefix!r}, suffix={key_filter.suffix!r})"
\ No newline at end of file